@@ -23,6 +23,11 @@ from app.startup import (
 from app.utils.logger import get_logger, setup_logger
 from app.utils.timeutil import to_utc_iso
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
+
 
 logger = get_logger(__name__)
 
@@ -43,7 +48,30 @@ class SafeJSONProvider(DefaultJSONProvider):
         return _safe_json_dumps(obj, **kwargs)
 
 
+# Dump options orjson can reproduce: jsonify passes compact separators, or indent=2
+# in debug / non-compact mode.
+_ORJSON_SEPARATORS = (None, (",", ":"))
+_ORJSON_INDENTS = {None: 0, 2: 2}
+
+
 def _safe_json_dumps(obj, **kwargs):
+    # orjson already emits NaN/Inf as null; datetimes are passed through to ``default``
+    # so they keep the UTC ISO format. Anything orjson rejects (huge ints, numpy scalars,
+    # other dump options) takes the stdlib path.
+    extra = kwargs.keys() - {"default", "separators", "indent"}
+    if (
+        orjson is not None
+        and not extra
+        and kwargs.get("separators") in _ORJSON_SEPARATORS
+        and kwargs.get("indent") in _ORJSON_INDENTS
+    ):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if _ORJSON_INDENTS[kwargs.get("indent")]:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs.get("default"), option=option).decode("utf-8")
+        except TypeError:
+            pass
     return json.dumps(_sanitize(obj), **kwargs)
 
 
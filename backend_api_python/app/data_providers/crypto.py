@@ -28,9 +28,10 @@ TOP_CRYPTO_SYMBOLS = [
 def fetch_crypto_prices_ccxt() -> List[Dict[str, Any]]:
     """Fetch crypto prices using CCXT (system's existing data source)."""
     try:
-        from app.data_sources.crypto import CryptoDataSource
+        from app.data_sources import DataSourceFactory
 
-        crypto_source = CryptoDataSource()
+        # Reuse the factory's long-lived source so the ccxt client and its loaded markets persist.
+        crypto_source = DataSourceFactory.get_source("Crypto")
 
         symbols = [
             "BTC/USDT", "ETH/USDT", "BNB/USDT", "SOL/USDT", "XRP/USDT",
@@ -90,6 +90,10 @@ _CHART_TF_ALIASES = {
     "1week": "1W",
 }
 
+# Chart timeframes served by Tencent fqkline (daily/weekly) and by AkShare minute bars.
+TENCENT_KLINE_PERIODS = {"1D": "day", "1W": "week"}
+AKSHARE_MINUTE_TIMEFRAMES = frozenset({"1m", "5m", "15m", "30m", "1H", "4H"})
+
 
 def normalize_chart_timeframe(timeframe: str) -> str:
     t = (timeframe or "1D").strip()
@@ -372,6 +376,30 @@ _YF_DAYS_MAP = {
 }
 
 
+def _numeric_columns(df: Any, names: tuple) -> List[List[float]]:
+    """Extract columns as float lists in one pass each; unparseable cells become NaN."""
+    return [pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float).tolist() for name in names]
+
+
+def _ak_bars(times: Any, opens: List[float], closes: List[float], highs: List[float],
+             lows: List[float], volumes: List[float]) -> List[Dict[str, Any]]:
+    """Build sorted bar dicts from AkShare column lists, skipping rows with bad time or prices."""
+    out: List[Dict[str, Any]] = []
+    for t, o, c, h, low, v in zip(times, opens, closes, highs, lows, volumes):
+        if pd.isna(t) or o != o or c != c or h != h or low != low or v != v:
+            continue
+        out.append({
+            "time": int(t.timestamp()),
+            "open": round(o, 4),
+            "high": round(h, 4),
+            "low": round(low, 4),
+            "close": round(c, 4),
+            "volume": round(v, 2),
+        })
+    out.sort(key=lambda x: x["time"])
+    return out
+
+
 def _bars_from_yfinance_df(df: Any) -> List[Dict[str, Any]]:
     """Convert a yfinance DataFrame (with DatetimeIndex or Date/Datetime column) to bar dicts."""
     if df is None or getattr(df, "empty", True):
@@ -384,21 +412,19 @@ def _bars_from_yfinance_df(df: Any) -> List[Dict[str, Any]]:
             break
     if time_col is None:
         return []
+    try:
+        opens, highs, lows, closes, volumes = (
+            df[name].to_numpy(dtype=float).tolist() for name in ("Open", "High", "Low", "Close", "Volume")
+        )
+    except Exception:
+        return []
     out: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
+    for tv, o, h, low, c, v in zip(df[time_col].tolist(), opens, highs, lows, closes, volumes):
         try:
-            tv = row[time_col]
             if hasattr(tv, "timestamp"):
                 ts = int(tv.timestamp())
             else:
                 continue
-            o, h, low, c, v = (
-                float(row["Open"]),
-                float(row["High"]),
-                float(row["Low"]),
-                float(row["Close"]),
-                float(row["Volume"]),
-            )
             if o == 0 and c == 0:
                 continue
             out.append({
@@ -518,24 +544,8 @@ def _bars_from_ak_min_df(df: Any) -> List[Dict[str, Any]]:
     if not all((c_open, c_close, c_high, c_low, c_vol)):
         return []
 
-    out: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
-        try:
-            t = pd.Timestamp(row[time_c])
-            ts = int(t.timestamp())
-            o, c, h, low, v = float(row[c_open]), float(row[c_close]), float(row[c_high]), float(row[c_low]), float(row[c_vol])
-            out.append({
-                "time": ts,
-                "open": round(o, 4),
-                "high": round(h, 4),
-                "low": round(low, 4),
-                "close": round(c, 4),
-                "volume": round(v, 2),
-            })
-        except Exception:
-            continue
-    out.sort(key=lambda x: x["time"])
-    return out
+    times = pd.to_datetime(df[time_c], errors="coerce").tolist()
+    return _ak_bars(times, *_numeric_columns(df, (c_open, c_close, c_high, c_low, c_vol)))
 
 
 def _merge_every_n_sorted_bars(bars: List[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
@@ -669,22 +679,5 @@ def fetch_akshare_weekly_klines(
 
     if df is None or getattr(df, "empty", True) or "日期" not in df.columns:
         return []
-    out: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
-        try:
-            t = pd.Timestamp(row["日期"])
-            ts = int(t.timestamp())
-            o, c, h, low = float(row["开盘"]), float(row["收盘"]), float(row["最高"]), float(row["最低"])
-            v = float(row["成交量"])
-            out.append({
-                "time": ts,
-                "open": round(o, 4),
-                "high": round(h, 4),
-                "low": round(low, 4),
-                "close": round(c, 4),
-                "volume": round(v, 2),
-            })
-        except Exception:
-            continue
-    out.sort(key=lambda x: x["time"])
-    return out
+    times = pd.to_datetime(df["日期"], errors="coerce").tolist()
+    return _ak_bars(times, *_numeric_columns(df, ("开盘", "收盘", "最高", "最低", "成交量")))
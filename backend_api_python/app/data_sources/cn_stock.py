@@ -17,6 +17,8 @@ from app.data_sources.base import BaseDataSource
 from app.data_sources.tencent import normalize_cn_code, fetch_quote, parse_quote_to_ticker, fetch_kline, tencent_kline_rows_to_dicts
 from app.data_sources.asia_stock_kline import (
     normalize_chart_timeframe,
+    TENCENT_KLINE_PERIODS,
+    AKSHARE_MINUTE_TIMEFRAMES,
     fetch_twelvedata_klines,
     fetch_yfinance_klines,
     fetch_akshare_minute_klines,
@@ -76,9 +78,8 @@ class CNStockDataSource(BaseDataSource):
             )
 
         # Tier 2: Tencent for daily/weekly (fast, free)
-        if tf in ("1D", "1W"):
-            tf_map = {"1D": "day", "1W": "week"}
-            period = tf_map.get(tf, "day")
+        period = TENCENT_KLINE_PERIODS.get(tf)
+        if period:
             raw_rows = fetch_kline(code, period=period, count=lim, adj="qfq")
             out = tencent_kline_rows_to_dicts(raw_rows)
             if out:
@@ -104,7 +105,7 @@ class CNStockDataSource(BaseDataSource):
             )
 
         # Tier 4: AkShare (fragile overseas, last resort)
-        if tf in ("1m", "5m", "15m", "30m", "1H", "4H"):
+        if tf in AKSHARE_MINUTE_TIMEFRAMES:
             rows = fetch_akshare_minute_klines(
                 is_hk=False, tencent_code=code, timeframe=tf, limit=lim, before_time=before_time
             )
@@ -652,16 +652,22 @@ class ForexDataSource(BaseDataSource):
             if df is None or df.empty:
                 return []
 
-            klines = []
-            for idx, row in df.iterrows():
-                klines.append({
-                    'time': int(idx.timestamp()),
-                    'open': float(row['Open']),
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'volume': float(row.get('Volume', 0) or 0),
-                })
+            # One cast per column; FX pairs often carry no (or NaN) volume.
+            volumes = (
+                df['Volume'].fillna(0).to_numpy(dtype=float).tolist()
+                if 'Volume' in df.columns else [0.0] * len(df)
+            )
+            klines = [
+                {'time': int(idx.timestamp()), 'open': o, 'high': h, 'low': low, 'close': c, 'volume': v}
+                for idx, o, h, low, c, v in zip(
+                    df.index,
+                    df['Open'].to_numpy(dtype=float).tolist(),
+                    df['High'].to_numpy(dtype=float).tolist(),
+                    df['Low'].to_numpy(dtype=float).tolist(),
+                    df['Close'].to_numpy(dtype=float).tolist(),
+                    volumes,
+                )
+            ]
             klines.sort(key=lambda x: x['time'])
             if len(klines) > limit:
                 klines = klines[-limit:]
@@ -358,16 +358,18 @@ class FuturesDataSource(BaseDataSource):
                 logger.warning("No yfinance data: %s", yf_symbol)
                 return []
 
-            klines = []
-            for index, row in df.iterrows():
-                klines.append({
-                    'time': int(index.timestamp()),
-                    'open': float(row['Open']),
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'volume': float(row['Volume']),
-                })
+            # One cast per column; missing volume becomes 0 instead of NaN.
+            klines = [
+                {'time': int(index.timestamp()), 'open': o, 'high': h, 'low': low, 'close': c, 'volume': v}
+                for index, o, h, low, c, v in zip(
+                    df.index,
+                    df['Open'].to_numpy(dtype=float).tolist(),
+                    df['High'].to_numpy(dtype=float).tolist(),
+                    df['Low'].to_numpy(dtype=float).tolist(),
+                    df['Close'].to_numpy(dtype=float).tolist(),
+                    df['Volume'].fillna(0).to_numpy(dtype=float).tolist(),
+                )
+            ]
 
             klines.sort(key=lambda x: x['time'])
             if len(klines) > limit:
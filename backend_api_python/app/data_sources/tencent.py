@@ -10,10 +10,13 @@ This is used as a stable alternative when Yahoo/yfinance gets rate-limited.
 
 from __future__ import annotations
 
+import re
+import threading
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.data_sources.rate_limiter import get_request_headers, retry_with_backoff, get_tencent_limiter
 from app.utils.logger import get_logger
@@ -21,6 +24,33 @@ from app.utils.resource_guard import assert_fd_available
 
 logger = get_logger(__name__)
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# v_sh600519="1~NAME~CODE~LAST~PREV~OPEN~...";  (one line per code; codes such as
+# usBRK.B or us.DJI carry punctuation, so the key runs up to the '=')
+_QUOTE_LINE_RE = re.compile(r'v_([^=]+)="([^"]*)"')
+
+
+def _get_session() -> requests.Session:
+    """
+    Shared keep-alive session for qt.gtimg.cn / web.ifzq.gtimg.cn.
+
+    Watchlist refreshes hit Tencent many times per minute; reusing pooled
+    connections avoids a fresh TCP+TLS handshake on every quote. Retries stay
+    with ``retry_with_backoff`` so the adapter itself does not retry.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
 
 def normalize_cn_code(symbol: str) -> str:
     """
@@ -84,7 +114,7 @@ def fetch_quote(code: str, timeout: int = 8) -> Optional[List[str]]:
     limiter = get_tencent_limiter()
     limiter.wait()
     url = f"https://qt.gtimg.cn/q={c}"
-    with requests.get(url, headers=get_request_headers(referer="https://qt.gtimg.cn/"), timeout=timeout) as resp:
+    with _get_session().get(url, headers=get_request_headers(referer="https://qt.gtimg.cn/"), timeout=timeout) as resp:
         resp.raise_for_status()
         # Tencent quote is often GBK encoded
         try:
@@ -95,14 +125,50 @@ def fetch_quote(code: str, timeout: int = 8) -> Optional[List[str]]:
     if not text or "~" not in text:
         return None
 
-    # Format: v_sh600519="1~NAME~CODE~LAST~PREV~OPEN~..."
-    try:
-        start = text.index('="') + 2
-        end = text.rindex('"')
-        payload = text[start:end]
-    except Exception:
-        return None
+    m = _QUOTE_LINE_RE.search(text)
+    return _split_quote_payload(m.group(2)) if m else None
+
+
+_QUOTE_BATCH_SIZE = 60
+
+
+# No retry: a failed batch already falls back to the per-symbol quotes, which retry.
+def _fetch_quote_batch(codes: List[str], timeout: int) -> Dict[str, List[str]]:
+    assert_fd_available("Tencent quote")
+
+    limiter = get_tencent_limiter()
+    limiter.wait()
+    url = f"https://qt.gtimg.cn/q={','.join(codes)}"
+    with _get_session().get(url, headers=get_request_headers(referer="https://qt.gtimg.cn/"), timeout=timeout) as resp:
+        resp.raise_for_status()
+        try:
+            resp.encoding = "gbk"
+        except Exception:
+            pass
+        text = resp.text or ""
+
+    out: Dict[str, List[str]] = {}
+    for m in _QUOTE_LINE_RE.finditer(text):
+        parts = _split_quote_payload(m.group(2))
+        if parts:
+            out[m.group(1).lower()] = parts
+    return out
+
+
+def fetch_quotes(codes: List[str], timeout: int = 8) -> Dict[str, List[str]]:
+    """
+    Batch variant of ``fetch_quote``: one qt.gtimg.cn request per 60 codes.
+
+    Returns {lowercase code: raw '~' split array}; codes Tencent does not know are omitted.
+    """
+    wanted = [c for c in dict.fromkeys(_lower_code(code) for code in codes or []) if c]
+    out: Dict[str, List[str]] = {}
+    for i in range(0, len(wanted), _QUOTE_BATCH_SIZE):
+        out.update(_fetch_quote_batch(wanted[i:i + _QUOTE_BATCH_SIZE], timeout))
+    return out
+
 
+def _split_quote_payload(payload: str) -> Optional[List[str]]:
     parts = payload.split("~")
     return parts if len(parts) > 5 else None
 
@@ -212,7 +278,7 @@ def fetch_kline(code: str, period: str, count: int = 300, adj: str = "qfq", time
 
     url = "https://web.ifzq.gtimg.cn/appstock/app/fqkline/get"
     params = {"param": f"{c},{period},,,{int(count)},{adj}"}
-    with requests.get(url, headers=get_request_headers(referer="https://gu.qq.com/"), params=params, timeout=timeout) as resp:
+    with _get_session().get(url, headers=get_request_headers(referer="https://gu.qq.com/"), params=params, timeout=timeout) as resp:
         resp.raise_for_status()
         data = resp.json() if resp.text else {}
     if not isinstance(data, dict) or int(data.get("code", 0)) != 0:
@@ -621,9 +621,22 @@ class USStockDataSource(BaseDataSource):
             logger.warning(f"Unable to determine time column; available columns: {df.columns.tolist()}")
             return klines
         
-        for _, row in df.iterrows():
+        # Pull whole columns once instead of materializing a Series per row via iterrows().
+        try:
+            columns = zip(
+                df[time_col].tolist(),
+                df['Open'].to_numpy(dtype=float).tolist(),
+                df['High'].to_numpy(dtype=float).tolist(),
+                df['Low'].to_numpy(dtype=float).tolist(),
+                df['Close'].to_numpy(dtype=float).tolist(),
+                df['Volume'].to_numpy(dtype=float).tolist(),
+            )
+        except Exception as e:
+            logger.debug(f"Failed to extract OHLCV columns: {e}")
+            return klines
+
+        for time_value, o, h, low, c, v in columns:
             try:
-                time_value = row[time_col]
                 if hasattr(time_value, 'timestamp'):
                     ts = int(time_value.timestamp())
                 else:
@@ -631,11 +644,11 @@ class USStockDataSource(BaseDataSource):
                 
                 klines.append(self.format_kline(
                     timestamp=ts,
-                    open_price=row['Open'],
-                    high=row['High'],
-                    low=row['Low'],
-                    close=row['Close'],
-                    volume=row['Volume']
+                    open_price=o,
+                    high=h,
+                    low=low,
+                    close=c,
+                    volume=v
                 ))
             except Exception as e:
                 logger.debug(f"Failed to parse row data: {e}")
@@ -1,25 +1,33 @@
 """
 业务服务层
+
+子模块按需导入：``import app.services.live_trading`` 之类的路径不再连带加载
+backtest / pandas 等重量级依赖。``from app.services import KlineService`` 仍然可用。
 """
-from app.services.kline import KlineService
-from app.services.backtest import BacktestService
-from app.services.strategy_compiler import StrategyCompiler
-from app.services.fast_analysis import FastAnalysisService
-from app.services.experiment import (
-    ExperimentRunnerService,
-    MarketRegimeService,
-    StrategyEvolutionService,
-    StrategyScoringService,
-)
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    'KlineService': 'app.services.kline',
+    'BacktestService': 'app.services.backtest',
+    'StrategyCompiler': 'app.services.strategy_compiler',
+    'FastAnalysisService': 'app.services.fast_analysis',
+    'ExperimentRunnerService': 'app.services.experiment',
+    'MarketRegimeService': 'app.services.experiment',
+    'StrategyEvolutionService': 'app.services.experiment',
+    'StrategyScoringService': 'app.services.experiment',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'KlineService',
-    'BacktestService',
-    'StrategyCompiler',
-    'FastAnalysisService',
-    'ExperimentRunnerService',
-    'MarketRegimeService',
-    'StrategyEvolutionService',
-    'StrategyScoringService',
-]
 
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -169,6 +169,9 @@ class AlpacaClient:
     broker abstraction (mirrors IBKRClient surface).
     """
 
+    # Routing tag read by PendingOrderWorker instead of isinstance against a lazily imported class.
+    family = "alpaca"
+
     def __init__(self, config: Optional[AlpacaConfig] = None):
         self.config = config or AlpacaConfig()
         self._trading_client = None
@@ -18,7 +18,7 @@ Adding a new broker now means updating BROKER_MARKETS here, plus the
 broker's client implementation. Everything else picks it up automatically.
 """
 
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
 from app.services.live_trading.capabilities import CRYPTO_VENUE_CAPABILITIES
 
@@ -134,6 +134,13 @@ def list_supported_brokers_for_market(market_category: str) -> Set[str]:
 # The one validator everyone calls
 # ---------------------------------------------------------------------------
 
+# Normalized (exchange, market, market_type, direction, bot_type) tuples that
+# already passed every rule. The live worker validates each order against the
+# same handful of combinations, so repeat successes are a single set probe.
+# Failures are never cached (they raise with a context-specific message).
+_VALIDATED_COMBOS: Set[Tuple[str, str, str, str, str, bool]] = set()
+_VALIDATED_COMBOS_MAX = 4096
+
 def validate_strategy_config(
     *,
     exchange_id: Optional[str],
@@ -172,7 +179,16 @@ def validate_strategy_config(
     mt = _norm_market_type(market_type)
     td = (trade_direction or "").strip().lower()
     bt = (bot_type or "").strip().lower()
+    combo = (ex, mc, mt, td, bt, bool(require_exchange))
+    if combo in _VALIDATED_COMBOS:
+        return
+    _check_strategy_config(ex, mc, mt, td, bt, require_exchange)
+    if len(_VALIDATED_COMBOS) >= _VALIDATED_COMBOS_MAX:
+        _VALIDATED_COMBOS.clear()
+    _VALIDATED_COMBOS.add(combo)
+
 
+def _check_strategy_config(ex: str, mc: str, mt: str, td: str, bt: str, require_exchange: bool) -> None:
     # Rule 2 + 3: broker x market combination
     if not ex:
         if mc and mc not in LIVE_MARKET_CATEGORIES:
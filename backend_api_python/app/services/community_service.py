@@ -1301,6 +1301,8 @@ class CommunityService:
                     )
                     db.commit()
                     cur.close()
+                    from app.startup import invalidate_strategy_config_cache
+                    invalidate_strategy_config_cache(local_strategy['id'])
                     return True, 'success', {
                         'strategy_id': local_strategy['id'],
                         'updated': True,
@@ -92,6 +92,9 @@ class IBKRClient:
             
             client.disconnect()
     """
+
+    # Routing tag read by PendingOrderWorker instead of isinstance against a lazily imported class.
+    family = "ibkr"
     
     def __init__(self, config: Optional[IBKRConfig] = None):
         self.config = config or IBKRConfig()
@@ -203,6 +206,26 @@ class IBKRClient:
             logger.warning(f"Contract qualification failed: {e}")
             return False
     
+    def _await_order_status(self, trade, timeout: float, until_done: bool = True) -> None:
+        """
+        Wait for the broker to report on a just-placed order, returning as soon as it does.
+        
+        ``placeOrder`` is non-blocking; status arrives through ib_insync's event loop. Rather than
+        sleeping a fixed interval, pump the loop with ``waitOnUpdate`` and stop once the order is
+        done (``until_done``) or merely acknowledged, with ``timeout`` as the old upper bound.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if until_done:
+                if trade.isDone():
+                    return
+            elif trade.orderStatus.status not in ("PendingSubmit", "ApiPending"):
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._ib.waitOnUpdate(timeout=remaining)
+    
     # ==================== Order Methods ====================
     
     def place_market_order(
@@ -243,8 +266,8 @@ class IBKRClient:
             
             trade = self._ib.placeOrder(contract, order)
             
-            # Wait for order status update
-            self._ib.sleep(2)
+            # Wait for the fill (or a terminal reject), at most 2s
+            self._await_order_status(trade, 2.0)
             
             status = trade.orderStatus.status
             rejected = status in ("Cancelled", "ApiCancelled", "Inactive")
@@ -311,7 +334,7 @@ class IBKRClient:
             )
             
             trade = self._ib.placeOrder(contract, order)
-            self._ib.sleep(1)
+            self._await_order_status(trade, 1.0, until_done=False)
             
             status = trade.orderStatus.status
             rejected = status in ("Cancelled", "ApiCancelled", "Inactive")
@@ -45,52 +45,58 @@ def sync_account_positions(
     ex = str(exchange_id or "").strip().lower()
 
     active_keys: List[tuple] = []
+    upserts: List[tuple] = []
+    for leg in legs or []:
+        sym = normalize_strategy_symbol(leg.symbol) or str(leg.symbol or "").strip()
+        side = str(leg.side or "").strip().lower()
+        try:
+            sz = float(leg.size or 0.0)
+        except Exception:
+            sz = 0.0
+        if not sym or side not in ("long", "short") or sz <= 1e-12:
+            continue
+        iid = str(leg.inst_id or "").strip()
+        if not iid:
+            from app.services.live_trading.leg_context import inst_id_for_symbol
+
+            iid = inst_id_for_symbol(sym, mt, ex)
+        key = (cred, mt, iid, side)
+        active_keys.append(key)
+        upserts.append(
+            (
+                uid,
+                cred,
+                ex,
+                mt,
+                iid,
+                sym,
+                side,
+                sz,
+                float(leg.entry_price or 0.0),
+                float(leg.mark_price or 0.0),
+            )
+        )
+
     with get_db_connection() as db:
         cur = db.cursor()
-        for leg in legs or []:
-            sym = normalize_strategy_symbol(leg.symbol) or str(leg.symbol or "").strip()
-            side = str(leg.side or "").strip().lower()
-            try:
-                sz = float(leg.size or 0.0)
-            except Exception:
-                sz = 0.0
-            if not sym or side not in ("long", "short") or sz <= 1e-12:
-                continue
-            iid = str(leg.inst_id or "").strip()
-            if not iid:
-                from app.services.live_trading.leg_context import inst_id_for_symbol
-
-                iid = inst_id_for_symbol(sym, mt, ex)
-            key = (cred, mt, iid, side)
-            active_keys.append(key)
-            cur.execute(
-                """
-                INSERT INTO qd_account_positions
-                (user_id, credential_id, exchange_id, market_type, inst_id, symbol, side,
-                 size, entry_price, mark_price, synced_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-                ON CONFLICT (credential_id, market_type, inst_id, side) DO UPDATE SET
-                    user_id = excluded.user_id,
-                    exchange_id = excluded.exchange_id,
-                    symbol = excluded.symbol,
-                    size = excluded.size,
-                    entry_price = excluded.entry_price,
-                    mark_price = excluded.mark_price,
-                    synced_at = NOW()
-                """,
-                (
-                    uid,
-                    cred,
-                    ex,
-                    mt,
-                    iid,
-                    sym,
-                    side,
-                    sz,
-                    float(leg.entry_price or 0.0),
-                    float(leg.mark_price or 0.0),
-                ),
-            )
+        # One batched upsert instead of a round-trip per leg.
+        cur.executemany(
+            """
+            INSERT INTO qd_account_positions
+            (user_id, credential_id, exchange_id, market_type, inst_id, symbol, side,
+             size, entry_price, mark_price, synced_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (credential_id, market_type, inst_id, side) DO UPDATE SET
+                user_id = excluded.user_id,
+                exchange_id = excluded.exchange_id,
+                symbol = excluded.symbol,
+                size = excluded.size,
+                entry_price = excluded.entry_price,
+                mark_price = excluded.mark_price,
+                synced_at = NOW()
+            """,
+            upserts,
+        )
 
         # Drop legs that are flat on exchange for this credential/market bucket.
         if active_keys:
@@ -8,14 +8,18 @@ Notes:
 
 from __future__ import annotations
 
+import http.cookiejar
 import json
 import logging
 import os
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.utils.resource_guard import (
     ResourceExhaustedError,
@@ -86,6 +90,73 @@ def _get_requests_verify() -> Union[bool, str]:
     return _requests_verify_value
 
 
+# One keep-alive pool shared by every client instance: create_client() runs per strategy per
+# sync pass, and a fresh TCP + TLS handshake per REST call dominated exchange latency.
+# Bounded (pool_maxsize per host), so it cannot grow the FD count the way leaked sockets did.
+_HTTP_POOL_CONNECTIONS = 16
+_HTTP_POOL_MAXSIZE = 32
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+# In-flight requests per exchange host, capped at the pool size: order dispatch and position
+# sync run on thread pools, and calls beyond pool_maxsize would each open (and then discard)
+# a fresh TLS connection instead of waiting briefly for a pooled one.
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+@contextmanager
+def _host_slot(url: str, timeout: float) -> Iterator[None]:
+    """Hold one in-flight slot for ``url``'s host; waits at most ``timeout`` seconds for it."""
+    host = url.split("/", 3)[2] if "://" in url else url
+    slot = _host_slots.get(host)
+    if slot is None:
+        with _host_slots_lock:
+            slot = _host_slots.get(host)
+            if slot is None:
+                slot = _host_slots[host] = threading.BoundedSemaphore(_HTTP_POOL_MAXSIZE)
+    if not slot.acquire(timeout=timeout):
+        raise LiveTradingError(f"Exchange REST busy: no free connection to {host} within {timeout:g}s")
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+def _http_keepalive_enabled() -> bool:
+    return (os.environ.get("LIVE_TRADING_HTTP_KEEPALIVE") or "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _get_http_session() -> requests.Session:
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                # Shared across accounts and exchanges: never carry cookies between calls.
+                session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=_HTTP_POOL_CONNECTIONS, pool_maxsize=_HTTP_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
+def fill_poll_delay(poll_interval_sec: float, end_ts: float, max_wait_sec: float) -> float:
+    """Sleep between wait_for_fill polls: the base interval early on, stretching to 3x as the wait ages.
+
+    Market orders and quick maker fills are caught at the base cadence; a resting maker order
+    that sits for the whole wait costs roughly half the REST polls of a fixed interval.
+    """
+    base = float(poll_interval_sec or 0.5)
+    now = time.time()
+    elapsed = now - (end_ts - float(max_wait_sec or 0.0))
+    delay = min(base * (1.0 + elapsed / 4.0), base * 3.0)
+    # Never sleep past the deadline by more than one base interval: keep the final status check on time.
+    return max(base, min(delay, end_ts - now))
+
+
 @dataclass
 class LiveOrderResult:
     exchange_id: str
@@ -109,6 +180,9 @@ def is_file_descriptor_exhausted(exc: BaseException | str) -> bool:
 
 
 class BaseRestClient:
+    # Client family used for order routing; broker SDK clients set "ibkr" / "alpaca".
+    family = "crypto_rest"
+
     def __init__(self, base_url: str, timeout_sec: float = 15.0):
         self.base_url = (base_url or "").rstrip("/")
         self.timeout_sec = float(timeout_sec)
@@ -133,8 +207,12 @@ class BaseRestClient:
         try:
             assert_fd_available("exchange REST")
             request_headers = dict(headers or {})
-            request_headers.setdefault("Connection", "close")
-            with requests.request(
+            if _http_keepalive_enabled():
+                send = _get_http_session().request
+            else:
+                request_headers.setdefault("Connection", "close")
+                send = requests.request
+            with _host_slot(url, self.timeout_sec), send(
                     method=str(method or "GET").upper(),
                     url=url,
                     params=params or None,
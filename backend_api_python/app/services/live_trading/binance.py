@@ -12,10 +12,10 @@ import hmac
 import logging
 import time
 from decimal import Decimal, ROUND_DOWN
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 
 logger = logging.getLogger(__name__)
 from app.services.live_trading.symbols import to_binance_futures_symbol
@@ -599,6 +599,7 @@ class BinanceFuturesClient(BaseRestClient):
         client_order_id: str = "",
         max_wait_sec: float = 3.0,
         poll_interval_sec: float = 0.5,
+        fetch_fee: bool = True,
     ) -> Dict[str, Any]:
         """
         Poll order detail to obtain (best-effort) executed quantity, average price,
@@ -613,6 +614,8 @@ class BinanceFuturesClient(BaseRestClient):
           "status": str,
           "order": {...}
         }
+
+        fetch_fee=False skips the commission lookup; callers batch it with get_fees_for_orders().
         """
         end_ts = time.time() + float(max_wait_sec or 0.0)
         last: Dict[str, Any] = {}
@@ -649,29 +652,41 @@ class BinanceFuturesClient(BaseRestClient):
                     avg_price = 0.0
 
             if filled > 0 and avg_price > 0:
-                fee, fee_ccy = self._fetch_commission_for_order(symbol=symbol, order_id=order_id, filled=filled, avg_price=avg_price)
+                fee, fee_ccy = 0.0, ""
+                if fetch_fee:
+                    fee, fee_ccy = self._fetch_commission_for_order(symbol=symbol, order_id=order_id, filled=filled, avg_price=avg_price)
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
 
             if status in ("FILLED", "CANCELED", "EXPIRED", "REJECTED"):
                 fee, fee_ccy = 0.0, ""
-                if filled > 0:
+                if filled > 0 and fetch_fee:
                     fee, fee_ccy = self._fetch_commission_for_order(symbol=symbol, order_id=order_id, filled=filled, avg_price=avg_price)
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
 
             if time.time() >= end_ts:
                 fee, fee_ccy = 0.0, ""
-                if filled > 0:
+                if filled > 0 and fetch_fee:
                     fee, fee_ccy = self._fetch_commission_for_order(symbol=symbol, order_id=order_id, filled=filled, avg_price=avg_price)
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
+
+    def get_fees_for_orders(self, *, symbol: str, order_ids: List[str], filled: float = 0.0, avg_price: float = 0.0) -> Tuple[float, str]:
+        """Summed commission for several orders of one symbol (e.g. limit + market tail) from one userTrades query."""
+        return self._fetch_commission_for_orders(symbol=symbol, order_ids=order_ids, filled=filled, avg_price=avg_price)
 
     def _fetch_commission_for_order(self, *, symbol: str, order_id: str, filled: float, avg_price: float) -> Tuple[float, str]:
+        return self._fetch_commission_for_orders(symbol=symbol, order_ids=[order_id], filled=filled, avg_price=avg_price)
+
+    def _fetch_commission_for_orders(self, *, symbol: str, order_ids: List[str], filled: float, avg_price: float) -> Tuple[float, str]:
         """Fetch real commission from userTrades; fall back to commissionRate calculation."""
-        oid = str(order_id or "").strip()
+        oids = {str(o or "").strip() for o in order_ids} - {""}
+        oid = ",".join(sorted(oids))
+        # One order: filter server-side by orderId. Several: one query of recent fills, filtered here.
+        query_oid = next(iter(oids)) if len(oids) == 1 else ""
         # Method 1: userTrades (up to 3 attempts with 1s delay)
         for attempt in range(3):
             try:
-                trades = self.get_user_trades(symbol=symbol, order_id=oid, limit=200) if oid else []
+                trades = self.get_user_trades(symbol=symbol, order_id=query_oid, limit=200 if query_oid else 1000) if oids else []
                 if not isinstance(trades, list):
                     trades = []
                 total_fee = 0.0
@@ -679,6 +694,8 @@ class BinanceFuturesClient(BaseRestClient):
                 for t in trades:
                     if not isinstance(t, dict):
                         continue
+                    if not query_oid and str(t.get("orderId") or "") not in oids:
+                        continue
                     try:
                         c = float(t.get("commission") or 0.0)
                     except (ValueError, TypeError):
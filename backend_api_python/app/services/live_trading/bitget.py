@@ -17,7 +17,7 @@ from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 
 logger = logging.getLogger(__name__)
 from app.services.live_trading.symbols import to_bitget_um_symbol
@@ -1037,7 +1037,7 @@ class BitgetMixClient(BaseRestClient):
                             continue
                 if total_base > 0 and total_quote > 0:
                     if total_fee <= 0 and not timed_out:
-                        time.sleep(float(poll_interval_sec or 0.5))
+                        time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                         continue
                     logger.debug(
                         "Bitget Mix fill result: filled=%s avg=%.8f fee=%.8f %s (order=%s)",
@@ -1074,7 +1074,7 @@ class BitgetMixClient(BaseRestClient):
 
                     if filled > 0 and avg > 0:
                         if not timed_out and abs_fee == 0:
-                            time.sleep(float(poll_interval_sec or 0.5))
+                            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                             continue
                         logger.debug(
                             "Bitget Mix detail result: filled=%.8f avg=%.8f fee=%.8f %s (order=%s, via=detail)",
@@ -1091,7 +1091,7 @@ class BitgetMixClient(BaseRestClient):
                         }
                     if state in ("filled", "canceled", "cancelled"):
                         if not timed_out and filled > 0 and abs_fee == 0:
-                            time.sleep(float(poll_interval_sec or 0.5))
+                            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                             continue
                         logger.debug(
                             "Bitget Mix detail result (terminal): filled=%.8f avg=%.8f fee=%.8f %s (order=%s, state=%s)",
@@ -1126,6 +1126,6 @@ class BitgetMixClient(BaseRestClient):
                         "fills": last_fills,
                     }
                 return {"filled": 0.0, "avg_price": 0.0, "fee": 0.0, "fee_ccy": "", "state": state, "detail": last_detail, "fills": last_fills}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
 
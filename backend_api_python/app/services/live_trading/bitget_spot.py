@@ -20,7 +20,7 @@ from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 from app.services.live_trading.symbols import to_bitget_um_symbol
 
 logger = logging.getLogger(__name__)
@@ -599,7 +599,7 @@ class BitgetSpotClient(BaseRestClient):
                             continue
                 if total_base > 0 and total_quote > 0:
                     if total_fee <= 0 and not timed_out:
-                        time.sleep(float(poll_interval_sec or 0.5))
+                        time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                         continue
                     logger.debug(
                         "Bitget Spot fill result: filled=%.8f avg=%.8f fee=%.8f %s (order=%s)",
@@ -664,7 +664,7 @@ class BitgetSpotClient(BaseRestClient):
                     "order": last_order,
                     "fills": last_fills,
                 }
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
     def get_assets(self) -> Dict[str, Any]:
         """
@@ -18,7 +18,7 @@ from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlencode
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 
 logger = logging.getLogger(__name__)
 from app.services.live_trading.symbols import to_bybit_symbol
@@ -790,17 +790,17 @@ class BybitClient(BaseRestClient):
             # cumExecFee / cumFeeDetail can lag slightly after fill shows up.
             if filled > 0 and avg_price > 0:
                 if fee <= 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if status.lower() in ("filled", "cancelled", "canceled", "rejected"):
                 if fee <= 0 and filled > 0 and avg_price > 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if timed_out:
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
     def get_positions(
         self,
@@ -16,7 +16,7 @@ import hmac
 import time
 from typing import Any, Dict, Optional
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 from app.services.live_trading.symbols import to_coinbase_product_id
 
 
@@ -193,16 +193,16 @@ class CoinbaseExchangeClient(BaseRestClient):
                 fee_ccy = "USD"
             if filled > 0 and avg_price > 0:
                 if fee <= 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if status.lower() in ("done", "rejected", "canceled", "cancelled"):
                 if fee <= 0 and filled > 0 and avg_price > 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if timed_out:
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
 
@@ -8,9 +8,13 @@ Supports:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -124,10 +128,55 @@ def _demo_enabled(cfg: Dict[str, Any]) -> bool:
     return exchange_demo_mode_enabled(cfg)
 
 
+# Crypto REST clients reused per (exchange, market, config) so per-instance state — clock offset,
+# symbol filters, leverage / position-mode caches — survives across orders instead of being
+# re-fetched by a fresh instance every time. HTTP keep-alive itself is shared in base.py.
+# IBKR / Alpaca own live broker sessions and are never pooled here.
+_POOLED_EXCHANGES = frozenset({"binance", "okx", "bitget", "bybit", "coinbaseexchange", "coinbase_exchange", "kraken", "gate", "htx"})
+_CLIENT_POOL_TTL_SEC = 600.0
+_CLIENT_POOL_MAX = 256
+_client_pool: Dict[Tuple[str, str, str], Tuple[float, BaseRestClient]] = {}
+_client_pool_lock = threading.Lock()
+
+
+def _client_pool_enabled() -> bool:
+    return (os.environ.get("LIVE_TRADING_CLIENT_POOL") or "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _client_pool_key(exchange_id: str, market_type: str, exchange_config: Dict[str, Any]) -> Tuple[str, str, str]:
+    # Hash the whole config: credentials, base URLs, broker ids and hedge flags all shape the client.
+    raw = json.dumps(exchange_config, sort_keys=True, default=str)
+    return exchange_id, market_type, hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def clear_client_pool() -> None:
+    with _client_pool_lock:
+        _client_pool.clear()
+
+
 def create_client(exchange_config: Dict[str, Any], *, market_type: str = "swap") -> BaseRestClient:
     if not isinstance(exchange_config, dict):
         raise LiveTradingError("Invalid exchange_config")
     exchange_id = _get(exchange_config, "exchange_id", "exchangeId").lower()
+    if exchange_id not in _POOLED_EXCHANGES or not _client_pool_enabled():
+        return _build_client(exchange_config, market_type=market_type)
+
+    key = _client_pool_key(exchange_id, str(market_type or ""), exchange_config)
+    now = time.monotonic()
+    with _client_pool_lock:
+        hit = _client_pool.get(key)
+    if hit is not None and now - hit[0] < _CLIENT_POOL_TTL_SEC:
+        return hit[1]
+    client = _build_client(exchange_config, market_type=market_type)
+    with _client_pool_lock:
+        if len(_client_pool) >= _CLIENT_POOL_MAX:
+            _client_pool.clear()
+        _client_pool[key] = (now, client)
+    return client
+
+
+def _build_client(exchange_config: Dict[str, Any], *, market_type: str = "swap") -> BaseRestClient:
+    exchange_id = _get(exchange_config, "exchange_id", "exchangeId").lower()
     api_key = _get(exchange_config, "api_key", "apiKey")
     secret_key = _get(exchange_config, "secret_key", "secret")
     passphrase = _get(exchange_config, "passphrase", "password")
@@ -21,11 +21,14 @@ from decimal import Decimal, ROUND_DOWN, ROUND_UP
 from typing import Any, Dict, Optional, Tuple, Union
 from urllib.parse import urlencode
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 from app.services.live_trading.symbols import to_gate_currency_pair
 
 logger = logging.getLogger(__name__)
 
+# Process-wide futures contract metadata cache: "{base_url}|{contract}" -> (fetched_at, contract)
+_CONTRACT_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 def _gate_ticker_response_to_normalized(raw: Any) -> Dict[str, Any]:
     """Parse Gate spot/futures tickers API (array of one row) into a dict with float ``last`` for quick_trade."""
@@ -299,25 +302,29 @@ class GateSpotClient(_GateBase):
             # Fee may lag behind filled/avg on order object; keep polling until timeout (same idea as Bitget/OKX).
             if filled > 0 and avg_price > 0:
                 if fee <= 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if status.lower() in ("closed", "cancelled", "canceled"):
                 if fee <= 0 and filled > 0 and avg_price > 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if timed_out:
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
 
 class GateUsdtFuturesClient(_GateBase):
     def __init__(self, *, api_key: str, secret_key: str, base_url: str = "https://api.gateio.ws", timeout_sec: float = 15.0, channel_id: str = ""):
         super().__init__(api_key=api_key, secret_key=secret_key, base_url=base_url, timeout_sec=timeout_sec, channel_id=channel_id)
-        # Best-effort cache for contract metadata to convert base qty -> contracts.
-        self._contract_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-        self._contract_cache_ttl_sec = 300.0
+        # Best-effort cache for contract metadata to convert base qty -> contracts. Shared across
+        # client instances since create_client() builds a fresh client per sync pass / order.
+        self._contract_cache = _CONTRACT_CACHE
+        self._contract_cache_ttl_sec = 3600.0
+        # Best-effort cache of successful set-leverage calls: contract -> (set_at_ts, leverage).
+        self._lev_cache: Dict[str, Tuple[float, int]] = {}
+        self._lev_cache_ttl_sec = 60.0
 
     @staticmethod
     def _to_dec(x: Any) -> Decimal:
@@ -352,8 +359,9 @@ class GateUsdtFuturesClient(_GateBase):
         c = str(contract or "").strip()
         if not c:
             return {}
+        key = f"{self.base_url}|{c}"
         now = time.time()
-        cached = self._contract_cache.get(c)
+        cached = self._contract_cache.get(key)
         if cached:
             ts, obj = cached
             if obj and (now - float(ts or 0.0)) <= float(self._contract_cache_ttl_sec or 300.0):
@@ -367,7 +375,7 @@ class GateUsdtFuturesClient(_GateBase):
             raise LiveTradingError(f"Gate HTTP {code}: {text[:500]}")
         obj = data if isinstance(data, dict) else {}
         if obj:
-            self._contract_cache[c] = (now, obj)
+            self._contract_cache[key] = (now, obj)
         return obj
 
     @staticmethod
@@ -485,6 +493,10 @@ class GateUsdtFuturesClient(_GateBase):
             lv = 1
         if lv < 1:
             lv = 1
+        now = time.time()
+        cached = self._lev_cache.get(c)
+        if cached and cached[1] == lv and (now - cached[0]) <= self._lev_cache_ttl_sec:
+            return True
         path = f"/api/v4/futures/usdt/positions/{c}/leverage"
         lv_s = str(lv)
         # Gate expects ``leverage`` / ``cross_leverage_limit`` as **query parameters**, not JSON body
@@ -498,6 +510,7 @@ class GateUsdtFuturesClient(_GateBase):
         for qp in attempts:
             try:
                 _ = self._signed_request("POST", path, params=qp, json_body=None)
+                self._lev_cache[c] = (now, lv)
                 return True
             except LiveTradingError as e:
                 last_err = e
@@ -687,16 +700,16 @@ class GateUsdtFuturesClient(_GateBase):
                     fee_ccy = mt_ccy or "USDT"
             if filled > 0 and avg_price > 0:
                 if fee <= 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if str(status).lower() in ("finished", "cancelled", "canceled"):
                 if fee <= 0 and filled > 0 and avg_price > 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
             if timed_out:
                 return {"filled": filled, "avg_price": avg_price, "fee": fee, "fee_ccy": fee_ccy, "status": status, "order": last}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
 
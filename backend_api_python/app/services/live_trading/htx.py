@@ -18,7 +18,7 @@ from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode, urlparse
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 from app.services.live_trading import htx_v5
 from app.services.live_trading.symbols import to_htx_contract_code, to_htx_spot_symbol
 
@@ -53,7 +53,9 @@ class HtxClient(BaseRestClient):
         self._spot_account_id: Optional[str] = None
         self._contract_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self._contract_cache_ttl_sec = 300.0
-        self._lever_cache: Dict[str, int] = {}
+        # contract_code -> (set_at_ts, lever); skips the lever POST while the same value is fresh.
+        self._lever_cache: Dict[str, Tuple[float, int]] = {}
+        self._lever_cache_ttl_sec = 60.0
         self._v5_asset_mode: Optional[int] = None
         self._v5_asset_mode_ts: float = 0.0
         self._v5_multi_asset_switch_tried: bool = False
@@ -500,13 +502,17 @@ class HtxClient(BaseRestClient):
             lv = 1
         if lv < 1:
             lv = 1
+        now = time.time()
+        cached = self._lever_cache.get(contract_code)
+        if cached and cached[1] == lv and (now - cached[0]) <= self._lever_cache_ttl_sec:
+            return True
         body = htx_v5.build_lever_body(
             contract_code=contract_code,
             lever_rate=lv,
             margin_mode=self._default_margin_mode(),
         )
         self._swap_v5_request("POST", "/v5/position/lever", json_body=body)
-        self._lever_cache[contract_code] = lv
+        self._lever_cache[contract_code] = (now, lv)
         return True
 
     def _place_swap_order_v1(self, body: Dict[str, Any]) -> LiveOrderResult:
@@ -953,7 +959,7 @@ class HtxClient(BaseRestClient):
 
             if filled > 0 and avg_price > 0:
                 if fee <= 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {
                     "filled": filled,
@@ -967,7 +973,7 @@ class HtxClient(BaseRestClient):
                 "filled", "partial-filled", "partial_filled", "canceled", "cancelled", "6", "7", "3", "4"
             ):
                 if fee <= 0 and filled > 0 and avg_price > 0 and not timed_out:
-                    time.sleep(float(poll_interval_sec or 0.5))
+                    time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
                     continue
                 return {
                     "filled": filled,
@@ -986,4 +992,4 @@ class HtxClient(BaseRestClient):
                     "status": status,
                     "order": last,
                 }
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
@@ -16,11 +16,20 @@ from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
-from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError
+from app.services.live_trading.base import BaseRestClient, LiveOrderResult, LiveTradingError, fill_poll_delay
 
 logger = logging.getLogger(__name__)
 from app.services.live_trading.symbols import to_okx_swap_inst_id, to_okx_spot_inst_id
 
+# Process-wide instrument metadata cache: "{base_url}|{instType}:{instId}" -> (fetched_at, instrument)
+_INSTRUMENT_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Derived swap minimum order size in base units, keyed like _INSTRUMENT_CACHE.
+_MIN_BASE_CACHE: Dict[str, Tuple[float, float]] = {}
+
+# sCode values meaning our cached lotSz/minSz no longer match the venue.
+_SIZE_REJECT_CODES = ("51020", "51121", "51201")
+
 
 class OkxClient(BaseRestClient):
     _DEFAULT_BROKER_CODE = "56fa80b0ce8cBCDE"
@@ -67,8 +76,10 @@ class OkxClient(BaseRestClient):
 
         # Best-effort cache for public instrument metadata used to normalize order sizes.
         # Key: f"{inst_type}:{inst_id}" -> (fetched_at_ts, instrument_dict)
-        self._inst_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-        self._inst_cache_ttl_sec = 300.0
+        # Instrument metadata (ctVal, lotSz, ...) is public and near-static; share it across
+        # client instances since create_client() builds a fresh client per sync pass / order.
+        self._inst_cache = _INSTRUMENT_CACHE
+        self._inst_cache_ttl_sec = 3600.0
 
         # Best-effort cache for account config (position mode).
         # Key: "account_config" -> (fetched_at_ts, config_dict)
@@ -205,7 +216,7 @@ class OkxClient(BaseRestClient):
         if not it or not iid:
             return {}
 
-        key = f"{it}:{iid}"
+        key = f"{self.base_url}|{it}:{iid}"
         now = time.time()
         cached = self._inst_cache.get(key)
         if cached:
@@ -220,6 +231,43 @@ class OkxClient(BaseRestClient):
             self._inst_cache[key] = (now, first)
         return first if isinstance(first, dict) else {}
 
+    def swap_min_base(self, inst_id: str) -> float:
+        """
+        Smallest SWAP order size in base units (minSz or lotSz contracts * ctVal).
+
+        Derived from the cached instrument, so repeated tail-guard checks skip
+        the Decimal/float conversions. Returns 0.0 when the metadata is incomplete.
+        """
+        iid = str(inst_id or "").strip()
+        key = f"{self.base_url}|SWAP:{iid}"
+        now = time.time()
+        cached = _MIN_BASE_CACHE.get(key)
+        if cached and (now - cached[0]) <= float(self._inst_cache_ttl_sec or 300.0):
+            return cached[1]
+        inst = self.get_instrument(inst_type="SWAP", inst_id=iid) or {}
+        lot_sz = float(inst.get("lotSz") or 0.0)
+        min_sz = float(inst.get("minSz") or 0.0)
+        ct_val = float(inst.get("ctVal") or 0.0)
+        min_contract = min_sz if min_sz > 0 else (lot_sz if lot_sz > 0 else 0.0)
+        min_base = (min_contract * ct_val) if (min_contract > 0 and ct_val > 0) else 0.0
+        if inst:
+            _MIN_BASE_CACHE[key] = (now, min_base)
+        return min_base
+
+    def invalidate_instrument(self, *, inst_type: str, inst_id: str) -> None:
+        """Drop cached metadata for one instrument so the next lookup refetches it."""
+        key = f"{self.base_url}|{str(inst_type or '').strip().upper()}:{str(inst_id or '').strip()}"
+        self._inst_cache.pop(key, None)
+        _MIN_BASE_CACHE.pop(key, None)
+
+    def _post_order(self, body: Dict[str, Any], *, inst_type: str) -> Dict[str, Any]:
+        try:
+            return self._signed_request("POST", "/api/v5/trade/order", json_body=body)
+        except LiveTradingError as e:
+            if any(code in str(e) for code in _SIZE_REJECT_CODES):
+                self.invalidate_instrument(inst_type=inst_type, inst_id=str(body.get("instId") or ""))
+            raise
+
     def _normalize_order_size(self, *, inst_id: str, market_type: str, size: float) -> Tuple[Decimal, Optional[int]]:
         """
         Normalize requested size to OKX constraints:
@@ -622,7 +670,7 @@ class OkxClient(BaseRestClient):
         if self.broker_code:
             body["tag"] = str(self.broker_code)
 
-        raw = self._signed_request("POST", "/api/v5/trade/order", json_body=body)
+        raw = self._post_order(body, inst_type="SPOT" if mt == "spot" else "SWAP")
         data = (raw.get("data") or []) if isinstance(raw, dict) else []
         first: Dict[str, Any] = data[0] if isinstance(data, list) and data else {}
         exchange_order_id = str(first.get("ordId") or first.get("clOrdId") or "")
@@ -699,7 +747,7 @@ class OkxClient(BaseRestClient):
         if self.broker_code:
             body["tag"] = str(self.broker_code)
 
-        raw = self._signed_request("POST", "/api/v5/trade/order", json_body=body)
+        raw = self._post_order(body, inst_type="SPOT" if mt == "spot" else "SWAP")
         data = (raw.get("data") or []) if isinstance(raw, dict) else []
         first: Dict[str, Any] = data[0] if isinstance(data, list) and data else {}
         exchange_order_id = str(first.get("ordId") or first.get("clOrdId") or "")
@@ -879,6 +927,6 @@ class OkxClient(BaseRestClient):
 
             if time.time() >= end_ts:
                 return {"filled": filled, "avg_price": avg_price, "fee": 0.0, "fee_ccy": "", "state": state, "order": last_order, "fills": last_fills}
-            time.sleep(float(poll_interval_sec or 0.5))
+            time.sleep(fill_poll_delay(poll_interval_sec, end_ts, max_wait_sec))
 
 
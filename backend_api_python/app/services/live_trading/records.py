@@ -272,12 +272,15 @@ def _purge_position_symbol_duplicates(strategy_id: int, side: str, canonical: st
             (int(strategy_id), side_l),
         )
         rows = cur.fetchall() or []
+        alias_ids = []
         for r in rows:
             sym = str(r.get("symbol") or "").strip()
             if not sym or sym == canon:
                 continue
             if normalize_strategy_symbol(sym) == canon:
-                cur.execute("DELETE FROM qd_strategy_positions WHERE id = %s", (int(r.get("id") or 0),))
+                alias_ids.append(int(r.get("id") or 0))
+        if alias_ids:
+            cur.execute("DELETE FROM qd_strategy_positions WHERE id = ANY(%s)", (alias_ids,))
         db.commit()
         cur.close()
 
@@ -1,6 +1,7 @@
 """Quote fetching and cache helpers for watchlist pricing."""
 
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 
 from app.services.kline import KlineService
@@ -105,20 +106,86 @@ def get_single_price(market: str, symbol: str) -> dict:
     return empty_price(market, symbol, error="unavailable")
 
 
+def _prefetch_cn_hk_prices(pairs: list) -> dict:
+    """
+    Quote every uncached CN/HK watchlist row with one batched Tencent request.
+
+    Returns {(market, symbol): price_data} for rows that came back with a price; the rest
+    go through the regular per-symbol path.
+    """
+    from app.data_sources.tencent import fetch_quotes, normalize_cn_code, normalize_hk_code, parse_quote_to_ticker
+
+    by_code = {}
+    for market, symbol in pairs:
+        if market not in ("CNStock", "HKStock"):
+            continue
+        if isinstance(_market_cache.get(quote_cache_key(market, symbol)), dict):
+            continue
+        code = normalize_cn_code(symbol) if market == "CNStock" else normalize_hk_code(symbol)
+        by_code[code.lower()] = (market, symbol)
+    if len(by_code) < 2:
+        return {}
+
+    try:
+        quotes = fetch_quotes(list(by_code))
+    except Exception as exc:
+        logger.debug("Batched Tencent quote failed for %d symbols: %s", len(by_code), exc)
+        return {}
+
+    prices = {}
+    for code, parts in quotes.items():
+        pair = by_code.get(code)
+        if not pair:
+            continue
+        t = parse_quote_to_ticker(parts)
+        if float(t.get("last") or 0) <= 0:
+            continue
+        price_data = {
+            "price": t.get("last", 0),
+            "change": t.get("change", 0),
+            "changePercent": t.get("changePercent", 0),
+            "high": t.get("high", 0),
+            "low": t.get("low", 0),
+            "open": t.get("open", 0),
+            "previousClose": t.get("previousClose", 0),
+            "source": "ticker",
+        }
+        _market_cache.set(quote_cache_key(*pair), price_data, QUOTE_CACHE_TTL_SEC)
+        _market_cache.set(quote_cache_key(*pair, stale=True), price_data, QUOTE_STALE_TTL_SEC)
+        prices[pair] = price_data
+    return prices
+
+
 def get_price_map(watchlist: list, timeout_sec: int = 30) -> list:
     """Fetch quote snapshots for watchlist rows in parallel."""
     results = []
     futures = {}
-    for item in watchlist:
-        market = item.get("market", "")
-        symbol = item.get("symbol", "")
-        if market and symbol:
-            future = executor.submit(get_single_price, market, symbol)
-            futures[future] = (market, symbol)
+    pairs = [
+        (item.get("market", ""), item.get("symbol", ""))
+        for item in watchlist
+        if item.get("market", "") and item.get("symbol", "")
+    ]
+    # The batch shares the pool and the deadline with the per-symbol fetches; a slow or
+    # failed batch leaves its rows to the per-symbol path.
+    deadline = time.monotonic() + timeout_sec
+    batched = {}
+    prefetch = executor.submit(_prefetch_cn_hk_prices, pairs)
+    try:
+        batched = prefetch.result(timeout=timeout_sec)
+    except FuturesTimeoutError:
+        logger.warning("Batched CN/HK quote timed out after %ss", timeout_sec)
+    except Exception as exc:
+        logger.debug("Batched CN/HK quote failed: %s", exc)
+    for market, symbol in pairs:
+        if (market, symbol) in batched:
+            results.append(normalize_price_payload(market, symbol, batched[(market, symbol)]))
+            continue
+        future = executor.submit(get_single_price, market, symbol)
+        futures[future] = (market, symbol)
 
     completed = set()
     try:
-        for future in as_completed(futures, timeout=timeout_sec):
+        for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
             completed.add(future)
             market, symbol = futures[future]
             try:
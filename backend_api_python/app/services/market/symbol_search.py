@@ -17,6 +17,9 @@ logger = get_logger(__name__)
 SYMBOL_SEARCH_CACHE_TTL_SEC = 21600
 _market_cache = CacheManager()
 _crypto_markets_cache: dict = {"data": None, "ts": 0}
+AKSHARE_LISTING_CACHE_TTL_SEC = 14400
+# market -> {"data": {symbol: (raw_symbol, name)}, "ts": float}
+_akshare_listing_cache: dict = {}
 
 
 def dedupe_symbol_results(items: Iterable[dict], limit: int) -> list:
@@ -161,26 +164,76 @@ def _df_records(df) -> list:
         return []
 
 
+def _akshare_listing(market: str) -> dict:
+    """Full CN/HK AkShare listing keyed by normalized code, fetched once per TTL window."""
+    now = time.time()
+    cached = _akshare_listing_cache.get(market)
+    if cached and now - cached["ts"] < AKSHARE_LISTING_CACHE_TTL_SEC:
+        return cached["data"]
+
+    # Second tier: the shared cache (Redis when enabled) lets other workers skip the AkShare download.
+    shared_key = f"akshare_listing:{market}"
+    shared = _market_cache.get(shared_key)
+    if isinstance(shared, list) and shared:
+        listing = {row[0]: (row[1], row[2]) for row in shared}
+        _akshare_listing_cache[market] = {"data": listing, "ts": now}
+        return listing
+
+    import akshare as ak  # type: ignore
+
+    listing = {}
+    if market == "CNStock":
+        for row in _df_records(ak.stock_info_a_code_name()):
+            symbol = str(row.get("code") or row.get("代码") or "").strip().upper()
+            name = str(row.get("name") or row.get("名称") or "").strip()
+            if symbol and name:
+                listing[symbol] = (symbol, name)
+    else:
+        for row in _df_records(ak.stock_hk_spot_em()):
+            raw_symbol = str(row.get("代码") or row.get("code") or row.get("symbol") or "").strip().upper()
+            name = str(row.get("名称") or row.get("name") or "").strip()
+            if raw_symbol and name:
+                listing[re.sub(r"[^0-9]", "", raw_symbol).zfill(5)] = (raw_symbol, name)
+
+    if listing:
+        _akshare_listing_cache[market] = {"data": listing, "ts": now}
+        _market_cache.set(
+            shared_key,
+            [[symbol, raw_symbol, name] for symbol, (raw_symbol, name) in listing.items()],
+            AKSHARE_LISTING_CACHE_TTL_SEC,
+        )
+        logger.info("Cached %d %s symbols from AkShare", len(listing), market)
+    return listing
+
+
+def _search_akshare_listing(market: str, keyword: str, exact_key: str, limit: int) -> list:
+    listing = _akshare_listing(market)
+    kw = keyword.strip().upper()
+    out = []
+    seen = set()
+
+    exact = listing.get(exact_key) if exact_key else None
+    if exact:
+        out.append({"market": market, "symbol": exact_key, "name": exact[1]})
+        persist_seed_name(market, exact_key, exact[1])
+        seen.add(exact_key)
+
+    for symbol, (raw_symbol, name) in listing.items():
+        if len(out) >= limit:
+            break
+        if symbol in seen:
+            continue
+        if kw in raw_symbol or kw in symbol or kw in name.upper():
+            out.append({"market": market, "symbol": symbol, "name": name})
+            persist_seed_name(market, symbol, name)
+    return out
+
+
 def _search_cn_akshare(keyword: str, limit: int) -> list:
     if limit <= 0:
         return []
     try:
-        import akshare as ak  # type: ignore
-
-        rows = _df_records(ak.stock_info_a_code_name())
-        kw = keyword.strip().upper()
-        out = []
-        for row in rows:
-            symbol = str(row.get("code") or row.get("代码") or "").strip().upper()
-            name = str(row.get("name") or row.get("名称") or "").strip()
-            if not symbol or not name:
-                continue
-            if kw in symbol or kw in name.upper():
-                out.append({"market": "CNStock", "symbol": symbol, "name": name})
-                persist_seed_name("CNStock", symbol, name)
-                if len(out) >= limit:
-                    break
-        return out
+        return _search_akshare_listing("CNStock", keyword, keyword.strip().upper(), limit)
     except Exception as exc:
         logger.debug("CN AkShare symbol search failed: %s", exc)
         return []
@@ -190,23 +243,8 @@ def _search_hk_akshare(keyword: str, limit: int) -> list:
     if limit <= 0:
         return []
     try:
-        import akshare as ak  # type: ignore
-
-        rows = _df_records(ak.stock_hk_spot_em())
-        kw = keyword.strip().upper()
-        out = []
-        for row in rows:
-            raw_symbol = str(row.get("代码") or row.get("code") or row.get("symbol") or "").strip().upper()
-            name = str(row.get("名称") or row.get("name") or "").strip()
-            if not raw_symbol or not name:
-                continue
-            symbol = re.sub(r"[^0-9]", "", raw_symbol).zfill(5)
-            if kw in raw_symbol or kw in symbol or kw in name.upper():
-                out.append({"market": "HKStock", "symbol": symbol, "name": name})
-                persist_seed_name("HKStock", symbol, name)
-                if len(out) >= limit:
-                    break
-        return out
+        digits = re.sub(r"[^0-9]", "", keyword)
+        return _search_akshare_listing("HKStock", keyword, digits.zfill(5) if digits else "", limit)
     except Exception as exc:
         logger.debug("HK AkShare symbol search failed: %s", exc)
         return []
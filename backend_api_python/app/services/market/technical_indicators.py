@@ -52,9 +52,15 @@ def calculate_indicators(klines: List[Dict[str, Any]]) -> Dict[str, Any]:
             "trend": macd_trend,
         }
 
+    # The 20-bar windows are shared by MA20, Bollinger, swing levels, volume ratio and price position.
+    has_20 = len(closes) >= 20
+    closes_20 = closes[-20:]
+    highs_20 = highs[-20:]
+    lows_20 = lows[-20:]
+
     ma5 = sum(closes[-5:]) / 5 if len(closes) >= 5 else current_price
     ma10 = sum(closes[-10:]) / 10 if len(closes) >= 10 else current_price
-    ma20 = sum(closes[-20:]) / 20 if len(closes) >= 20 else current_price
+    ma20 = sum(closes_20) / 20 if has_20 else current_price
     if current_price > ma5 > ma10 > ma20:
         ma_trend = "strong_uptrend"
     elif current_price > ma20:
@@ -73,11 +79,9 @@ def calculate_indicators(klines: List[Dict[str, Any]]) -> Dict[str, Any]:
         "trend": ma_trend,
     }
 
-    bb_for_levels = calc_bollinger(closes, 20, 2) if len(closes) >= 20 else {}
+    bb_for_levels = _bollinger_from_window(closes_20, ma20, 2) if has_20 else {}
     if len(klines) >= 2:
-        prev_high = float(klines[-2].get("high", highs[-2]) if len(highs) >= 2 else current_price * 1.02)
-        prev_low = float(klines[-2].get("low", lows[-2]) if len(lows) >= 2 else current_price * 0.98)
-        prev_close = float(klines[-2].get("close", closes[-2]) if len(closes) >= 2 else current_price)
+        prev_high, prev_low, prev_close = highs[-2], lows[-2], closes[-2]
         pivot = (prev_high + prev_low + prev_close) / 3
         r1 = 2 * pivot - prev_low
         s1 = 2 * pivot - prev_high
@@ -88,10 +92,8 @@ def calculate_indicators(klines: List[Dict[str, Any]]) -> Dict[str, Any]:
         r1 = r2 = current_price * 1.02
         s1 = s2 = current_price * 0.98
 
-    recent_highs = highs[-20:] if len(highs) >= 20 else highs
-    recent_lows = lows[-20:] if len(lows) >= 20 else lows
-    swing_high = max(recent_highs) if recent_highs else current_price * 1.05
-    swing_low = min(recent_lows) if recent_lows else current_price * 0.95
+    swing_high = max(highs_20) if highs_20 else current_price * 1.05
+    swing_low = min(lows_20) if lows_20 else current_price * 0.95
     bb_upper = bb_for_levels.get("BB_upper", swing_high)
     bb_lower = bb_for_levels.get("BB_lower", swing_low)
     indicators["levels"] = {
@@ -107,7 +109,7 @@ def calculate_indicators(klines: List[Dict[str, Any]]) -> Dict[str, Any]:
         "method": "pivot_swing_bb_avg",
     }
 
-    atr = calc_atr_wilder(klines, period=14) if len(klines) >= 14 else 0.0
+    atr = _atr_wilder(_true_ranges(highs, lows, closes), 14) if len(klines) >= 14 else 0.0
     volatility_pct = (atr / current_price * 100) if current_price > 0 and atr > 0 else 0
     if volatility_pct > 5:
         volatility_level = "high"
@@ -145,10 +147,10 @@ def calculate_indicators(klines: List[Dict[str, Any]]) -> Dict[str, Any]:
     if len(volumes) >= 20:
         avg_vol = sum(volumes[-20:]) / 20
         indicators["volume_ratio"] = round(volumes[-1] / avg_vol, 2) if avg_vol > 0 else 1.0
-    if len(closes) >= 20:
-        high_20 = max(highs[-20:])
-        low_20 = min(lows[-20:])
-        indicators["price_position"] = round((current_price - low_20) / (high_20 - low_20) * 100, 1) if high_20 > low_20 else 50.0
+    if has_20:
+        indicators["price_position"] = (
+            round((current_price - swing_low) / (swing_high - swing_low) * 100, 1) if swing_high > swing_low else 50.0
+        )
     indicators["trend"] = ma_trend
     indicators["current_price"] = round(current_price, 6)
     return indicators
@@ -158,16 +160,25 @@ def calc_rsi(closes: List[float], period: int = 14) -> float:
     """Calculate Wilder RSI."""
     if len(closes) < period + 1:
         return 50.0
-    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-    gains = [delta if delta > 0 else 0.0 for delta in deltas]
-    losses = [-delta if delta < 0 else 0.0 for delta in deltas]
-    if len(gains) < period:
-        return 50.0
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    # Seed sums and Wilder smoothing in one walk over the closes; no delta/gain/loss lists.
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev = closes[0]
+    for i in range(1, len(closes)):
+        close = closes[i]
+        delta = close - prev
+        prev = close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i == period:
+                avg_gain /= period
+                avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
     if avg_loss == 0:
         return 100.0
     rs = avg_gain / avg_loss
@@ -191,14 +202,21 @@ def ema_series_sma_seed(data: List[float], period: int) -> List[Optional[float]]
 
 def calc_macd(closes: List[float]) -> Dict[str, float]:
     """Calculate MACD(12, 26, 9)."""
-    ema12 = ema_series_sma_seed(closes, 12)
-    ema26 = ema_series_sma_seed(closes, 26)
-    if len(closes) < 26 or ema12[-1] is None or ema26[-1] is None:
+    if len(closes) < 26:
         return {"MACD": 0.0, "MACD_signal": 0.0, "MACD_histogram": 0.0}
 
-    macd_sub = [ema12[i] - ema26[i] for i in range(25, len(closes)) if ema12[i] is not None and ema26[i] is not None]
-    if not macd_sub:
-        return {"MACD": 0.0, "MACD_signal": 0.0, "MACD_histogram": 0.0}
+    # EMA12 and EMA26 (SMA-seeded) advanced together in one pass; only the MACD line is kept.
+    k12 = 2.0 / 13
+    k26 = 2.0 / 27
+    ema12 = sum(closes[:12]) / 12
+    for price in closes[12:26]:
+        ema12 = (price - ema12) * k12 + ema12
+    ema26 = sum(closes[:26]) / 26
+    macd_sub = [ema12 - ema26]
+    for price in closes[26:]:
+        ema12 = (price - ema12) * k12 + ema12
+        ema26 = (price - ema26) * k26 + ema26
+        macd_sub.append(ema12 - ema26)
     sig_series = ema_series_sma_seed(macd_sub, 9)
     last_macd = macd_sub[-1]
     last_sig = sig_series[-1] if sig_series[-1] is not None else last_macd
@@ -211,24 +229,32 @@ def calc_macd(closes: List[float]) -> Dict[str, float]:
 
 def true_ranges(klines: List[Dict[str, Any]]) -> List[float]:
     """Calculate true range for each K-line."""
+    highs = [float(k.get("high", 0)) for k in klines]
+    lows = [float(k.get("low", 0)) for k in klines]
+    closes = [float(k.get("close", 0)) for k in klines]
+    return _true_ranges(highs, lows, closes)
+
+
+def _true_ranges(highs: List[float], lows: List[float], closes: List[float]) -> List[float]:
     ranges: List[float] = []
-    for i, kline in enumerate(klines):
-        high = float(kline.get("high", 0))
-        low = float(kline.get("low", 0))
+    prev_close = 0.0
+    for i, (high, low) in enumerate(zip(highs, lows)):
         if high <= 0 or low <= 0:
             ranges.append(0.0)
-            continue
-        if i == 0:
+        elif i == 0:
             ranges.append(high - low)
         else:
-            prev_close = float(klines[i - 1].get("close", 0))
             ranges.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        prev_close = closes[i]
     return ranges
 
 
 def calc_atr_wilder(klines: List[Dict[str, Any]], period: int = 14) -> float:
     """Calculate Wilder ATR."""
-    ranges = true_ranges(klines)
+    return _atr_wilder(true_ranges(klines), period)
+
+
+def _atr_wilder(ranges: List[float], period: int) -> float:
     if len(ranges) < period:
         return 0.0
     atr = sum(ranges[:period]) / period
@@ -242,8 +268,12 @@ def calc_bollinger(closes: List[float], period: int = 20, std_dev: int = 2) -> D
     if len(closes) < period:
         return {}
     recent = closes[-period:]
-    middle = sum(recent) / period
-    variance = sum((value - middle) ** 2 for value in recent) / period
+    return _bollinger_from_window(recent, sum(recent) / period, std_dev)
+
+
+def _bollinger_from_window(recent: List[float], middle: float, std_dev: int) -> Dict[str, float]:
+    """Bollinger Bands for a window whose SMA (``middle``) is already known."""
+    variance = sum((value - middle) ** 2 for value in recent) / len(recent)
     std = variance ** 0.5
     return {
         "BB_upper": round(middle + std_dev * std, 4),
@@ -19,7 +19,6 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
 
-import yfinance as yf
 import pandas as pd
 import requests
 
@@ -40,6 +39,12 @@ class NonBlockingThreadPoolExecutor(ThreadPoolExecutor):
         return False
 
 
+# Process-wide pool for fanning out independent blocking HTTP calls inside one data item.
+# Shared by every collector: analysis_memory / ai_calibration build short-lived instances,
+# and a per-instance pool would leak its threads with each of them.
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mdc-io")
+
+
 class MarketDataCollector:
     """
     市场数据采集器
@@ -58,6 +63,7 @@ class MarketDataCollector:
         self._finnhub_client = None
         self._ak = None
         self._crypto_metric_cache: Dict[str, Dict[str, Any]] = {}
+        self._io_pool = _io_pool
         self._init_clients()
     
     def _init_clients(self):
@@ -502,11 +508,22 @@ class MarketDataCollector:
         美股基本面 - Finnhub + yfinance
         包括：基础财务指标 + 财报数据（资产负债表、利润表、现金流量表）
         """
+        import yfinance as yf
+
         result = {}
+
+        # Finnhub, yfinance info, statements and earnings are independent round-trips.
+        metrics_future = (
+            self._io_pool.submit(self._finnhub_basic_financials, symbol)
+            if self._finnhub_client else None
+        )
+        info_future = self._io_pool.submit(lambda: yf.Ticker(symbol).info or {})
+        statements_future = self._io_pool.submit(self._get_financial_statements, symbol)
+        earnings_future = self._io_pool.submit(self._get_earnings_data, symbol)
         
-        if self._finnhub_client:
+        if metrics_future is not None:
             try:
-                metrics = self._finnhub_client.company_basic_financials(symbol, 'all')
+                metrics = metrics_future.result()
                 if metrics and metrics.get('metric'):
                     m = metrics['metric']
                     result.update({
@@ -530,8 +547,7 @@ class MarketDataCollector:
                 logger.debug(f"Finnhub fundamental failed for {symbol}: {e}")
         
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info or {}
+            info = info_future.result()
             
             if not result.get('pe_ratio'):
                 result['pe_ratio'] = info.get('trailingPE') or info.get('forwardPE')
@@ -568,11 +584,11 @@ class MarketDataCollector:
         except Exception as e:
             logger.debug(f"yfinance fundamental failed for {symbol}: {e}")
         
-        financial_statements = self._get_financial_statements(symbol)
+        financial_statements = statements_future.result()
         if financial_statements:
             result['financial_statements'] = financial_statements
         
-        earnings_data = self._get_earnings_data(symbol)
+        earnings_data = earnings_future.result()
         if earnings_data:
             result['earnings'] = earnings_data
         
@@ -585,6 +601,8 @@ class MarketDataCollector:
         使用 yfinance 获取，包含最近几个季度的数据
         """
         try:
+            import yfinance as yf
+
             ticker = yf.Ticker(symbol)
             statements = {}
             
@@ -660,6 +678,8 @@ class MarketDataCollector:
             return None
 
         try:
+            import yfinance as yf
+
             ticker = yf.Ticker(symbol)
             earnings_data: Dict[str, Any] = {}
 
@@ -777,9 +797,13 @@ class MarketDataCollector:
         if not base_symbol:
             return {}
 
-        market_structure = self._get_crypto_market_structure(base_symbol, price_data, kline_data)
-        derivatives = self._get_crypto_derivatives_metrics(base_symbol)
-        capital_flow = self._get_crypto_capital_flow(base_symbol)
+        # CoinGecko, Coinglass/Binance and CryptoQuant lookups are independent; overlap them.
+        structure_future = self._io_pool.submit(self._get_crypto_market_structure, base_symbol, price_data, kline_data)
+        derivatives_future = self._io_pool.submit(self._get_crypto_derivatives_metrics, base_symbol)
+        capital_flow_future = self._io_pool.submit(self._get_crypto_capital_flow, base_symbol)
+        market_structure = structure_future.result()
+        derivatives = derivatives_future.result()
+        capital_flow = capital_flow_future.result()
 
         volume_24h = market_structure.get("volume_24h")
         volume_change_24h = market_structure.get("volume_change_24h")
@@ -851,6 +875,30 @@ class MarketDataCollector:
         }
         return value
 
+    def _finnhub_profile(self, symbol: str) -> Dict[str, Any]:
+        """Finnhub company_profile2, cached per symbol (profiles change rarely)."""
+        cache_key = f"finnhub|profile2|{symbol}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        return self._cache_set(cache_key, self._finnhub_client.company_profile2(symbol=symbol) or {}, 300)
+
+    def _finnhub_basic_financials(self, symbol: str) -> Dict[str, Any]:
+        """Finnhub company_basic_financials(metric='all'), cached per symbol."""
+        cache_key = f"finnhub|basic_financials|{symbol}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        return self._cache_set(cache_key, self._finnhub_client.company_basic_financials(symbol, 'all') or {}, 300)
+
+    def _finnhub_general_news(self, category: str) -> List[Dict[str, Any]]:
+        """Finnhub general_news is symbol-independent; share one fetch per category for a minute."""
+        cache_key = f"finnhub|general_news|{category}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        return self._cache_set(cache_key, self._finnhub_client.general_news(category, min_id=0) or [], 60)
+
     def _coinglass_get(self, path: str, params: Dict[str, Any], ttl_sec: int = 120) -> Optional[Dict[str, Any]]:
         api_key = (APIKeys.COINGLASS_API_KEY or "").strip()
         if not api_key:
@@ -1267,7 +1315,7 @@ class MarketDataCollector:
         """获取公司信息"""
         try:
             if market == 'USStock' and self._finnhub_client:
-                profile = self._finnhub_client.company_profile2(symbol=symbol)
+                profile = self._finnhub_profile(symbol)
                 if profile:
                     return {
                         'name': profile.get('name'),
@@ -1512,20 +1560,24 @@ class MarketDataCollector:
         """
         news_list = []
         sentiment = {}
+
+        # Global events do not depend on the symbol; run that search while symbol news loads.
+        global_events_future = self._io_pool.submit(self._get_global_major_events)
         
         if self._finnhub_client:
             try:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-                start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+                now = datetime.now()
+                end_date = now.strftime('%Y-%m-%d')
+                start_date = (now - timedelta(days=7)).strftime('%Y-%m-%d')
                 
                 raw_news = []
                 
                 if market == 'USStock':
                     raw_news = self._finnhub_client.company_news(symbol, _from=start_date, to=end_date)
                 elif market == 'Crypto':
-                    raw_news = self._finnhub_client.general_news('crypto', min_id=0)
+                    raw_news = self._finnhub_general_news('crypto')
                 else:
-                    raw_news = self._finnhub_client.general_news('general', min_id=0)
+                    raw_news = self._finnhub_general_news('general')
                 
                 if raw_news:
                     for item in raw_news[:10]:
@@ -1561,7 +1613,7 @@ class MarketDataCollector:
             search_news = self._get_news_from_search(market, symbol, company_name)
             news_list.extend(search_news)
         
-        global_events = self._get_global_major_events()
+        global_events = global_events_future.result()
         if global_events:
             news_list.extend(global_events)
             logger.info(f"Added {len(global_events)} global major events to news list")
@@ -1608,9 +1660,10 @@ class MarketDataCollector:
             )
             
             if response.success and response.results:
+                today_str = datetime.now().strftime('%Y-%m-%d')
                 for result in response.results:
                     news_list.append({
-                        "datetime": result.published_date or datetime.now().strftime('%Y-%m-%d'),
+                        "datetime": result.published_date or today_str,
                         "headline": result.title,
                         "summary": result.snippet[:200] if result.snippet else '',
                         "source": f"搜索:{result.source}",
@@ -1644,6 +1697,7 @@ class MarketDataCollector:
                 "war conflict breaking news today"  # 只搜索最重要的查询，减少API调用
             ]
             
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M')
             for query in global_event_queries:
                 try:
                     response = search_service.search_with_fallback(
@@ -1667,7 +1721,7 @@ class MarketDataCollector:
                             
                             if any(keyword in text for keyword in major_event_keywords):
                                 news_list.append({
-                                    "datetime": result.published_date or datetime.now().strftime('%Y-%m-%d %H:%M'),
+                                    "datetime": result.published_date or now_str,
                                     "headline": result.title,
                                     "summary": result.snippet[:300] if result.snippet else '',
                                     "source": f"全球事件:{result.source}",
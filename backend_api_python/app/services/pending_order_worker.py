@@ -8,11 +8,16 @@ This worker polls `pending_orders` periodically and dispatches orders based on `
 
 from __future__ import annotations
 
+import copy
 import json
+import logging
 import os
 import re
+import socket
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.services.signal_notifier import SignalNotifier
@@ -21,7 +26,6 @@ from app.services.live_trading.execution import place_order_from_signal
 from app.services.live_trading.factory import create_client
 from app.services.live_trading.records import (
     ensure_position_ledger_schema,
-    normalize_strategy_symbol,
     strategy_allowed_symbols,
 )
 from app.services.live_trading.strategy_position_sync import (
@@ -36,29 +40,41 @@ from app.services.live_trading.leg_context import (
 )
 from app.services.live_trading.position_query import resolve_reduce_only_quantity
 from app.utils.pnl import calc_notional_value
-from app.services.live_trading.base import LiveTradingError, is_file_descriptor_exhausted
+from app.services.live_trading.base import LiveOrderResult, LiveTradingError, is_file_descriptor_exhausted
 from app.services.pending_orders.fill_records import (
     persist_strategy_fill,
     trade_close_reason_from_payload,
 )
 from app.services.pending_orders.live_order_support import (
     FillAccumulator,
+    LiveOrderExecutionContext,
     LiveOrderNotifier,
     LiveOrderRejected,
     build_live_order_context,
+    canonical_market_type,
     console_print,
-    make_client_order_id,
+    phase_client_order_ids,
+    signal_direction,
     signal_to_side_pos_reduce,
+    summarize_phases,
+    wait_for_live_notifications,
 )
 from app.services.pending_orders.live_order_phases import (
-    apply_fill_snapshot,
+    apply_fill_delta,
     apply_okx_tail_guard,
+    bitget_mix_params,
+    MAKER_ORDER_MODES,
     cancel_live_limit_order,
+    client_kind,
+    fetch_live_order_fees,
     maker_limit_price,
     place_live_limit_order,
     place_live_market_order,
+    record_phase_query,
+    supports_batched_fees,
     wait_live_order_fill,
 )
+from app.services.pending_orders.position_fetchers import position_fetcher_for
 from app.services.pending_orders.position_sync_cache import (
     exchange_sync_backoff_sec,
     get_position_sync_snapshot,
@@ -67,20 +83,10 @@ from app.services.pending_orders.position_sync_cache import (
     is_exchange_sync_backoff,
     position_sync_cache_key,
     set_exchange_sync_backoff,
+    position_sync_fetch_lock,
     set_position_sync_snapshot,
 )
-from app.services.live_trading.binance import BinanceFuturesClient
-from app.services.live_trading.binance_spot import BinanceSpotClient
-from app.services.live_trading.okx import OkxClient
-from app.services.live_trading.bitget import BitgetMixClient
-from app.services.live_trading.bitget_spot import BitgetSpotClient
-from app.services.live_trading.bybit import BybitClient
-from app.services.live_trading.coinbase_exchange import CoinbaseExchangeClient
-from app.services.live_trading.kraken import KrakenClient
-from app.services.live_trading.kraken_futures import KrakenFuturesClient
-from app.services.live_trading.gate import GateSpotClient, GateUsdtFuturesClient
-from app.services.live_trading.htx import HtxClient
-from app.utils.db import get_db_connection
+from app.utils.db import db_transaction, get_db_connection
 from app.utils.logger import get_logger
 from app.utils.strategy_runtime_logs import append_strategy_log
 from app.services.strategy_lifecycle import (
@@ -89,17 +95,115 @@ from app.services.strategy_lifecycle import (
     should_skip_position_sync,
 )
 
-# Lazy import IBKR to avoid ImportError if ib_insync not installed
-IBKRClient = None
-
-
-# Lazy import Alpaca to avoid ImportError if alpaca-py not installed
-AlpacaClient = None
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
 
 logger = get_logger(__name__)
 
 ALPACA_FILL_DELTA_EPSILON = 1e-8
 _POSITION_SYNC_FD_BACKOFF_UNTIL = 0.0
+_ORDER_MODE_DEFAULTS: Optional[Tuple[str, float, float]] = None
+_STORE_RAW_PHASES: Optional[bool] = None
+_OPENING_SIGNALS = frozenset({"open_long", "open_short", "add_long", "add_short"})
+
+# Signal -> side for the long-only stock brokers (IBKR, Alpaca), including stop/tp/trailing aliases.
+_LONG_ONLY_ACTION = {
+    "open_long": "buy",
+    "add_long": "buy",
+    "close_long": "sell",
+    "reduce_long": "sell",
+    "close_long_stop": "sell",
+    "close_long_profit": "sell",
+    "close_long_trailing": "sell",
+}
+
+# exchange_id -> log label of the brokers routed through _LONG_ONLY_ACTION.
+_LONG_ONLY_BROKERS = {"ibkr": "IBKR", "alpaca": "Alpaca"}
+
+# Set by the enqueue path so the worker loop wakes immediately instead of waiting out poll_interval_sec.
+_WAKE_EVENT = threading.Event()
+
+# Lease row (strategy_runtime_locks) electing the one process that runs position sync, so
+# several backend processes sharing the database don't each hit the exchanges with the same
+# queries. The owner renews it every sync interval and keeps it until it stops; a crashed
+# owner's lease expires after two intervals and another process takes over. A row lease
+# rather than a session advisory lock, so no pooled connection is pinned for the whole sync.
+_POSITION_SYNC_LEASE_KEY = "pending_order_worker:position_sync"
+_POSITION_SYNC_LEASE_OWNER = f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+# Strategy name / notification config fallback for orders whose payload lacks them.
+_SQL_STRATEGY_META = "SELECT strategy_name, notification_config FROM qd_strategies_trading WHERE id = $1::int"
+
+
+def _loads_json_dict(raw: Any) -> Dict[str, Any]:
+    """Decode a JSON object column (payload_json, notification_config); {} when empty or malformed."""
+    if not isinstance(raw, str) or not raw.strip():
+        return {}
+    obj: Any = None
+    if orjson is not None:
+        try:
+            obj = orjson.loads(raw)
+        except Exception:
+            obj = None  # e.g. NaN literals written by json.dumps; stdlib accepts them
+    if obj is None:
+        try:
+            obj = json.loads(raw)
+        except Exception:
+            return {}
+    return obj if isinstance(obj, dict) else {}
+
+
+def _dumps_json(obj: Any) -> str:
+    """Compact UTF-8 JSON for exchange_response_json columns; stdlib for what orjson rejects."""
+    if not obj and type(obj) is dict:
+        return "{}"  # most broker results carry no raw payload
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except Exception:
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _long_only_reject_error(exchange_id: str, signal_type: str) -> str:
+    """pending_orders.last_error for a signal a long-only broker cannot place."""
+    if "short" in signal_type:
+        return "ibkr_stock_short_not_supported" if exchange_id == "ibkr" else f"{exchange_id}_short_not_supported"
+    return f"{exchange_id}_unsupported_signal:{signal_type}"
+
+
+def notify_new_order() -> None:
+    """Wake the in-process PendingOrderWorker after a pending order was committed."""
+    _WAKE_EVENT.set()
+
+
+def _order_mode_defaults() -> Tuple[str, float, float]:
+    """(ORDER_MODE, MAKER_WAIT_SEC, MAKER_OFFSET_BPS) from the environment, parsed once per settings reload."""
+    global _ORDER_MODE_DEFAULTS
+    defaults = _ORDER_MODE_DEFAULTS
+    if defaults is None:
+        defaults = _ORDER_MODE_DEFAULTS = (
+            sys.intern(os.getenv("ORDER_MODE", "market").strip().lower()),
+            float(os.getenv("MAKER_WAIT_SEC", "10")),
+            float(os.getenv("MAKER_OFFSET_BPS", "2")),
+        )
+    return defaults
+
+
+def _store_raw_phases() -> bool:
+    """PENDING_ORDER_RAW_PHASES: persist full exchange responses for successful orders too."""
+    global _STORE_RAW_PHASES
+    if _STORE_RAW_PHASES is None:
+        _STORE_RAW_PHASES = os.getenv("PENDING_ORDER_RAW_PHASES", "false").strip().lower() in ("1", "true", "yes")
+    return _STORE_RAW_PHASES
+
+
+def clear_runtime_env_cache() -> None:
+    global _ORDER_MODE_DEFAULTS, _STORE_RAW_PHASES
+    _ORDER_MODE_DEFAULTS = None
+    _STORE_RAW_PHASES = None
 
 
 def _position_sync_fd_backoff_sec() -> float:
@@ -137,12 +241,62 @@ class PendingOrderWorker:
             self._stale_processing_sec = int(os.getenv("PENDING_ORDER_STALE_SEC", "90"))
         except Exception:
             self._stale_processing_sec = 90
+        try:
+            self._stale_requeue_interval_sec = float(os.getenv("PENDING_ORDER_REQUEUE_INTERVAL_SEC", "15"))
+        except Exception:
+            self._stale_requeue_interval_sec = 15.0
+        self._last_stale_requeue_ts = 0.0
+        self._last_alpaca_requeue_ts = 0.0
+
+        # Short-lived per-strategy config cache: position sync and dispatch otherwise
+        # re-query the strategy row and decrypt its credentials on every pass.
+        try:
+            self._strategy_cfg_ttl_sec = float(os.getenv("STRATEGY_CFG_TTL_SEC", "30"))
+        except Exception:
+            self._strategy_cfg_ttl_sec = 30.0
+        self._strategy_cfg_cache: Dict[int, Tuple[float, Dict[str, Any], Dict[str, Any]]] = {}
+        self._strategy_cfg_lock = threading.Lock()
+        # (expires_at, strategy_name, decoded notification_config) for notification fallbacks.
+        self._strategy_meta_cache: Dict[int, Tuple[float, str, Dict[str, Any]]] = {}
 
         # Position sync self-check (best-effort): keep local positions aligned with exchange.
         self._position_sync_enabled = os.getenv("POSITION_SYNC_ENABLED", "true").lower() == "true"
         self._position_sync_interval_sec = float(os.getenv("POSITION_SYNC_INTERVAL_SEC", "30"))
         self._last_position_sync_ts = 0.0
-        logger.info(f"PendingOrderWorker: sync_enabled={self._position_sync_enabled}, interval={self._position_sync_interval_sec}s")
+        self._position_sync_leased = False
+        try:
+            sync_workers = max(1, int(os.getenv("POSITION_SYNC_MAX_WORKERS", "8")))
+        except Exception:
+            sync_workers = 8
+        self._sync_pool = ThreadPoolExecutor(max_workers=sync_workers, thread_name_prefix="pos-sync")
+        try:
+            dispatch_workers = max(1, int(os.getenv("PENDING_ORDER_DISPATCH_WORKERS", "4")))
+        except Exception:
+            dispatch_workers = 4
+        self._dispatch_pool = ThreadPoolExecutor(max_workers=dispatch_workers, thread_name_prefix="order-dispatch")
+
+        # Claim loops per process. Each claims its share of batch_size with SKIP LOCKED; a
+        # strategy with orders in flight on one loop is excluded from the others' claims so
+        # its orders still execute in queue order.
+        try:
+            self._loop_count = max(1, int(os.getenv("PENDING_ORDER_WORKERS", "1")))
+        except Exception:
+            self._loop_count = 1
+        self._threads: List[threading.Thread] = []
+        self._claim_lock = threading.Lock()
+        self._inflight_strategies: Dict[int, int] = {}
+        # Strategies dispatch in parallel; within this process, order submits of different
+        # strategies on the same instrument still go out one at a time (see _instrument_lock).
+        self._instrument_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # Per dispatch thread: order id -> attempts value of the claim being dispatched. A
+        # requeued row re-claimed by another loop gets a new attempts value, so status writes
+        # guarded by it can't land on the other claim.
+        self._claim_tokens = threading.local()
+        logger.info(
+            "PendingOrderWorker: sync_enabled=%s, interval=%ss",
+            self._position_sync_enabled,
+            self._position_sync_interval_sec,
+        )
 
     def start(self) -> bool:
         with self._lock:
@@ -159,51 +313,229 @@ class PendingOrderWorker:
             if self._thread and self._thread.is_alive():
                 return True
             self._stop_event.clear()
-            self._thread = threading.Thread(target=self._run_loop, name="PendingOrderWorker", daemon=True)
-            self._thread.start()
-            logger.info("PendingOrderWorker started")
+            self._threads = []
+            for i in range(self._loop_count):
+                # Loop 0 is the leader: it alone runs Alpaca sync and position sync.
+                th = threading.Thread(
+                    target=self._run_loop,
+                    kwargs={"leader": i == 0},
+                    name="PendingOrderWorker" if i == 0 else f"PendingOrderWorker-{i}",
+                    daemon=True,
+                )
+                th.start()
+                self._threads.append(th)
+            self._thread = self._threads[0]
+            logger.info("PendingOrderWorker started (loops=%s)", self._loop_count)
             return True
 
     def stop(self, timeout_sec: float = 5.0) -> None:
         with self._lock:
             self._stop_event.set()
-            th = self._thread
-        if th and th.is_alive():
-            th.join(timeout=timeout_sec)
+            _WAKE_EVENT.set()
+            threads = list(self._threads) or ([self._thread] if self._thread else [])
+        deadline = time.monotonic() + timeout_sec
+        for th in threads:
+            if th.is_alive():
+                th.join(timeout=max(0.0, deadline - time.monotonic()))
+        wait_for_live_notifications(timeout=max(0.0, deadline - time.monotonic()))
+        if self._position_sync_leased:
+            # Hand position sync to another process now rather than after the lease expires.
+            try:
+                self._release_position_sync_lease()
+            except Exception as e:
+                logger.debug("position sync lease release failed: %s", e)
         logger.info("PendingOrderWorker stopped")
 
-    def _run_loop(self) -> None:
+    def _run_loop(self, leader: bool = True) -> None:
         while not self._stop_event.is_set():
+            # Clear before the tick so an order enqueued mid-tick still wakes the next wait.
+            # Only the leader listens for wake-ups; extra loops just poll.
+            if leader:
+                _WAKE_EVENT.clear()
             try:
-                self._tick()
+                self._tick(leader=leader)
             except Exception as e:
                 logger.warning(f"PendingOrderWorker tick error: {e}")
-            time.sleep(self.poll_interval_sec)
+            if leader:
+                _WAKE_EVENT.wait(timeout=self.poll_interval_sec)
+            else:
+                self._stop_event.wait(timeout=self.poll_interval_sec)
 
-    def _tick(self) -> None:
-        # logger.info(f"[PendingOrderWorker] _tick start. last_sync={self._last_position_sync_ts}")
-        self._sync_alpaca_sent_orders()
-        orders = self._fetch_pending_orders(limit=self.batch_size)
-        # logger.info(f"[PendingOrderWorker] orders fetched: {len(orders)}")
+    def _tick(self, leader: bool = True) -> None:
+        if leader:
+            self._sync_alpaca_sent_orders()
+        limit = max(1, self.batch_size // self._loop_count)
+        orders = self._claim_pending_orders(limit=limit)
         if not orders:
-            self._maybe_sync_positions()
+            if leader:
+                self._maybe_sync_positions()
             return
+        self._dispatch_claimed(orders)
+        if leader:
+            self._maybe_sync_positions()
 
+    def _dispatch_claimed(self, orders: List[Dict[str, Any]]) -> None:
+        # Orders of one strategy stay sequential (open/close order matters); different
+        # strategies dispatch in parallel so slow notifier / exchange calls overlap.
+        by_strategy: Dict[int, List[Dict[str, Any]]] = {}
         for o in orders:
-            oid = o.get("id")
-            if not oid:
-                continue
+            if o.get("id"):
+                by_strategy.setdefault(int(o.get("strategy_id") or 0), []).append(o)
+        groups = list(by_strategy.values())
+        # Rows without an id never reach a group; hand their strategies back right away.
+        orphans = [o for o in orders if int(o.get("strategy_id") or 0) not in by_strategy]
+        if orphans:
+            self._release_strategies(orphans)
+        strategy_meta = self._prefetch_strategy_meta(orders)
+        if len(groups) <= 1:
+            for group in groups:
+                self._run_group(group, strategy_meta)
+        else:
+            wait([self._dispatch_pool.submit(self._run_group, group, strategy_meta) for group in groups])
 
-            # Mark processing (best-effort)
-            if not self._mark_processing(order_id=int(oid)):
-                continue
+    def _run_group(self, orders: List[Dict[str, Any]], strategy_meta: Optional[Dict[int, Dict[str, Any]]] = None) -> None:
+        # Each strategy is released as soon as its own group finishes, so another claim loop can
+        # pick up its next orders while slower strategies of this batch are still waiting on fills.
+        try:
+            self._dispatch_group(orders, strategy_meta)
+        finally:
+            self._release_strategies(orders)
+
+    def _release_strategies(self, orders: List[Dict[str, Any]]) -> None:
+        """Let other claim loops pick up these orders' strategies again."""
+        with self._claim_lock:
+            for sid in {int(o.get("strategy_id") or 0) for o in orders}:
+                left = self._inflight_strategies.get(sid, 0) - 1
+                if left > 0:
+                    self._inflight_strategies[sid] = left
+                else:
+                    self._inflight_strategies.pop(sid, None)
 
-            try:
-                self._dispatch_one(o)
-            except Exception as e:
-                self._mark_failed(order_id=int(oid), error=str(e))
+    def _dispatch_group(self, orders: List[Dict[str, Any]], strategy_meta: Optional[Dict[int, Dict[str, Any]]] = None) -> None:
+        # Signal-mode notifications are collected and sent together (one Telegram message per chat).
+        signal_jobs: List[Dict[str, Any]] = []
+        self._claim_tokens.by_id = {int(o["id"]): int(o["attempts"]) for o in orders if o.get("attempts") is not None}
+        try:
+            for o in orders:
+                if not self._begin_dispatch(int(o["id"])):
+                    continue
+                try:
+                    self._dispatch_one(o, strategy_meta=strategy_meta, signal_jobs=signal_jobs)
+                except Exception as e:
+                    self._mark_failed(order_id=int(o["id"]), error=str(e))
+            if signal_jobs:
+                self._record_signal_batch(signal_jobs)
+        finally:
+            self._claim_tokens.by_id = {}
+
+    def _claim_token(self, order_id: int) -> Optional[int]:
+        """attempts value of this thread's claim on ``order_id``; None outside a dispatch."""
+        return getattr(self._claim_tokens, "by_id", {}).get(int(order_id))
+
+    def _record_signal_batch(self, signal_jobs: List[Dict[str, Any]]) -> None:
+        try:
+            if len(signal_jobs) == 1:
+                all_results = [self._notifier.notify_signal(**signal_jobs[0]["notify"])]
+            else:
+                all_results = self._notifier.notify_signal_batch([job["notify"] for job in signal_jobs])
+        except Exception as e:
+            all_results, batch_error = None, str(e)
+        # One commit for the whole batch's status transitions instead of one per order;
+        # each order's writes still fail independently through a savepoint.
+        try:
+            with db_transaction():
+                for i, job in enumerate(signal_jobs):
+                    try:
+                        if all_results is None:
+                            self._mark_failed(order_id=job["order_id"], error=batch_error)
+                        elif i < len(all_results):
+                            self._record_signal_results(job, all_results[i])
+                    except Exception as e:
+                        logger.warning("signal result record failed: pending_id=%s, err=%s", job["order_id"], e)
+        except Exception as e:
+            logger.warning("signal batch status commit failed: orders=%s, err=%s", len(signal_jobs), e)
 
-        self._maybe_sync_positions()
+    def _begin_dispatch(self, order_id: int) -> bool:
+        """Re-stamp a claimed row as its dispatch starts; False when it is no longer ours.
+
+        Rows wait in their strategy group (or for a dispatch thread) after the batch claim.
+        Refreshing updated_at here keeps the stale requeue from handing a row that is about
+        to execute to another claim, and a row that was already requeued (and possibly
+        re-claimed, which bumps attempts) is skipped.
+        """
+        try:
+            with get_db_connection() as db:
+                cur = db.cursor()
+                cur.execute_prepared(
+                    "qd_pending_begin_dispatch",
+                    """
+                    UPDATE pending_orders SET updated_at = NOW()
+                    WHERE id = $1::int
+                      AND status = 'processing'
+                      AND ($2::int IS NULL OR attempts = $2::int)
+                    """,
+                    (int(order_id), self._claim_token(order_id)),
+                )
+                touched = cur.rowcount
+                db.commit()
+                cur.close()
+        except Exception as e:
+            logger.warning("begin_dispatch failed: pending_id=%s, err=%s", order_id, e)
+            return False
+        if touched <= 0:
+            logger.info("pending order %s is no longer processing (requeued or finished); skipped", order_id)
+            return False
+        return True
+
+    def _strategy_cfg(self, strategy_id: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return (strategy configs, resolved exchange config), cached for STRATEGY_CFG_TTL_SEC."""
+        sid = int(strategy_id)
+        now = time.time()
+        with self._strategy_cfg_lock:
+            hit = self._strategy_cfg_cache.get(sid)
+        if hit and hit[0] > now:
+            return dict(hit[1]), dict(hit[2])
+        sc = load_strategy_configs(sid)
+        exchange_config = resolve_exchange_config(sc.get("exchange_config") or {}, user_id=int(sc.get("user_id") or 1))
+        if self._strategy_cfg_ttl_sec > 0:
+            with self._strategy_cfg_lock:
+                if len(self._strategy_cfg_cache) >= 2048:
+                    self._strategy_cfg_cache.clear()
+                self._strategy_cfg_cache[sid] = (now + self._strategy_cfg_ttl_sec, sc, exchange_config)
+        return dict(sc), dict(exchange_config)
+
+    def invalidate_strategy_cfg(self, strategy_id: Optional[int] = None) -> None:
+        """Drop cached config and name / notification meta for one strategy (or all when None)."""
+        with self._strategy_cfg_lock:
+            if strategy_id is None:
+                self._strategy_cfg_cache.clear()
+                self._strategy_meta_cache.clear()
+            else:
+                self._strategy_cfg_cache.pop(int(strategy_id), None)
+                self._strategy_meta_cache.pop(int(strategy_id), None)
+
+    def _strategy_meta(self, strategy_id: int) -> Tuple[str, Dict[str, Any]]:
+        """(strategy_name, notification_config) for one strategy, cached for STRATEGY_CFG_TTL_SEC."""
+        sid = int(strategy_id)
+        now = time.time()
+        with self._strategy_cfg_lock:
+            hit = self._strategy_meta_cache.get(sid)
+        if hit and hit[0] > now:
+            return hit[1], copy.deepcopy(hit[2])
+        with get_db_connection() as db:
+            cur = db.cursor()
+            cur.execute_prepared("qd_strategy_meta", _SQL_STRATEGY_META, (sid,))
+            row = cur.fetchone() or {}
+            cur.close()
+        name = str(row.get("strategy_name") or "").strip()
+        raw_cfg = row.get("notification_config") or ""
+        cfg = raw_cfg if isinstance(raw_cfg, dict) else _loads_json_dict(raw_cfg)
+        if row and self._strategy_cfg_ttl_sec > 0:
+            with self._strategy_cfg_lock:
+                if len(self._strategy_meta_cache) >= 2048:
+                    self._strategy_meta_cache.clear()
+                self._strategy_meta_cache[sid] = (now + self._strategy_cfg_ttl_sec, name, cfg)
+        return name, copy.deepcopy(cfg)
 
     def _maybe_sync_positions(self) -> None:
         if not self._position_sync_enabled:
@@ -213,12 +545,57 @@ class PendingOrderWorker:
             return
         if now - float(self._last_position_sync_ts or 0.0) < float(self._position_sync_interval_sec):
             return
-        logger.debug(f"[PendingOrderWorker] Triggering sync... (now={now}, last={self._last_position_sync_ts})")
+        logger.debug("[PendingOrderWorker] Triggering sync... (now=%s, last=%s)", now, self._last_position_sync_ts)
         self._last_position_sync_ts = now
+        try:
+            self._position_sync_leased = self._acquire_position_sync_lease()
+        except Exception as e:
+            logger.debug("position sync skipped: lease unavailable: %s", e)
+            return
+        if not self._position_sync_leased:
+            logger.debug("position sync skipped: another process holds the sync lease")
+            return
         try:
             self._sync_positions_best_effort()
         except Exception as e:
-            logger.debug(f"position sync skipped/failed: {e}")
+            logger.debug("position sync failed: %s", e)
+        try:
+            # Renew after the sync too, so a sync longer than an interval keeps the lease.
+            self._acquire_position_sync_lease()
+        except Exception as e:
+            logger.debug("position sync lease renew failed: %s", e)
+
+    def _acquire_position_sync_lease(self) -> bool:
+        """Take or renew the position sync lease for two intervals; False if another owner holds it."""
+        with get_db_connection() as db:
+            cur = db.cursor()
+            cur.execute(
+                """
+                INSERT INTO strategy_runtime_locks (lock_key, owner, expires_at, updated_at)
+                VALUES (%s, %s, NOW() + make_interval(secs => %s), NOW())
+                ON CONFLICT (lock_key) DO UPDATE
+                SET owner = EXCLUDED.owner, expires_at = EXCLUDED.expires_at, updated_at = NOW()
+                WHERE strategy_runtime_locks.owner = EXCLUDED.owner
+                   OR strategy_runtime_locks.expires_at IS NULL
+                   OR strategy_runtime_locks.expires_at < NOW()
+                RETURNING owner
+                """,
+                (_POSITION_SYNC_LEASE_KEY, _POSITION_SYNC_LEASE_OWNER, 2 * float(self._position_sync_interval_sec)),
+            )
+            row = cur.fetchone()
+            db.commit()
+            cur.close()
+        return bool(row)
+
+    def _release_position_sync_lease(self) -> None:
+        with get_db_connection() as db:
+            cur = db.cursor()
+            cur.execute(
+                "DELETE FROM strategy_runtime_locks WHERE lock_key = %s AND owner = %s",
+                (_POSITION_SYNC_LEASE_KEY, _POSITION_SYNC_LEASE_OWNER),
+            )
+            db.commit()
+            cur.close()
 
     def _sync_positions_best_effort(self, target_strategy_id: Optional[int] = None) -> None:
         """
@@ -233,7 +610,7 @@ class PendingOrderWorker:
             return
 
         # 1) Load local positions (filtered if target_strategy_id is provided).
-        logger.debug(f"[PositionSync] Entering _sync_positions_best_effort for target={target_strategy_id}")
+        logger.debug("[PositionSync] Entering _sync_positions_best_effort for target=%s", target_strategy_id)
         with get_db_connection() as db:
             cur = db.cursor()
             if target_strategy_id:
@@ -277,7 +654,7 @@ class PendingOrderWorker:
                 active_rows = cur.fetchall() or []
                 cur.close()
             
-            logger.debug(f"[PositionSync] Found {len(active_rows)} active live strategies in DB.")
+            logger.debug("[PositionSync] Found %s active live strategies in DB.", len(active_rows))
             for _ar in active_rows:
                 _sid = int(_ar.get("id") or 0)
                 if _sid <= 0 or should_skip_position_sync(_sid):
@@ -289,70 +666,61 @@ class PendingOrderWorker:
         except Exception as e:
             logger.error(f"Failed to load active strategies for sync: {e}", exc_info=True)
 
-        # 2) Reconcile per strategy
-        for sid, plist in sid_to_rows.items():
-            if target_strategy_id and sid != target_strategy_id:
-                continue
-            if should_skip_position_sync(int(sid)):
-                continue
-            try:
-                sc = load_strategy_configs(int(sid))
-                exec_mode = (sc.get("execution_mode") or "").strip().lower()
-                bot_type = str(
-                    sc.get("bot_type")
-                    or (sc.get("trading_config") or {}).get("bot_type")
-                    or ""
-                ).strip().lower()
-                if strategy_uses_fill_ledger(sc):
-                    logger.debug(
-                        "[PositionSync] Strategy %s skipped: fill-ledger strategy (L3)",
-                        sid,
-                    )
-                    continue
-                # Signal-mode strategies only sync when explicitly targeted.
-                # This catches positions closed manually on the exchange.
-                if exec_mode != "live" and not target_strategy_id:
-                    logger.debug(f"[PositionSync] Strategy {sid} skipped: execution_mode='{exec_mode}' (needs 'live' or explicit target)")
-                    continue
-                sync_user_id = int(sc.get("user_id") or 1)
-                exchange_config = resolve_exchange_config(sc.get("exchange_config") or {}, user_id=sync_user_id)
-                safe_cfg = safe_exchange_config_for_log(exchange_config)
-                
-                # Signal mode may not have an exchange configured.
-                exchange_id = str(exchange_config.get("exchange_id") or "").strip().lower()
-                if not exchange_id:
-                    logger.debug(f"[PositionSync] Strategy {sid} skipped: exchange_id is empty (signal mode or no exchange config)")
-                    continue
+        # 2) Reconcile per strategy. Each one is an independent exchange round-trip, so with
+        # several live strategies they run concurrently on the worker's sync pool.
+        sids = [
+            sid for sid in sid_to_rows
+            if not (target_strategy_id and sid != target_strategy_id) and not should_skip_position_sync(int(sid))
+        ]
+        if len(sids) <= 1:
+            for sid in sids:
+                self._reconcile_strategy_positions(sid, target_strategy_id)
+            return
+        wait([self._sync_pool.submit(self._reconcile_strategy_positions, sid, target_strategy_id) for sid in sids])
+
+    def _reconcile_strategy_positions(self, sid: int, target_strategy_id: Optional[int] = None) -> bool:
+        """Reconcile one strategy against its exchange. Returns False when the whole pass must stop."""
+        if _is_position_sync_fd_backoff_active():
+            return False
+        try:
+            sc, exchange_config = self._strategy_cfg(int(sid))
+            exec_mode = (sc.get("execution_mode") or "").strip().lower()
+            bot_type = str(
+                sc.get("bot_type")
+                or (sc.get("trading_config") or {}).get("bot_type")
+                or ""
+            ).strip().lower()
+            if strategy_uses_fill_ledger(sc):
+                logger.debug(
+                    "[PositionSync] Strategy %s skipped: fill-ledger strategy (L3)",
+                    sid,
+                )
+                return True
+            # Signal-mode strategies only sync when explicitly targeted.
+            # This catches positions closed manually on the exchange.
+            if exec_mode != "live" and not target_strategy_id:
+                logger.debug(
+                    "[PositionSync] Strategy %s skipped: execution_mode='%s' (needs 'live' or explicit target)",
+                    sid,
+                    exec_mode,
+                )
+                return True
+            sync_user_id = int(sc.get("user_id") or 1)
+            # Signal mode may not have an exchange configured.
+            exchange_id = str(exchange_config.get("exchange_id") or "").strip().lower()
+            if not exchange_id:
+                logger.debug("[PositionSync] Strategy %s skipped: exchange_id is empty (signal mode or no exchange config)", sid)
+                return True
                 
-                market_type = (sc.get("market_type") or exchange_config.get("market_type") or "swap")
-                market_type = str(market_type or "swap").strip().lower()
-                if market_type in ("futures", "future", "perp", "perpetual"):
-                    market_type = "swap"
+            market_type = canonical_market_type(str(sc.get("market_type") or exchange_config.get("market_type") or "swap"))
                 
-                # Get strategy's trading symbol(s) to filter positions
-                # Only sync positions for symbols that this strategy actually trades
-                allowed_symbols = strategy_allowed_symbols(sc)
-
-                # Lazy import IBKR / Alpaca clients here so the elif chain
-                # below can rely on isinstance() checks without paying the import
-                # cost on systems that don't ship those broker libs.
-                global IBKRClient
-                if IBKRClient is None:
-                    try:
-                        from app.services.ibkr_trading import IBKRClient as _IBKRClient
-                        IBKRClient = _IBKRClient
-                    except ImportError:
-                        pass
-
-                global AlpacaClient
-                if AlpacaClient is None:
-                    try:
-                        from app.services.alpaca_trading import AlpacaClient as _AlpacaClient
-                        AlpacaClient = _AlpacaClient
-                    except ImportError:
-                        pass
+            # Get strategy's trading symbol(s) to filter positions
+            # Only sync positions for symbols that this strategy actually trades
+            allowed_symbols = strategy_allowed_symbols(sc)
 
-                cache_key = position_sync_cache_key(sync_user_id, exchange_id, market_type, exchange_config)
+            cache_key = position_sync_cache_key(sync_user_id, exchange_id, market_type, exchange_config)
+            # Strategies sharing one account wait here and reuse the snapshot the first one fetched.
+            with position_sync_fetch_lock(cache_key):
                 cached_snap = get_position_sync_snapshot(cache_key)
                 exch_size: Dict[str, Dict[str, float]] = {}
                 exch_entry_price: Dict[str, Dict[str, float]] = {}
@@ -368,7 +736,7 @@ class PendingOrderWorker:
                             exchange_id,
                             cache_key,
                         )
-                        continue
+                        return True
 
                     # Try to create the client; skip strategies with invalid exchange config.
                     try:
@@ -384,366 +752,48 @@ class PendingOrderWorker:
                             auto_stop_live_strategy(int(sid), msg, source="position_sync_client")
                         else:
                             logger.debug(
-                                f"[PositionSync] Strategy {sid} skipped: failed to create client (exchange_id={exchange_id}): {e}"
+                                "[PositionSync] Strategy %s skipped: failed to create client (exchange_id=%s): %s",
+                                sid,
+                                exchange_id,
+                                e,
                             )
-                        continue
+                        return True
 
-                    if isinstance(client, BinanceFuturesClient) and market_type == "swap":
-                        try:
-                            all_pos = client.get_positions() or []
-                        except Exception as e:
-                            msg = str(e)
-                            if is_file_descriptor_exhausted(e):
-                                set_exchange_sync_backoff(cache_key, seconds=_position_sync_fd_backoff_sec())
-                                _activate_position_sync_fd_backoff(msg)
-                                return
-                            if is_fatal_exchange_error(msg):
-                                logger.error(f"[PositionSync] Strategy {sid} fatal auth error; auto-stopping. error={msg}")
-                                auto_stop_live_strategy(int(sid), msg, source="position_sync_binance")
-                                continue
-                            if is_exchange_rate_limit_error(msg):
-                                set_exchange_sync_backoff(cache_key)
-                                logger.error(
-                                    "[PositionSync] Binance rate limit for key=%s; backing off %ss. error=%s",
-                                    cache_key,
-                                    int(exchange_sync_backoff_sec()),
-                                    msg,
-                                )
-                                continue
-                            logger.error(f"[PositionSync] Strategy {sid} get_positions failed: {msg}", exc_info=True)
-                            continue
-                        if isinstance(all_pos, dict) and "raw" in all_pos:
-                            all_pos = all_pos["raw"]
-
-                        if isinstance(all_pos, list):
-                            for p in all_pos:
-                                sym = str(p.get("symbol") or "").strip().upper()
-                                try:
-                                    amt = float(p.get("positionAmt") or 0.0)
-                                    ep = float(p.get("entryPrice") or 0.0)
-                                except Exception:
-                                    amt = 0.0
-                                    ep = 0.0
-                                if not sym or abs(amt) <= 0:
-                                    continue
-                                hb_sym = sym
-                                if hb_sym.endswith("USDT") and len(hb_sym) > 4 and "/" not in hb_sym:
-                                    hb_sym = f"{hb_sym[:-4]}/USDT"
-                                side = "long" if amt > 0 else "short"
-                                exch_size.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = abs(float(amt))
-                                exch_entry_price.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = abs(float(ep))
-
-
-                    elif isinstance(client, OkxClient) and market_type == "swap":
-                        try:
-                            resp = client.get_positions()
-                        except Exception as e:
-                            # Fatal auth/config errors should auto-stop the strategy to avoid endless spam.
-                            # Typical OKX response: HTTP 401 {"msg":"Invalid OK-ACCESS-KEY","code":"50111"}
-                            msg = str(e)
-                            m = msg.lower()
-                            if is_file_descriptor_exhausted(e):
-                                set_exchange_sync_backoff(cache_key, seconds=_position_sync_fd_backoff_sec())
-                                _activate_position_sync_fd_backoff(msg)
-                                return
-                            if is_fatal_exchange_error(msg):
-                                logger.error(f"[PositionSync] Strategy {sid} fatal auth error; auto-stopping. error={msg}")
-                                auto_stop_live_strategy(int(sid), msg, source="position_sync_okx")
-                                continue
-                            # Non-fatal: keep syncing other strategies, but don't crash the worker loop.
-                            logger.error(f"[PositionSync] Strategy {sid} get_positions failed: {msg}", exc_info=True)
-                            continue
-                        data = (resp.get("data") or []) if isinstance(resp, dict) else []
-                        if isinstance(data, list):
-                            for p in data:
-                                inst_id = str(p.get("instId") or "")
-                                pos_side = str(p.get("posSide") or "").lower()
-                                try:
-                                    pos = float(p.get("pos") or 0.0)
-                                except Exception:
-                                    pos = 0.0
-                                if not inst_id or abs(pos) <= 0:
-                                    continue
-                                # instId: BTC-USDT-SWAP -> BTC/USDT
-                                hb_sym = inst_id.replace("-SWAP", "").replace("-", "/")
-                                if pos_side == "long":
-                                    side = "long"
-                                elif pos_side == "short":
-                                    side = "short"
-                                elif pos_side == "net":
-                                    side = "long" if pos > 0 else "short"
-                                else:
-                                    side = "long" if pos > 0 else "short"
-                                # IMPORTANT: OKX swap positions `pos` is in contracts, but our system uses base-asset quantity.
-                                # Convert contracts -> base using ctVal when available.
-                                qty_base = abs(float(pos))
-                                try:
-                                    inst = client.get_instrument(inst_type="SWAP", inst_id=inst_id) or {}
-                                    ct_val = float(inst.get("ctVal") or 0.0)
-                                    if ct_val > 0:
-                                        qty_base = qty_base * ct_val
-                                except Exception:
-                                    pass
-                                exch_size.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = float(qty_base)
-                                exch_inst_id.setdefault(hb_sym, {"long": "", "short": ""})[side] = inst_id
-
-                                # Extract entry price from OKX position data
-                                # OKX API returns avgPx (average price) or avgPxEp (average price in equity) for positions
-                                try:
-                                    # Try avgPx first (average entry price)
-                                    avg_px = p.get("avgPx")
-                                    if avg_px:
-                                        entry_price = float(avg_px)
-                                    else:
-                                        # Fallback to avgPxEp (average price in equity)
-                                        avg_px_ep = p.get("avgPxEp")
-                                        if avg_px_ep:
-                                            entry_price = float(avg_px_ep)
-                                        else:
-                                            # Fallback to last price if available
-                                            last_px = p.get("last")
-                                            entry_price = float(last_px) if last_px else 0.0
-                                
-                                    if entry_price > 0:
-                                        exch_entry_price.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = entry_price
-                                        logger.debug(f"[PositionSync] OKX {hb_sym} {side}: entry_price={entry_price} from avgPx={p.get('avgPx')} or avgPxEp={p.get('avgPxEp')}")
-                                    else:
-                                        logger.warning(f"[PositionSync] OKX {hb_sym} {side}: Could not extract entry price from position data: {p}")
-                                except Exception as e:
-                                    logger.warning(f"[PositionSync] Failed to extract entry price for OKX {hb_sym} {side}: {e}")
-                                    # Don't set entry_price, will remain 0.0
-
-                    elif isinstance(client, BitgetMixClient) and market_type == "swap":
-                        product_type = str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
-                        resp = client.get_positions(product_type=product_type)
-                        data = resp.get("data") if isinstance(resp, dict) else None
-                        if isinstance(data, list):
-                            for p in data:
-                                sym = str(p.get("symbol") or "")
-                                hold_side = str(p.get("holdSide") or "").lower()
-                                try:
-                                    total = float(p.get("total") or 0.0)
-                                except Exception:
-                                    total = 0.0
-                                if not sym or abs(total) <= 0:
-                                    continue
-                                hb_sym = sym.upper()
-                                if hb_sym.endswith("USDT") and len(hb_sym) > 4 and "/" not in hb_sym:
-                                    hb_sym = f"{hb_sym[:-4]}/USDT"
-                                side = "long" if hold_side == "long" else "short"
-                                exch_size.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = abs(float(total))
-                                try:
-                                    ep = float(p.get("openPriceAvg") or p.get("averageOpenPrice") or 0.0)
-                                    if ep > 0:
-                                        exch_entry_price.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = ep
-                                except Exception:
-                                    pass
-
-                    elif isinstance(client, BybitClient) and market_type == "swap":
-                        # Bybit v5 requires symbol or settleCoin; use USDT for full linear book.
-                        resp = client.get_positions(settle_coin="USDT")
-                        lst = (((resp.get("result") or {}).get("list")) if isinstance(resp, dict) else None) or []
-                        if isinstance(lst, list):
-                            for p in lst:
-                                if not isinstance(p, dict):
-                                    continue
-                                sym = str(p.get("symbol") or "").strip().upper()
-                                side0 = str(p.get("side") or "").strip().lower()  # Buy/Sell
-                                try:
-                                    sz = float(p.get("size") or 0.0)
-                                except Exception:
-                                    sz = 0.0
-                                if not sym or abs(sz) <= 0:
-                                    continue
-                                hb_sym = sym
-                                if hb_sym.endswith("USDT") and len(hb_sym) > 4 and "/" not in hb_sym:
-                                    hb_sym = f"{hb_sym[:-4]}/USDT"
-                                side = "long" if side0 == "buy" else ("short" if side0 == "sell" else ("long" if sz > 0 else "short"))
-                                exch_size.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = abs(float(sz))
-                                try:
-                                    ep = float(p.get("avgPrice") or p.get("entryPrice") or 0.0)
-                                    if ep > 0:
-                                        exch_entry_price.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = ep
-                                except Exception:
-                                    pass
-
-                    elif isinstance(client, GateUsdtFuturesClient) and market_type == "swap":
-                        resp = client.get_positions()
-                        items = resp if isinstance(resp, list) else []
-                        if isinstance(items, list):
-                            for p in items:
-                                if not isinstance(p, dict):
-                                    continue
-                                contract = str(p.get("contract") or "").strip()
-                                try:
-                                    sz_ct = float(p.get("size") or 0.0)  # contracts, signed
-                                except Exception:
-                                    sz_ct = 0.0
-                                if not contract or abs(sz_ct) <= 0:
-                                    continue
-                                hb_sym = contract.replace("_", "/")
-                                side = "long" if sz_ct > 0 else "short"
-                                # Convert contracts -> base using quanto_multiplier.
-                                qty_base = abs(sz_ct)
-                                try:
-                                    meta = client.get_contract(contract=contract) or {}
-                                    qm = float(meta.get("quanto_multiplier") or meta.get("contract_size") or 0.0)
-                                    if qm > 0:
-                                        qty_base = qty_base * qm
-                                except Exception:
-                                    pass
-                                exch_size.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = float(qty_base)
-                                try:
-                                    ep = float(p.get("entry_price") or p.get("open_price") or 0.0)
-                                    if ep > 0:
-                                        exch_entry_price.setdefault(hb_sym, {"long": 0.0, "short": 0.0})[side] = ep
-                                except Exception:
-                                    pass
-
-                    elif isinstance(client, KrakenFuturesClient) and market_type == "swap":
-                        resp = client.get_open_positions()
-                        positions = (resp.get("openPositions") if isinstance(resp, dict) else None) or (resp.get("open_positions") if isinstance(resp, dict) else None) or []
-                        if isinstance(positions, list):
-                            for p in positions:
-                                if not isinstance(p, dict):
-                                    continue
-                                sym = str(p.get("symbol") or p.get("instrument") or "").strip()
-                                try:
-                                    sz = float(p.get("size") or p.get("positionSize") or 0.0)
-                                except Exception:
-                                    sz = 0.0
-                                if not sym or abs(sz) <= 0:
-                                    continue
-                                side = "long" if sz > 0 else "short"
-                                exch_size.setdefault(sym, {"long": 0.0, "short": 0.0})[side] = abs(float(sz))
-                                try:
-                                    ep = float(p.get("price") or p.get("avgPrice") or 0.0)
-                                    if ep > 0:
-                                        exch_entry_price.setdefault(sym, {"long": 0.0, "short": 0.0})[side] = ep
-                                except Exception:
-                                    pass
-
-                    elif IBKRClient is not None and isinstance(client, IBKRClient):
-                        # IBKR US-stock positions. `quantity` is signed: >0 = long, <0 = short.
-                        # We currently only enforce long-only entries (see _execute_ibkr_order),
-                        # but still mirror short rows so reconciliation does not orphan them
-                        # if the user had pre-existing inventory in TWS.
-                        try:
-                            positions = client.get_positions() or []
-                        except Exception as e:
-                            msg = str(e)
-                            if is_file_descriptor_exhausted(e):
-                                set_exchange_sync_backoff(cache_key, seconds=_position_sync_fd_backoff_sec())
-                                _activate_position_sync_fd_backoff(msg)
-                                return
-                            if is_fatal_exchange_error(msg):
-                                logger.error(
-                                    "[PositionSync] Strategy %s IBKR fatal error; auto-stopping. error=%s",
-                                    sid,
-                                    msg,
-                                )
-                                auto_stop_live_strategy(int(sid), msg, source="position_sync_ibkr")
-                            else:
-                                logger.error(f"[PositionSync] Strategy {sid} IBKR get_positions failed: {e}", exc_info=True)
-                            continue
-                        if isinstance(positions, list):
-                            for p in positions:
-                                if not isinstance(p, dict):
-                                    continue
-                                sym = str(p.get("symbol") or p.get("ib_symbol") or "").strip()
-                                try:
-                                    qty = float(p.get("quantity") or 0.0)
-                                except Exception:
-                                    qty = 0.0
-                                try:
-                                    avg = float(p.get("avgCost") or 0.0)
-                                except Exception:
-                                    avg = 0.0
-                                if not sym or abs(qty) <= 0:
-                                    continue
-                                side = "long" if qty > 0 else "short"
-                                exch_size.setdefault(sym, {"long": 0.0, "short": 0.0})[side] = abs(qty)
-                                if avg > 0:
-                                    exch_entry_price.setdefault(sym, {"long": 0.0, "short": 0.0})[side] = avg
-                        # Continue to reconciliation logic below
-
-                    elif AlpacaClient is not None and isinstance(client, AlpacaClient):
-                        # Alpaca positions cover both US stocks and crypto. The client
-                        # already returns a normalized `side` string ("long" / "short")
-                        # plus `quantity` and `avgCost`. Crypto symbols come through as
-                        # "BTC/USD" is the same format the strategy stores, so no extra
-                        # normalization is needed here.
-                        try:
-                            positions = client.get_positions() or []
-                        except Exception as e:
-                            if is_file_descriptor_exhausted(e):
-                                set_exchange_sync_backoff(cache_key, seconds=_position_sync_fd_backoff_sec())
-                                _activate_position_sync_fd_backoff(str(e))
-                                return
-                            logger.error(f"[PositionSync] Strategy {sid} Alpaca get_positions failed: {e}", exc_info=True)
-                            continue
-                        if isinstance(positions, list):
-                            for p in positions:
-                                if not isinstance(p, dict):
-                                    continue
-                                sym = str(p.get("symbol") or "").strip()
-                                try:
-                                    qty = float(p.get("quantity") or 0.0)
-                                except Exception:
-                                    qty = 0.0
-                                try:
-                                    avg = float(p.get("avgCost") or 0.0)
-                                except Exception:
-                                    avg = 0.0
-                                if not sym or abs(qty) <= 0:
-                                    continue
-                                side_str = str(p.get("side") or "").strip().lower()
-                                if side_str not in ("long", "short"):
-                                    side_str = "long" if qty > 0 else "short"
-                                exch_size.setdefault(sym, {"long": 0.0, "short": 0.0})[side_str] = abs(qty)
-                                if avg > 0:
-                                    exch_entry_price.setdefault(sym, {"long": 0.0, "short": 0.0})[side_str] = avg
-                        # Continue to reconciliation logic below
-
-                    elif market_type == "spot":
-                        from app.services.live_trading.spot_wallet_snapshot import list_spot_wallet_positions
-
-                        try:
-                            spot_rows = list_spot_wallet_positions(client) or []
-                        except Exception as e:
-                            if is_file_descriptor_exhausted(e):
-                                set_exchange_sync_backoff(cache_key, seconds=_position_sync_fd_backoff_sec())
-                                _activate_position_sync_fd_backoff(str(e))
-                                return
+                    fetcher = position_fetcher_for(client, market_type)
+                    if fetcher is None:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "position sync: skip unsupported market/client: sid=%s, cfg=%s, market_type=%s, client=%s",
+                                sid,
+                                safe_exchange_config_for_log(exchange_config),
+                                market_type,
+                                type(client),
+                            )
+                        return True
+                    try:
+                        exch_size, exch_entry_price, exch_inst_id = fetcher.fetch(client, exchange_config)
+                    except Exception as e:
+                        msg = str(e)
+                        if is_file_descriptor_exhausted(e):
+                            set_exchange_sync_backoff(cache_key, seconds=_position_sync_fd_backoff_sec())
+                            _activate_position_sync_fd_backoff(msg)
+                            return False
+                        if fetcher.auto_stop_on_fatal and is_fatal_exchange_error(msg):
+                            logger.error(f"[PositionSync] Strategy {sid} fatal auth error; auto-stopping. error={msg}")
+                            auto_stop_live_strategy(int(sid), msg, source=f"position_sync_{fetcher.name}")
+                            return True
+                        if is_exchange_rate_limit_error(msg):
+                            set_exchange_sync_backoff(cache_key)
                             logger.error(
-                                f"[PositionSync] Strategy {sid} spot wallet sync failed: {e}",
-                                exc_info=True,
+                                "[PositionSync] %s rate limit for key=%s; backing off %ss. error=%s",
+                                fetcher.name,
+                                cache_key,
+                                int(exchange_sync_backoff_sec()),
+                                msg,
                             )
-                            continue
-                        for row in spot_rows:
-                            if not isinstance(row, dict):
-                                continue
-                            sym = normalize_strategy_symbol(str(row.get("symbol") or "")) or str(
-                                row.get("symbol") or ""
-                            ).strip()
-                            side = str(row.get("side") or "long").strip().lower()
-                            try:
-                                sz = float(row.get("size") or 0.0)
-                            except Exception:
-                                sz = 0.0
-                            if not sym or side not in ("long", "short") or sz <= 1e-12:
-                                continue
-                            exch_size.setdefault(sym, {"long": 0.0, "short": 0.0})[side] = sz
-                            ep = float(row.get("entry_price") or 0.0)
-                            if ep > 0:
-                                exch_entry_price.setdefault(sym, {"long": 0.0, "short": 0.0})[side] = ep
-                            iid = str(row.get("inst_id") or "")
-                            if iid:
-                                exch_inst_id.setdefault(sym, {"long": "", "short": ""})[side] = iid
-
-                    else:
-                        logger.debug(f"position sync: skip unsupported market/client: sid={sid}, cfg={safe_cfg}, market_type={market_type}, client={type(client)}")
-                        continue
+                            return True
+                        logger.error(f"[PositionSync] Strategy {sid} {fetcher.name} get_positions failed: {msg}", exc_info=True)
+                        return True
 
                     set_position_sync_snapshot(cache_key, exch_size, exch_entry_price, exch_inst_id)
                     try:
@@ -761,36 +811,37 @@ class PendingOrderWorker:
                     except Exception as l1_err:
                         logger.warning("[PositionSync] L1 account sync failed key=%s: %s", cache_key, l1_err)
 
-                # [DEBUG] Log all normalized exchange keys for inspection
-                logger.debug(f"[PositionSync] Strategy {sid} Exchange Keys: {list(exch_size.keys())}")
-
-                # [Log Optimization] Log current positions each sync cycle (see POSITION_SYNC_INTERVAL_SEC)
+            # [Log Optimization] Log current positions each sync cycle (see POSITION_SYNC_INTERVAL_SEC).
+            # The summary walks every leg, so only build it when DEBUG is actually enabled.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[PositionSync] Strategy %s Exchange Keys: %s", sid, list(exch_size.keys()))
                 pos_summary_parts = []
                 for _sym, _sides in exch_size.items():
                     for _side_key, _qty in _sides.items():
                         if _qty > 0:
                             _ep = exch_entry_price.get(_sym, {}).get(_side_key, 0.0)
                             pos_summary_parts.append(f"{_sym} {_side_key} size={_qty} entry={_ep}")
-
                 if pos_summary_parts:
-                    logger.debug(f"[PositionSync] Strategy {sid} ({safe_cfg.get('exchange_id', 'unknown')}) positions: {'; '.join(pos_summary_parts)}")
+                    logger.debug("[PositionSync] Strategy %s (%s) positions: %s", sid, exchange_id, "; ".join(pos_summary_parts))
                 else:
-                    logger.debug(f"[PositionSync] Strategy {sid} ({safe_cfg.get('exchange_id', 'unknown')}) has NO positions on exchange.")
+                    logger.debug("[PositionSync] Strategy %s (%s) has NO positions on exchange.", sid, exchange_id)
+
+            # Keep exchange truth in L1 only. Strategy positions (L3) must be
+            # produced by that strategy's own fills, otherwise two live
+            # strategies sharing ETH/USDT would both inherit the same
+            # exchange account position.
+        except Exception as e:
+            msg = str(e)
+            if is_file_descriptor_exhausted(e):
+                _activate_position_sync_fd_backoff(msg)
+                return False
+            if is_fatal_exchange_error(msg):
+                logger.error(f"[PositionSync] Strategy {sid} fatal error; auto-stopping. error={msg}", exc_info=True)
+                auto_stop_live_strategy(int(sid), msg, source="position_sync")
+            else:
+                logger.error(f"position sync: strategy_id={sid} failed: {e}", exc_info=True)
+        return True
 
-                # Keep exchange truth in L1 only. Strategy positions (L3) must be
-                # produced by that strategy's own fills, otherwise two live
-                # strategies sharing ETH/USDT would both inherit the same
-                # exchange account position.
-            except Exception as e:
-                msg = str(e)
-                if is_file_descriptor_exhausted(e):
-                    _activate_position_sync_fd_backoff(msg)
-                    return
-                if is_fatal_exchange_error(msg):
-                    logger.error(f"[PositionSync] Strategy {sid} fatal error; auto-stopping. error={msg}", exc_info=True)
-                    auto_stop_live_strategy(int(sid), msg, source="position_sync")
-                else:
-                    logger.error(f"position sync: strategy_id={sid} failed: {e}", exc_info=True)
 
     def _sync_alpaca_sent_orders(self, limit: int = 50) -> None:
         rows = self._fetch_alpaca_sent_orders(limit=limit)
@@ -810,9 +861,12 @@ class PendingOrderWorker:
                 stale_sec = int(self._stale_processing_sec or 0)
             except Exception:
                 stale_sec = 0
-            if stale_sec > 0:
-                with get_db_connection() as db:
-                    cur = db.cursor()
+            now = time.time()
+            requeue_due = stale_sec > 0 and now - self._last_alpaca_requeue_ts >= self._stale_requeue_interval_sec
+            with get_db_connection() as db:
+                cur = db.cursor()
+                if requeue_due:
+                    self._last_alpaca_requeue_ts = now
                     cur.execute(
                         """
                         UPDATE pending_orders
@@ -826,10 +880,8 @@ class PendingOrderWorker:
                         (stale_sec,),
                     )
                     db.commit()
-                    cur.close()
-            with get_db_connection() as db:
-                cur = db.cursor()
-                cur.execute(
+                cur.execute_prepared(
+                    "qd_pending_alpaca_sent",
                     """
                     SELECT *
                     FROM pending_orders
@@ -837,7 +889,7 @@ class PendingOrderWorker:
                       AND LOWER(COALESCE(exchange_id, '')) = 'alpaca'
                       AND COALESCE(exchange_order_id, '') <> ''
                     ORDER BY sent_at ASC NULLS FIRST, id ASC
-                    LIMIT %s
+                    LIMIT $1::int
                     """,
                     (int(limit),),
                 )
@@ -889,20 +941,13 @@ class PendingOrderWorker:
         if not exchange_order_id:
             return
 
-        payload = {}
-        payload_json = row.get("payload_json") or ""
-        if isinstance(payload_json, str) and payload_json.strip():
-            try:
-                payload = json.loads(payload_json) or {}
-            except Exception:
-                payload = {}
+        payload = _loads_json_dict(row.get("payload_json"))
 
         strategy_id = int(payload.get("strategy_id") or row.get("strategy_id") or 0)
         if strategy_id <= 0:
             return
 
-        sc = load_strategy_configs(strategy_id)
-        exchange_config = resolve_exchange_config(sc.get("exchange_config") or {}, user_id=int(sc.get("user_id") or 1))
+        sc, exchange_config = self._strategy_cfg(strategy_id)
         if str(exchange_config.get("exchange_id") or "").strip().lower() != "alpaca":
             return
 
@@ -912,14 +957,7 @@ class PendingOrderWorker:
             logger.warning("Alpaca fill sync create_client failed: pending_id=%s err=%s", order_id, e)
             return
 
-        global AlpacaClient
-        if AlpacaClient is None:
-            try:
-                from app.services.alpaca_trading import AlpacaClient as _AlpacaClient
-                AlpacaClient = _AlpacaClient
-            except Exception:
-                AlpacaClient = None
-        if AlpacaClient is None or not isinstance(client, AlpacaClient):
+        if getattr(client, "family", "") != "alpaca":
             return
 
         result = client.get_order_status(exchange_order_id)
@@ -928,7 +966,7 @@ class PendingOrderWorker:
         cumulative_avg = float(result.avg_price or 0.0)
         previous_filled = float(row.get("filled") or 0.0)
         previous_avg = float(row.get("avg_price") or 0.0)
-        raw_json = json.dumps(result.raw or {}, ensure_ascii=False)
+        raw_json = _dumps_json(result.raw or {})
 
         delta = cumulative_filled - previous_filled
         if delta > ALPACA_FILL_DELTA_EPSILON and cumulative_avg > 0:
@@ -1047,17 +1085,23 @@ class PendingOrderWorker:
             db.commit()
             cur.close()
 
-    def _fetch_pending_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def _claim_pending_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Claim up to ``limit`` pending orders in one UPDATE ... RETURNING round-trip."""
         try:
             # Best-effort: requeue stale "processing" rows to avoid deadlocks after crashes.
+            # The scan only needs to run every few seconds, not on every 1s tick.
             try:
                 stale_sec = int(self._stale_processing_sec or 0)
             except Exception:
                 stale_sec = 0
-            if stale_sec > 0:
-                with get_db_connection() as db:
-                    cur = db.cursor()
-                    cur.execute(
+            now = time.time()
+            requeue_due = stale_sec > 0 and now - self._last_stale_requeue_ts >= self._stale_requeue_interval_sec
+            with self._claim_lock, get_db_connection() as db:
+                cur = db.cursor()
+                if requeue_due:
+                    self._last_stale_requeue_ts = now
+                    cur.execute_prepared(
+                        "qd_pending_requeue_stale",
                         """
                         UPDATE pending_orders
                         SET status = 'pending',
@@ -1067,84 +1111,100 @@ class PendingOrderWorker:
                                 ELSE dispatch_note
                             END
                         WHERE status = 'processing'
-                          AND (updated_at IS NULL OR updated_at < NOW() - INTERVAL '%s seconds')
+                          AND (updated_at IS NULL OR updated_at < NOW() - ($1::int * INTERVAL '1 second'))
                           AND (attempts < max_attempts)
                         """,
                         (stale_sec,),
                     )
-                    db.commit()
-                    cur.close()
-
-            with get_db_connection() as db:
-                cur = db.cursor()
-                cur.execute(
+                # SKIP LOCKED lets several workers claim disjoint batches without blocking.
+                # Strategies still dispatching on another loop of this process are skipped.
+                busy = sorted(self._inflight_strategies)
+                cur.execute_prepared(
+                    "qd_pending_claim",
                     """
-                    SELECT *
-                    FROM pending_orders
-                    WHERE status = 'pending'
-                      AND (attempts < max_attempts)
-                    ORDER BY priority DESC, id ASC
-                    LIMIT %s
+                    UPDATE pending_orders
+                    SET status = 'processing',
+                        attempts = COALESCE(attempts, 0) + 1,
+                        processed_at = NOW(),
+                        updated_at = NOW()
+                    WHERE id IN (
+                        SELECT id
+                        FROM pending_orders
+                        WHERE status = 'pending'
+                          AND (attempts < max_attempts)
+                          AND (strategy_id IS NULL OR NOT (strategy_id = ANY($1::int[])))
+                        ORDER BY priority DESC, id ASC
+                        LIMIT $2::int
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING *
                     """,
-                    (int(limit),),
+                    (busy, int(limit)),
                 )
                 rows = cur.fetchall() or []
+                db.commit()
                 cur.close()
+                for sid in {int(r.get("strategy_id") or 0) for r in rows}:
+                    self._inflight_strategies[sid] = self._inflight_strategies.get(sid, 0) + 1
+            # RETURNING order is unspecified; dispatch in queue order.
+            rows.sort(key=lambda r: (-int(r.get("priority") or 0), int(r.get("id") or 0)))
             return rows
         except Exception as e:
-            logger.warning(f"fetch_pending_orders failed: {e}")
+            logger.warning(f"claim_pending_orders failed: {e}")
             return []
 
-    def _mark_processing(self, order_id: int) -> bool:
+    def _prefetch_strategy_meta(self, orders: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """One query for the strategy names / notification configs that the batch's payloads lack."""
+        sids = set()
+        for o in orders:
+            payload = _loads_json_dict(o.get("payload_json"))
+            sid = int(payload.get("strategy_id") or o.get("strategy_id") or 0)
+            if sid and not (str(payload.get("strategy_name") or "").strip() and payload.get("notification_config")):
+                sids.add(sid)
+        if not sids:
+            return {}
         try:
             with get_db_connection() as db:
                 cur = db.cursor()
-                # Only claim if still pending to avoid double-processing.
                 cur.execute(
-                    """
-                    UPDATE pending_orders
-                    SET status = 'processing',
-                        attempts = COALESCE(attempts, 0) + 1,
-                        processed_at = NOW(),
-                        updated_at = NOW()
-                    WHERE id = %s AND status = 'pending'
-                    """,
-                    (int(order_id),),
+                    "SELECT id, strategy_name, notification_config FROM qd_strategies_trading WHERE id = ANY(%s)",
+                    (sorted(sids),),
                 )
-                claimed = getattr(cur, "rowcount", None)
-                db.commit()
+                rows = cur.fetchall() or []
                 cur.close()
-            # Only treat as success if we actually changed a row.
-            if claimed is None:
-                return True
-            return int(claimed) > 0
         except Exception as e:
-            logger.warning(f"mark_processing failed: id={order_id}, err={e}")
-            return False
+            logger.debug("prefetch_strategy_meta failed: %s", e)
+            return {}
+        return {int(r["id"]): r for r in rows}
 
-    def _dispatch_one(self, order_row: Dict[str, Any]) -> None:
+    def _dispatch_one(
+        self,
+        order_row: Dict[str, Any],
+        strategy_meta: Optional[Dict[int, Dict[str, Any]]] = None,
+        signal_jobs: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
         order_id = int(order_row["id"])
         mode = (order_row.get("execution_mode") or "signal").strip().lower()
-        payload_json = order_row.get("payload_json") or ""
-
-        payload: Dict[str, Any] = {}
-        if payload_json and isinstance(payload_json, str):
-            try:
-                payload = json.loads(payload_json) or {}
-            except Exception:
-                payload = {}
-
-        signal_type = payload.get("signal_type") or order_row.get("signal_type")
-        symbol = payload.get("symbol") or order_row.get("symbol")
-        strategy_id = payload.get("strategy_id") or order_row.get("strategy_id")
+        # Payload fields win over the row's columns and carry notification_config / sizing,
+        # so both dispatch modes need it decoded.
+        payload = _loads_json_dict(order_row.get("payload_json"))
+
+        # Coerce once; everything below works on typed locals.
+        signal_type = str(payload.get("signal_type") or order_row.get("signal_type") or "")
+        symbol = str(payload.get("symbol") or order_row.get("symbol") or "")
+        strategy_id = int(payload.get("strategy_id") or order_row.get("strategy_id") or 0)
         price = float(payload.get("price") or order_row.get("price") or 0.0)
         amount = float(payload.get("amount") or order_row.get("amount") or 0.0)
-        direction = "short" if "short" in str(signal_type) else "long"
+        direction = "short" if "short" in signal_type else "long"
         notification_config = payload.get("notification_config") or {}
         strategy_name = str(payload.get("strategy_name") or "").strip()
+        meta = (strategy_meta or {}).get(strategy_id) if strategy_id else None
         if not strategy_name:
             # Best-effort: load from DB for nicer notifications.
-            strategy_name = self._load_strategy_name(int(strategy_id or 0)) if strategy_id else ""
+            if meta is not None:
+                strategy_name = str(meta.get("strategy_name") or "").strip()
+            elif strategy_id:
+                strategy_name = self._load_strategy_name(strategy_id)
         if not strategy_name:
             strategy_name = f"Strategy_{strategy_id}"
 
@@ -1152,7 +1212,7 @@ class PendingOrderWorker:
         # automatically upgrade it to live execution to keep the system moving.
         try:
             if mode != "live" and strategy_id:
-                sc = load_strategy_configs(int(strategy_id))
+                sc, _ = self._strategy_cfg(strategy_id)
                 if (sc.get("execution_mode") or "").strip().lower() == "live":
                     mode = "live"
         except Exception:
@@ -1162,47 +1222,34 @@ class PendingOrderWorker:
             # Signal-only mode: dispatch notifications (no real trading).
             # Note: notification_config is stored in payload_json at enqueue time; fallback to DB if missing.
             if (not notification_config) and strategy_id:
-                notification_config = self._load_notification_config(int(strategy_id))
-
-            stake_quote = calc_notional_value(float(price or 0.0), float(amount or 0.0)) or float(amount or 0.0)
-            results = self._notifier.notify_signal(
-                strategy_id=int(strategy_id or 0),
-                strategy_name=str(strategy_name or ""),
-                symbol=str(symbol or ""),
-                signal_type=str(signal_type or ""),
-                price=float(price or 0.0),
-                stake_amount=float(stake_quote),
-                direction=str(direction or "long"),
-                notification_config=notification_config if isinstance(notification_config, dict) else {},
-                extra={"pending_order_id": order_id, "mode": mode},
-            )
-
-            attempted = list(results.keys())
-            ok_channels = [c for c, r in results.items() if (r or {}).get("ok")]
-            fail_channels = [c for c, r in results.items() if not (r or {}).get("ok")]
-
-            if ok_channels:
-                note = f"notified_ok={','.join(ok_channels)}"
-                if fail_channels:
-                    note += f";fail={','.join(fail_channels)}"
-                self._mark_sent(order_id=order_id, note=note[:200])
-                append_strategy_log(
-                    int(strategy_id or 0), "signal",
-                    f"Signal notification sent: {signal_type} {symbol} @ {price:.6f}, channels={','.join(ok_channels)}",
-                )
+                if meta is not None:
+                    raw_cfg = meta.get("notification_config")
+                    notification_config = raw_cfg if isinstance(raw_cfg, dict) else _loads_json_dict(raw_cfg)
+                else:
+                    notification_config = self._load_notification_config(strategy_id)
+
+            job = {
+                "order_id": order_id,
+                "strategy_id": strategy_id,
+                "signal_type": signal_type,
+                "symbol": symbol,
+                "price": price,
+                "notify": {
+                    "strategy_id": strategy_id,
+                    "strategy_name": strategy_name,
+                    "symbol": symbol,
+                    "signal_type": signal_type,
+                    "price": price,
+                    "stake_amount": calc_notional_value(price, amount) or amount,
+                    "direction": direction,
+                    "notification_config": notification_config if isinstance(notification_config, dict) else {},
+                    "extra": {"pending_order_id": order_id, "mode": mode},
+                },
+            }
+            if signal_jobs is not None:
+                signal_jobs.append(job)
             else:
-                # Nothing succeeded -> mark failed with a compact error summary.
-                first_err = ""
-                for c in attempted:
-                    err = (results.get(c) or {}).get("error") or ""
-                    if err:
-                        first_err = f"{c}:{err}"
-                        break
-                self._mark_failed(order_id=order_id, error=first_err or "notify_failed")
-                append_strategy_log(
-                    int(strategy_id or 0), "error",
-                    f"Signal notification failed: {signal_type} {symbol}, error={first_err or 'notify_failed'}",
-                )
+                self._record_signal_results(job, self._notifier.notify_signal(**job["notify"]))
             return
 
         if mode == "live":
@@ -1211,26 +1258,42 @@ class PendingOrderWorker:
 
         self._mark_failed(order_id=order_id, error=f"unsupported_execution_mode:{mode}")
 
+    def _record_signal_results(self, job: Dict[str, Any], results: Dict[str, Dict[str, Any]]) -> None:
+        order_id = job["order_id"]
+        strategy_id = job["strategy_id"]
+        signal_type = job["signal_type"]
+        symbol = job["symbol"]
+        price = job["price"]
+        attempted = list(results.keys())
+        ok_channels = [c for c, r in results.items() if (r or {}).get("ok")]
+        fail_channels = [c for c, r in results.items() if not (r or {}).get("ok")]
+
+        if ok_channels:
+            note = f"notified_ok={','.join(ok_channels)}"
+            if fail_channels:
+                note += f";fail={','.join(fail_channels)}"
+            self._mark_sent(order_id=order_id, note=note[:200])
+            append_strategy_log(
+                strategy_id, "signal",
+                f"Signal notification sent: {signal_type} {symbol} @ {price:.6f}, channels={','.join(ok_channels)}",
+            )
+        else:
+            # Nothing succeeded -> mark failed with a compact error summary.
+            first_err = ""
+            for c in attempted:
+                err = (results.get(c) or {}).get("error") or ""
+                if err:
+                    first_err = f"{c}:{err}"
+                    break
+            self._mark_failed(order_id=order_id, error=first_err or "notify_failed")
+            append_strategy_log(
+                strategy_id, "error",
+                f"Signal notification failed: {signal_type} {symbol}, error={first_err or 'notify_failed'}",
+            )
+
     def _load_notification_config(self, strategy_id: int) -> Dict[str, Any]:
         try:
-            with get_db_connection() as db:
-                cur = db.cursor()
-                cur.execute(
-                    "SELECT notification_config FROM qd_strategies_trading WHERE id = ?",
-                    (int(strategy_id),),
-                )
-                row = cur.fetchone() or {}
-                cur.close()
-            s = row.get("notification_config") or ""
-            if isinstance(s, dict):
-                return s
-            if isinstance(s, str) and s.strip():
-                try:
-                    obj = json.loads(s)
-                    return obj if isinstance(obj, dict) else {}
-                except Exception:
-                    return {}
-            return {}
+            return self._strategy_meta(strategy_id)[1]
         except Exception:
             return {}
 
@@ -1357,7 +1420,7 @@ class PendingOrderWorker:
         payload: Dict[str, Any],
         phases: Dict[str, Any],
     ) -> None:
-        if reduce_only or signal_type not in ("open_long", "open_short", "add_long", "add_short"):
+        if reduce_only or signal_type not in _OPENING_SIGNALS:
             return
         try:
             min_qty, min_notional = self._estimate_min_order_notional(
@@ -1395,12 +1458,7 @@ class PendingOrderWorker:
 
     def _load_strategy_name(self, strategy_id: int) -> str:
         try:
-            with get_db_connection() as db:
-                cur = db.cursor()
-                cur.execute("SELECT strategy_name FROM qd_strategies_trading WHERE id = ?", (int(strategy_id),))
-                row = cur.fetchone() or {}
-                cur.close()
-            return str(row.get("strategy_name") or "").strip()
+            return self._strategy_meta(strategy_id)[0]
         except Exception:
             return ""
 
@@ -1432,19 +1490,45 @@ class PendingOrderWorker:
                     notifier=self._notifier,
                     load_notification_config=self._load_notification_config,
                     load_strategy_name=self._load_strategy_name,
+                    background=True,
                 )
                 live_notifier.notify(status="failed", error=rejected.error)
                 if rejected.strategy_log:
                     append_strategy_log(rejected.strategy_id, "error", rejected.strategy_log)
             return
 
+        self._execute_live_context(ctx, order_id=order_id, order_row=order_row, payload=payload)
+
+    def _instrument_lock(self, exchange_id: str, symbol: str) -> threading.Lock:
+        """Lock around order placement / cancel on one (exchange, symbol).
+
+        Held only for the submit calls, not the maker wait or fill polling, so a slow
+        maker order does not pin a dispatch thread for every strategy on that symbol.
+        Process-local: it serializes this worker's dispatch threads, not other processes.
+        """
+        key = (exchange_id, symbol)
+        lock = self._instrument_locks.get(key)
+        if lock is None:
+            # setdefault is atomic, so two threads racing here still share one lock.
+            lock = self._instrument_locks.setdefault(key, threading.Lock())
+        return lock
+
+    def _execute_live_context(
+        self,
+        ctx: LiveOrderExecutionContext,
+        *,
+        order_id: int,
+        order_row: Dict[str, Any],
+        payload: Dict[str, Any],
+    ) -> None:
+        """Place a validated live order and record its fill."""
+        _console_print = console_print
+
         strategy_id = ctx.strategy_id
         signal_type = ctx.signal_type
         symbol = ctx.symbol
         amount = ctx.amount
-        cfg = ctx.cfg
         exchange_config = ctx.exchange_config
-        safe_cfg = ctx.safe_exchange_config
         exchange_id = ctx.exchange_id
         market_category = ctx.market_category
         market_type = ctx.market_type
@@ -1457,9 +1541,26 @@ class PendingOrderWorker:
             notifier=self._notifier,
             load_notification_config=self._load_notification_config,
             load_strategy_name=self._load_strategy_name,
+            background=True,
         )
         _notify_live_best_effort = live_notifier.notify
 
+        # IBKR / Alpaca are long-only: reject what they cannot place before create_client
+        # opens a broker session for nothing.
+        broker_side = ""
+        if exchange_id in _LONG_ONLY_BROKERS:
+            broker_side = _LONG_ONLY_ACTION.get(signal_type, "")
+            if not broker_side:
+                err = _long_only_reject_error(exchange_id, signal_type)
+                self._mark_failed(order_id=order_id, error=err)
+                _console_print(
+                    "[worker] %s order rejected: strategy_id=%s pending_id=%s %s",
+                    _LONG_ONLY_BROKERS[exchange_id], strategy_id, order_id,
+                    "short not supported" if "short" in signal_type else f"unsupported signal {signal_type}",
+                )
+                _notify_live_best_effort(status="failed", error=err)
+                return
+
         client = None
         try:
             client = create_client(exchange_config, market_type=market_type)
@@ -1472,21 +1573,19 @@ class PendingOrderWorker:
                 auto_stop_live_strategy(int(strategy_id), str(e), source="pending_order_client")
             return
 
-        # Check if this is an IBKR client (US stocks)
-        global IBKRClient
-        if IBKRClient is None:
-            try:
-                from app.services.ibkr_trading import IBKRClient as _IBKRClient
-                IBKRClient = _IBKRClient
-            except ImportError:
-                pass
-
-        if IBKRClient is not None and isinstance(client, IBKRClient):
+        # Broker clients run their own flows; create_client already imported only the module it needed.
+        family = getattr(client, "family", "crypto_rest")
+        if family == "ibkr":
             # Execute IBKR order (separate flow for stocks)
             self._execute_ibkr_order(
                 order_id=order_id,
                 order_row=order_row,
                 payload=payload,
+                signal_type=signal_type,
+                side=broker_side,
+                symbol=symbol,
+                amount=amount,
+                ref_price=ctx.ref_price,
                 client=client,
                 strategy_id=strategy_id,
                 exchange_config=exchange_config,
@@ -1495,19 +1594,16 @@ class PendingOrderWorker:
             )
             return
 
-        global AlpacaClient
-        if AlpacaClient is None:
-            try:
-                from app.services.alpaca_trading import AlpacaClient as _AlpacaClient
-                AlpacaClient = _AlpacaClient
-            except ImportError:
-                pass
-
-        if AlpacaClient is not None and isinstance(client, AlpacaClient):
+        if family == "alpaca":
             self._execute_alpaca_order(
                 order_id=order_id,
                 order_row=order_row,
                 payload=payload,
+                signal_type=signal_type,
+                side=broker_side,
+                symbol=symbol,
+                amount=amount,
+                ref_price=ctx.ref_price,
                 client=client,
                 strategy_id=strategy_id,
                 exchange_config=exchange_config,
@@ -1517,10 +1613,9 @@ class PendingOrderWorker:
             )
             return
 
-        client_oid = make_client_order_id(exchange_id=exchange_id, strategy_id=strategy_id, order_id=order_id)
-        sig = str(signal_type or "").strip().lower()
-        # Spot does not support short signals in this system.
-        if market_type == "spot" and "short" in sig:
+        lmt_client_oid, mkt_client_oid = phase_client_order_ids(exchange_id=exchange_id, strategy_id=strategy_id, order_id=order_id)
+        # Spot does not support short signals in this system (signal_type is normalized by the context).
+        if market_type == "spot" and signal_direction(signal_type) == "short":
             self._mark_failed(order_id=order_id, error="spot_market_does_not_support_short_signals")
             _console_print(f"[worker] order rejected: strategy_id={strategy_id} pending_id={order_id} spot short not supported")
             _notify_live_best_effort(status="failed", error="spot_market_does_not_support_short_signals")
@@ -1529,11 +1624,10 @@ class PendingOrderWorker:
 
         # Unified maker->market fallback settings
         # Priority: payload config > environment variable > default value
-        _default_order_mode = os.getenv("ORDER_MODE", "market").strip().lower()
-        _default_maker_wait_sec = float(os.getenv("MAKER_WAIT_SEC", "10"))
-        _default_maker_offset_bps = float(os.getenv("MAKER_OFFSET_BPS", "2"))
+        _default_order_mode, _default_maker_wait_sec, _default_maker_offset_bps = _order_mode_defaults()
 
-        order_mode = str(payload.get("order_mode") or payload.get("orderMode") or _default_order_mode).strip().lower()
+        raw_order_mode = payload.get("order_mode") or payload.get("orderMode")
+        order_mode = sys.intern(str(raw_order_mode).strip().lower()) if raw_order_mode else _default_order_mode
         maker_wait_sec = float(payload.get("maker_wait_sec") or payload.get("makerWaitSec") or _default_maker_wait_sec)
         maker_offset_bps = float(payload.get("maker_offset_bps") or payload.get("makerOffsetBps") or _default_maker_offset_bps)
         if maker_wait_sec <= 0:
@@ -1542,7 +1636,7 @@ class PendingOrderWorker:
             maker_offset_bps = 0.0
         maker_offset = maker_offset_bps / 10000.0
 
-        ref_price = float(payload.get("ref_price") or payload.get("price") or order_row.get("price") or 0.0)
+        ref_price = ctx.ref_price
 
         side, pos_side, reduce_only = signal_to_side_pos_reduce(signal_type)
 
@@ -1566,20 +1660,12 @@ class PendingOrderWorker:
         # Leverage handling (best-effort):
         # - For OKX swap, leverage must be set via private endpoint; otherwise exchange defaults apply.
         # - For other exchanges, leverage setting is not implemented yet in this local client.
-        leverage = payload.get("leverage")
-        if leverage is None:
-            leverage = cfg.get("leverage")
-        try:
-            leverage = float(leverage or 1.0)
-        except Exception:
-            leverage = 1.0
-        if leverage <= 0:
-            leverage = 1.0
+        leverage = ctx.leverage
 
         # [FEATURE] Sync positions before execution to ensure size is checking against reality
         # The user requested to sync before EVERY live order to prevent mismatch.
         try:
-            logger.info(f"[Sync] Triggering pre-execution sync for strategy {strategy_id} before order {order_id}")
+            logger.info("[Sync] Triggering pre-execution sync for strategy %s before order %s", strategy_id, order_id)
             self._sync_positions_best_effort(target_strategy_id=strategy_id)
         except Exception as e:
             logger.warning(f"Pre-execution sync failed: {e}")
@@ -1605,10 +1691,13 @@ class PendingOrderWorker:
                 logger.error(f"[RiskControl] Failed to resolve close quantity: {e}")
                 phases["close_size_resolve_error"] = str(e)
 
+        # Venue key resolved once per order (cached per client class); replaces repeated isinstance checks.
+        venue = client_kind(client)
+
         # Ensure ref price exists (used by maker pricing, fallbacks, and local DB snapshots).
         if ref_price <= 0:
             try:
-                if isinstance(client, BinanceFuturesClient):
+                if venue == "binance_futures":
                     ref_price = float(client.get_mark_price(symbol=str(symbol)) or 0.0)
             except Exception:
                 pass
@@ -1616,14 +1705,17 @@ class PendingOrderWorker:
         # Binance Futures leverage is per-symbol on the exchange side.
         # If we do not set it, Binance may keep default 1x and the user will observe
         # margin ~= notional (i.e., "margin = invested * leverage" when we sized using leverage).
-        if isinstance(client, BinanceFuturesClient) and market_type == "swap":
+        if venue == "binance_futures" and market_type == "swap":
             try:
                 client.set_leverage(symbol=str(symbol), leverage=float(leverage or 1.0))
                 phases["set_leverage"] = {"exchange": "binance", "symbol": str(symbol), "leverage": float(leverage or 1.0)}
             except Exception as e:
                 # Safer default: do NOT place orders with an unintended leverage.
                 err = f"binance_set_leverage_failed:{e}"
-                logger.warning(f"live leverage set failed: pending_id={order_id}, strategy_id={strategy_id}, cfg={safe_cfg}, err={e}")
+                logger.warning(
+                    "live leverage set failed: pending_id=%s, strategy_id=%s, cfg=%s, err=%s",
+                    order_id, strategy_id, ctx.safe_exchange_config, e,
+                )
                 self._mark_failed(order_id=order_id, error=err)
                 _console_print(f"[worker] order rejected: strategy_id={strategy_id} pending_id={order_id} {err}")
                 _notify_live_best_effort(status="failed", error=err, amount_hint=amount, price_hint=ref_price)
@@ -1688,7 +1780,7 @@ class PendingOrderWorker:
         )
 
         # Decide if we should use limit-first flow.
-        use_limit_first = order_mode in ("maker", "limit", "limit_first", "maker_then_market")
+        use_limit_first = order_mode in MAKER_ORDER_MODES
 
         remaining = float(amount or 0.0)
         # Close/reduce: DB may lag right after open or trailing; re-sync + re-query exchange once.
@@ -1710,7 +1802,7 @@ class PendingOrderWorker:
                     strategy_id=int(strategy_id),
                     symbol=str(symbol or ""),
                     pos_side=str(pos_side or ""),
-                    requested_amount=float(payload.get("amount") or order_row.get("amount") or 0.0),
+                    requested_amount=ctx.amount,
                     client=client,
                     market_type=str(market_type or "swap"),
                     exchange_config=exchange_config,
@@ -1766,30 +1858,53 @@ class PendingOrderWorker:
         # Phase 1: limit (hang order)
         limit_order_id = ""
         limit_client_oid = ""
-        if use_limit_first:
-            try:
-                limit_price = maker_limit_price(ref_price=ref_price, side=side, maker_offset=maker_offset)
-                limit_client_oid = make_client_order_id(
-                    exchange_id=exchange_id,
-                    strategy_id=strategy_id,
-                    order_id=order_id,
-                    phase="lmt",
-                )
-                res1 = place_live_limit_order(
+        # Binance: skip the per-phase fee lookup and fetch fees for all phase orders once at the end.
+        defer_fee = supports_batched_fees(client)
+        fee_order_ids: List[str] = []
+        # Resolved once per order: partial-fill cancel threshold and the OKX swap tail-guard gate.
+        amount_f = float(amount or 0.0)
+        cancel_threshold = amount_f * 0.001
+        is_okx_swap = venue == "okx" and market_type == "swap"
+        bitget = bitget_mix_params(payload, exchange_config) if venue == "bitget_mix" else None
+        instrument_lock = self._instrument_lock(exchange_id, symbol)
+
+        def _tail_after_limit() -> float:
+            # Fully filled at the maker price (the common case): leave nothing for the
+            # tail guard / cancel / market phases, including float dust below the threshold.
+            if fills.total_base >= amount_f * 0.999999:
+                return 0.0
+            tail = amount_f - fills.total_base
+            if is_okx_swap:
+                tail = apply_okx_tail_guard(
                     client=client,
                     symbol=str(symbol),
-                    side=side,
-                    amount=float(remaining or 0.0),
-                    price=float(limit_price or 0.0),
-                    reduce_only=reduce_only,
-                    pos_side=pos_side,
-                    client_order_id=limit_client_oid,
+                    remaining=tail,
                     market_type=market_type,
-                    payload=payload,
-                    exchange_config=exchange_config,
-                    leverage=leverage,
-                    order_mode=order_mode,
+                    phases=phases,
                 )
+            return tail
+
+        if use_limit_first:
+            try:
+                limit_price = maker_limit_price(ref_price=ref_price, side=side, maker_offset=maker_offset)
+                limit_client_oid = lmt_client_oid
+                with instrument_lock:
+                    res1 = place_live_limit_order(
+                        client=client,
+                        symbol=str(symbol),
+                        side=side,
+                        amount=float(remaining or 0.0),
+                        price=float(limit_price or 0.0),
+                        reduce_only=reduce_only,
+                        pos_side=pos_side,
+                        client_order_id=limit_client_oid,
+                        market_type=market_type,
+                        payload=payload,
+                        exchange_config=exchange_config,
+                        leverage=leverage,
+                        order_mode=order_mode,
+                        bitget=bitget,
+                    )
                 limit_order_id = str(res1.exchange_order_id or "")
                 phases["limit_place"] = res1.raw
 
@@ -1802,33 +1917,56 @@ class PendingOrderWorker:
                     exchange_config=exchange_config,
                     max_wait_sec=maker_wait_sec,
                     phase="limit",
+                    defer_fee=defer_fee,
+                    bitget=bitget,
                 )
-                phases["limit_query"] = q
-                apply_fill_snapshot(fills, q)
-
-                remaining = max(0.0, float(amount or 0.0) - fills.total_base)
-                remaining = apply_okx_tail_guard(
-                    client=client,
-                    symbol=str(symbol),
-                    remaining=remaining,
-                    market_type=market_type,
-                    phases=phases,
-                )
+                limit_filled = record_phase_query(phases, "limit_query", fills, q)
+                if limit_filled > 0:
+                    fee_order_ids.append(limit_order_id)
 
-                if remaining > max(0.0, float(amount or 0.0) * 0.001):
+                remaining = _tail_after_limit()
+                if remaining > cancel_threshold:
                     try:
-                        phases["limit_cancel"] = cancel_live_limit_order(
+                        with instrument_lock:
+                            phases["limit_cancel"] = cancel_live_limit_order(
+                                client=client,
+                                symbol=str(symbol),
+                                order_id=limit_order_id,
+                                client_order_id=limit_client_oid,
+                                market_type=market_type,
+                                exchange_config=exchange_config,
+                                bitget=bitget,
+                            )
+                    except Exception:
+                        pass
+                    # The limit can still fill between the query above and the cancel; size the
+                    # market tail from its final state (the cancel also frees the balance a spot
+                    # tail needs).
+                    try:
+                        q_final = wait_live_order_fill(
                             client=client,
                             symbol=str(symbol),
                             order_id=limit_order_id,
                             client_order_id=limit_client_oid,
                             market_type=market_type,
                             exchange_config=exchange_config,
+                            max_wait_sec=0.0,
+                            phase="limit",
+                            defer_fee=defer_fee,
+                            bitget=bitget,
                         )
-                    except Exception:
-                        pass
+                        if apply_fill_delta(fills, q, q_final) > 0:
+                            phases["limit_final_query"] = q_final
+                            if limit_filled <= 0:
+                                fee_order_ids.append(limit_order_id)
+                            remaining = _tail_after_limit()
+                    except Exception as e:
+                        logger.warning("limit re-query after cancel failed: pending_id=%s, err=%s", order_id, e)
             except LiveTradingError as e:
-                logger.warning(f"live limit phase failed: pending_id={order_id}, strategy_id={strategy_id}, cfg={safe_cfg}, err={e}")
+                logger.warning(
+                    "live limit phase failed: pending_id=%s, strategy_id=%s, cfg=%s, err=%s",
+                    order_id, strategy_id, ctx.safe_exchange_config, e,
+                )
                 remaining = float(amount or 0.0)
                 friendly_error = self._friendly_order_error(
                     e,
@@ -1843,37 +1981,38 @@ class PendingOrderWorker:
                 phases["limit_error"] = friendly_error
                 append_strategy_log(strategy_id, "error", f"Exchange limit order failed ({exchange_id} {symbol}): {friendly_error}, falling back to market")
             except Exception as e:
-                logger.warning(f"live limit phase unexpected error: pending_id={order_id}, strategy_id={strategy_id}, cfg={safe_cfg}, err={e}")
+                logger.warning(
+                    "live limit phase unexpected error: pending_id=%s, strategy_id=%s, cfg=%s, err=%s",
+                    order_id, strategy_id, ctx.safe_exchange_config, e,
+                )
                 remaining = float(amount or 0.0)
                 phases["limit_error"] = str(e)
                 append_strategy_log(strategy_id, "error", f"Limit order unexpected error ({exchange_id} {symbol}): {e}, falling back to market")
 
         # Phase 2: market for remaining
         market_order_id = ""
-        market_client_oid = make_client_order_id(
-            exchange_id=exchange_id,
-            strategy_id=strategy_id,
-            order_id=order_id,
-            phase="mkt",
-        )
+        market_client_oid = ""
         if remaining > 0:
+            market_client_oid = mkt_client_oid
             try:
-                res2 = place_live_market_order(
-                    client=client,
-                    symbol=str(symbol),
-                    side=side,
-                    amount=float(remaining or 0.0),
-                    reduce_only=reduce_only,
-                    pos_side=pos_side,
-                    client_order_id=market_client_oid,
-                    market_type=market_type,
-                    payload=payload,
-                    exchange_config=exchange_config,
-                    leverage=leverage,
-                    ref_price=ref_price,
-                    spot_quote_amt=spot_quote_amt,
-                    spot_market_buy_uses_quote=spot_market_buy_uses_quote,
-                )
+                with instrument_lock:
+                    res2 = place_live_market_order(
+                        client=client,
+                        symbol=str(symbol),
+                        side=side,
+                        amount=float(remaining or 0.0),
+                        reduce_only=reduce_only,
+                        pos_side=pos_side,
+                        client_order_id=market_client_oid,
+                        market_type=market_type,
+                        payload=payload,
+                        exchange_config=exchange_config,
+                        leverage=leverage,
+                        ref_price=ref_price,
+                        spot_quote_amt=spot_quote_amt,
+                        spot_market_buy_uses_quote=spot_market_buy_uses_quote,
+                        bitget=bitget,
+                    )
                 market_order_id = str(res2.exchange_order_id or "")
                 phases["market_place"] = res2.raw
 
@@ -1886,11 +2025,16 @@ class PendingOrderWorker:
                     exchange_config=exchange_config,
                     max_wait_sec=12.0,
                     phase="market",
+                    defer_fee=defer_fee,
+                    bitget=bitget,
                 )
-                phases["market_query"] = q2
-                apply_fill_snapshot(fills, q2)
+                if record_phase_query(phases, "market_query", fills, q2) > 0:
+                    fee_order_ids.append(market_order_id)
             except LiveTradingError as e:
-                logger.warning(f"live market phase failed: pending_id={order_id}, strategy_id={strategy_id}, cfg={safe_cfg}, err={e}")
+                logger.warning(
+                    "live market phase failed: pending_id=%s, strategy_id=%s, cfg=%s, err=%s",
+                    order_id, strategy_id, ctx.safe_exchange_config, e,
+                )
                 friendly_error = self._friendly_order_error(
                     e,
                     client=client,
@@ -1904,7 +2048,8 @@ class PendingOrderWorker:
                 phases["market_error"] = friendly_error
                 if float(fills.total_base or 0.0) > 0:
                     _console_print(
-                        f"[worker] market tail failed but partial filled: strategy_id={strategy_id} pending_id={order_id} filled={fills.total_base} err={e}"
+                        "[worker] market tail failed but partial filled: strategy_id=%s pending_id=%s filled=%s err=%s",
+                        strategy_id, order_id, fills.total_base, e,
                     )
                     remaining = 0.0
                     append_strategy_log(strategy_id, "error", f"Exchange market order partially failed ({symbol} {signal_type}): {friendly_error} (partial filled={fills.total_base})")
@@ -1915,13 +2060,29 @@ class PendingOrderWorker:
                     append_strategy_log(strategy_id, "error", f"Exchange order failed ({exchange_id} {symbol} {signal_type}): {friendly_error}")
                     return
             except Exception as e:
-                logger.warning(f"live market phase unexpected error: pending_id={order_id}, strategy_id={strategy_id}, cfg={safe_cfg}, err={e}")
+                logger.warning(
+                    "live market phase unexpected error: pending_id=%s, strategy_id=%s, cfg=%s, err=%s",
+                    order_id, strategy_id, ctx.safe_exchange_config, e,
+                )
                 self._mark_failed(order_id=order_id, error=str(e))
                 _console_print(f"[worker] order unexpected error: strategy_id={strategy_id} pending_id={order_id} err={e}")
                 _notify_live_best_effort(status="failed", error=str(e), amount_hint=amount, price_hint=ref_price)
                 append_strategy_log(strategy_id, "error", f"Unexpected order error ({exchange_id} {symbol} {signal_type}): {e}")
                 return
 
+        if defer_fee and fee_order_ids:
+            try:
+                fee, fee_ccy = fetch_live_order_fees(
+                    client=client,
+                    symbol=str(symbol),
+                    order_ids=fee_order_ids,
+                    filled=float(fills.total_base or 0.0),
+                    avg_price=float(fills.avg_price() or 0.0),
+                )
+                fills.apply_fee(fee, fee_ccy)
+            except Exception as e:
+                logger.warning("live fee lookup failed: pending_id=%s, orders=%s, err=%s", order_id, fee_order_ids, e)
+
         # Build final result (best-effort); live path never fabricates fill qty from request amount.
         filled_final = float(fills.total_base or 0.0)
         avg_final = float(fills.avg_price() or 0.0)
@@ -1961,82 +2122,109 @@ class PendingOrderWorker:
                     f"Fill recovered ({rec_src}): {signal_type} {symbol} qty={rec_filled:.6f} @ ~{avg_final:.4f}",
                 )
 
-        res = type("Tmp", (), {"exchange_id": str(exchange_config.get("exchange_id") or ""), "exchange_order_id": str(market_order_id or limit_order_id), "raw": phases, "filled": filled_final, "avg_price": avg_final})()
+        res = LiveOrderResult(
+            exchange_id=str(exchange_config.get("exchange_id") or ""),
+            exchange_order_id=str(market_order_id or limit_order_id),
+            filled=filled_final,
+            avg_price=avg_final,
+            raw=phases,
+        )
 
-        executed_at = int(time.time())
         filled = filled_final
         avg_price = avg_final
-        post_query: Dict[str, Any] = phases
+        post_query: Dict[str, Any] = phases if _store_raw_phases() else summarize_phases(phases)
+        # Serialize once for both the pending_orders row and the runtime fill record.
+        try:
+            phases_json = _dumps_json(post_query or {})
+        except Exception:
+            phases_json = "{}"
 
-        # Persist queue result first (idempotency / observability).
+        # Persist queue result first, in its own commit (idempotency / observability): the order
+        # is filled on the exchange, so the row must leave 'processing' even if the bookkeeping
+        # below fails. Local position, trade row and runtime fill then share one transaction
+        # and one commit; each step still fails on its own through a savepoint.
         try:
             self._mark_sent(
                 order_id=order_id,
                 note="live_order_sent",
                 exchange_id=res.exchange_id,
                 exchange_order_id=res.exchange_order_id,
-                exchange_response_json=json.dumps({"phases": (post_query or {})}, ensure_ascii=False),
+                exchange_response_json='{"phases":' + phases_json + "}",
                 filled=filled,
                 avg_price=avg_price,
-                executed_at=executed_at,
+                executed=True,
+            )
+            _console_print(
+                "[worker] order sent: strategy_id=%s pending_id=%s exchange=%s order_id=%s filled=%s avg=%s",
+                strategy_id, order_id, res.exchange_id, res.exchange_order_id, filled, avg_price,
             )
-            _console_print(f"[worker] order sent: strategy_id={strategy_id} pending_id={order_id} exchange={res.exchange_id} order_id={res.exchange_order_id} filled={filled} avg={avg_price}")
         except Exception as e:
             logger.warning(f"mark_sent failed: pending_id={order_id}, err={e}")
 
-        # Record trade + update local position snapshot (best-effort).
         try:
-            if filled > 0 and avg_price > 0:
-                logger.info(
-                    f"live record begin: pending_id={order_id} strategy_id={strategy_id} symbol={symbol} "
-                    f"signal={signal_type} filled={filled} avg_price={avg_price} fee={fills.total_fee} fee_ccy={fills.fee_ccy}"
-                )
-                _close_reason = trade_close_reason_from_payload(payload, str(signal_type))
-                profit, matched_entry = persist_strategy_fill(
-                        strategy_id=int(strategy_id),
-                        symbol=str(symbol),
-                        signal_type=str(signal_type),
-                        filled=float(filled),
-                        avg_price=float(avg_price),
-                        exchange_config=exchange_config,
-                        market_type=str(market_type or "swap"),
-                        order_id=int(order_id),
-                        fill_source="worker",
-                        commission=float(fills.total_fee or 0.0),
-                        commission_ccy=str(fills.fee_ccy or "").strip().upper(),
-                        close_reason=_close_reason,
-                        strategy_run_id=int(payload.get("strategy_run_id") or order_row.get("strategy_run_id") or 0),
-                        order_intent_id=int(payload.get("order_intent_id") or order_row.get("order_intent_id") or 0),
-                        basket_id=str(payload.get("basket_id") or ""),
-                        exchange_id=str(res.exchange_id or ""),
-                        exchange_order_id=str(res.exchange_order_id or ""),
-                        raw_fill=post_query or {},
-                    )
-                logger.info(f"live record done: pending_id={order_id} strategy_id={strategy_id} symbol={symbol} signal={signal_type}")
-                _profit_str = f", profit={profit:.4f}" if profit is not None else ""
-                _fee_str = f", fee={fills.total_fee:.6f} {fills.fee_ccy}" if fills.total_fee > 0 else ""
-                _reason_parts = []
-                _reason = str(payload.get("reason") or "").strip()
-                if _reason:
-                    _reason_parts.append(f"reason={_reason}")
-                for _key, _label in (
-                    ("stop_loss_price", "sl"),
-                    ("take_profit_price", "tp"),
-                    ("trailing_stop_price", "trail"),
-                ):
-                    try:
-                        _v = float(payload.get(_key) or 0.0)
-                    except Exception:
-                        _v = 0.0
-                    if _v > 0:
-                        _reason_parts.append(f"{_label}={_v:.6f}")
-                _reason_str = f", {', '.join(_reason_parts)}" if _reason_parts else ""
-                append_strategy_log(
-                    strategy_id, "trade",
-                    f"Trade executed: {signal_type} {symbol} filled={filled:.6f} @ {avg_price:.6f}{_fee_str}{_profit_str}{_reason_str} (exchange={res.exchange_id})",
-                )
+            with db_transaction():
+                # Record trade + update local position snapshot (best-effort).
+                try:
+                    if filled > 0 and avg_price > 0:
+                        logger.info(
+                            "live record begin: pending_id=%s strategy_id=%s symbol=%s signal=%s filled=%s avg_price=%s fee=%s fee_ccy=%s",
+                            order_id, strategy_id, symbol, signal_type, filled, avg_price, fills.total_fee, fills.fee_ccy,
+                        )
+                        _close_reason = trade_close_reason_from_payload(payload, str(signal_type))
+                        profit, matched_entry = persist_strategy_fill(
+                                strategy_id=int(strategy_id),
+                                symbol=str(symbol),
+                                signal_type=str(signal_type),
+                                filled=float(filled),
+                                avg_price=float(avg_price),
+                                exchange_config=exchange_config,
+                                market_type=str(market_type or "swap"),
+                                order_id=int(order_id),
+                                fill_source="worker",
+                                commission=float(fills.total_fee or 0.0),
+                                commission_ccy=str(fills.fee_ccy or "").strip().upper(),
+                                close_reason=_close_reason,
+                                strategy_run_id=int(payload.get("strategy_run_id") or order_row.get("strategy_run_id") or 0),
+                                order_intent_id=int(payload.get("order_intent_id") or order_row.get("order_intent_id") or 0),
+                                basket_id=str(payload.get("basket_id") or ""),
+                                exchange_id=str(res.exchange_id or ""),
+                                exchange_order_id=str(res.exchange_order_id or ""),
+                                raw_fill=post_query or {},
+                                raw_fill_json=phases_json,
+                            )
+                        logger.info(
+                            "live record done: pending_id=%s strategy_id=%s symbol=%s signal=%s",
+                            order_id,
+                            strategy_id,
+                            symbol,
+                            signal_type,
+                        )
+                        _profit_str = f", profit={profit:.4f}" if profit is not None else ""
+                        _fee_str = f", fee={fills.total_fee:.6f} {fills.fee_ccy}" if fills.total_fee > 0 else ""
+                        _reason_parts = []
+                        _reason = str(payload.get("reason") or "").strip()
+                        if _reason:
+                            _reason_parts.append(f"reason={_reason}")
+                        for _key, _label in (
+                            ("stop_loss_price", "sl"),
+                            ("take_profit_price", "tp"),
+                            ("trailing_stop_price", "trail"),
+                        ):
+                            try:
+                                _v = float(payload.get(_key) or 0.0)
+                            except Exception:
+                                _v = 0.0
+                            if _v > 0:
+                                _reason_parts.append(f"{_label}={_v:.6f}")
+                        _reason_str = f", {', '.join(_reason_parts)}" if _reason_parts else ""
+                        append_strategy_log(
+                            strategy_id, "trade",
+                            f"Trade executed: {signal_type} {symbol} filled={filled:.6f} @ {avg_price:.6f}{_fee_str}{_profit_str}{_reason_str} (exchange={res.exchange_id})",
+                        )
+                except Exception as e:
+                    logger.warning(f"record_trade/update_position failed: pending_id={order_id}, err={e}")
         except Exception as e:
-            logger.warning(f"record_trade/update_position failed: pending_id={order_id}, err={e}")
+            logger.warning(f"order bookkeeping commit failed: pending_id={order_id}, err={e}")
 
         # Notify live results (best-effort; does not affect execution).
         _notify_live_best_effort(
@@ -2053,6 +2241,11 @@ class PendingOrderWorker:
         order_id: int,
         order_row: Dict[str, Any],
         payload: Dict[str, Any],
+        signal_type: str,
+        side: str,
+        symbol: str,
+        amount: float,
+        ref_price: float,
         client,  # IBKRClient instance
         strategy_id: int,
         exchange_config: Dict[str, Any],
@@ -2067,31 +2260,6 @@ class PendingOrderWorker:
         - Wait for fill
         - Record trade
         """
-        signal_type = payload.get("signal_type") or order_row.get("signal_type")
-        symbol = payload.get("symbol") or order_row.get("symbol")
-        amount = float(payload.get("amount") or order_row.get("amount") or 0.0)
-        ref_price = float(payload.get("ref_price") or payload.get("price") or order_row.get("price") or 0.0)
-
-        sig = str(signal_type or "").strip().lower()
-
-        # Stocks: no short selling in basic implementation
-        if "short" in sig:
-            self._mark_failed(order_id=order_id, error="ibkr_stock_short_not_supported")
-            _console_print(f"[worker] IBKR order rejected: strategy_id={strategy_id} pending_id={order_id} short not supported")
-            _notify_live_best_effort(status="failed", error="ibkr_stock_short_not_supported")
-            return
-
-        # Map signal to action (include stop/tp/trailing aliases)
-        if sig in ("open_long", "add_long"):
-            action = "buy"
-        elif sig in ("close_long", "reduce_long", "close_long_stop", "close_long_profit", "close_long_trailing"):
-            action = "sell"
-        else:
-            self._mark_failed(order_id=order_id, error=f"ibkr_unsupported_signal:{signal_type}")
-            _console_print(f"[worker] IBKR order rejected: strategy_id={strategy_id} pending_id={order_id} unsupported signal {signal_type}")
-            _notify_live_best_effort(status="failed", error=f"ibkr_unsupported_signal:{signal_type}")
-            return
-
         # Get market type (USStock)
         market_type = str(
             payload.get("market_type") or
@@ -2103,12 +2271,13 @@ class PendingOrderWorker:
 
         try:
             # Place market order via IBKR
-            result = client.place_market_order(
-                symbol=symbol,
-                side=action,
-                quantity=amount,
-                market_type=market_type,
-            )
+            with self._instrument_lock("ibkr", symbol):
+                result = client.place_market_order(
+                    symbol=symbol,
+                    side=side,
+                    quantity=amount,
+                    market_type=market_type,
+                )
 
             if not result.success:
                 self._mark_failed(order_id=order_id, error=f"ibkr_order_failed:{result.message}")
@@ -2122,60 +2291,73 @@ class PendingOrderWorker:
             exchange_order_id = str(result.order_id or "")
 
             if avg_price <= 0 and ref_price > 0:
-                logger.warning(f"[worker] IBKR order avg_price=0, using ref_price={ref_price} as fallback: strategy_id={strategy_id} pending_id={order_id}")
+                logger.warning(
+                    "[worker] IBKR order avg_price=0, using ref_price=%s as fallback: strategy_id=%s pending_id=%s",
+                    ref_price, strategy_id, order_id,
+                )
                 avg_price = ref_price
             if filled <= 0:
-                logger.warning(f"[worker] IBKR order filled=0, using amount={amount} as fallback: strategy_id={strategy_id} pending_id={order_id}")
+                logger.warning(
+                    "[worker] IBKR order filled=0, using amount=%s as fallback: strategy_id=%s pending_id=%s",
+                    amount, strategy_id, order_id,
+                )
                 filled = amount
 
-            executed_at = int(time.time())
-
-            # Mark order as sent
+            # The sent mark commits on its own first: the order is live at the broker, so a
+            # bookkeeping failure below must not leave the row 'processing' or mark it failed.
+            # Local position and trade row then share one commit.
             self._mark_sent(
                 order_id=order_id,
                 note="ibkr_order_sent",
                 exchange_id="ibkr",
                 exchange_order_id=exchange_order_id,
-                exchange_response_json=json.dumps(result.raw or {}, ensure_ascii=False),
+                exchange_response_json=_dumps_json(result.raw or {}),
                 filled=filled,
                 avg_price=avg_price,
-                executed_at=executed_at,
+                executed=True,
+            )
+            _console_print(
+                "[worker] IBKR order sent: strategy_id=%s pending_id=%s order_id=%s filled=%s avg=%s",
+                strategy_id, order_id, exchange_order_id, filled, avg_price,
             )
-            _console_print(f"[worker] IBKR order sent: strategy_id={strategy_id} pending_id={order_id} order_id={exchange_order_id} filled={filled} avg={avg_price}")
 
-            # Record trade and update position
             try:
-                if filled > 0 and avg_price > 0:
-                    logger.info(
-                        f"IBKR record begin: pending_id={order_id} strategy_id={strategy_id} symbol={symbol} "
-                        f"signal={signal_type} filled={filled} avg_price={avg_price}"
-                    )
-                    profit, matched_entry = persist_strategy_fill(
-                        strategy_id=int(strategy_id),
-                        symbol=str(symbol),
-                        signal_type=str(signal_type),
-                        filled=float(filled),
-                        avg_price=float(avg_price),
-                        exchange_config=exchange_config,
-                        market_type=str(market_type or "USStock"),
-                        order_id=int(order_id),
-                        fill_source="worker_ibkr",
-                        close_reason=trade_close_reason_from_payload(payload, str(signal_type)),
-                        strategy_run_id=int(payload.get("strategy_run_id") or order_row.get("strategy_run_id") or 0),
-                        order_intent_id=int(payload.get("order_intent_id") or order_row.get("order_intent_id") or 0),
-                        basket_id=str(payload.get("basket_id") or ""),
-                        exchange_id="ibkr",
-                        exchange_order_id=str(exchange_order_id or ""),
-                        raw_fill=result.raw or {},
-                    )
-                    logger.info(f"IBKR record done: pending_id={order_id} strategy_id={strategy_id} symbol={symbol}")
-                    _pstr = f", profit={profit:.4f}" if profit is not None else ""
-                    append_strategy_log(
-                        strategy_id, "trade",
-                        f"Trade executed: {signal_type} {symbol} filled={filled:.6f} @ {avg_price:.6f}{_pstr} (exchange=ibkr)",
-                    )
+                with db_transaction():
+                    # Record trade and update position
+                    try:
+                        if filled > 0 and avg_price > 0:
+                            logger.info(
+                                "IBKR record begin: pending_id=%s strategy_id=%s symbol=%s signal=%s filled=%s avg_price=%s",
+                                order_id, strategy_id, symbol, signal_type, filled, avg_price,
+                            )
+                            profit, matched_entry = persist_strategy_fill(
+                                strategy_id=int(strategy_id),
+                                symbol=str(symbol),
+                                signal_type=str(signal_type),
+                                filled=float(filled),
+                                avg_price=float(avg_price),
+                                exchange_config=exchange_config,
+                                market_type=str(market_type or "USStock"),
+                                order_id=int(order_id),
+                                fill_source="worker_ibkr",
+                                close_reason=trade_close_reason_from_payload(payload, str(signal_type)),
+                                strategy_run_id=int(payload.get("strategy_run_id") or order_row.get("strategy_run_id") or 0),
+                                order_intent_id=int(payload.get("order_intent_id") or order_row.get("order_intent_id") or 0),
+                                basket_id=str(payload.get("basket_id") or ""),
+                                exchange_id="ibkr",
+                                exchange_order_id=str(exchange_order_id or ""),
+                                raw_fill=result.raw or {},
+                            )
+                            logger.info("IBKR record done: pending_id=%s strategy_id=%s symbol=%s", order_id, strategy_id, symbol)
+                            _pstr = f", profit={profit:.4f}" if profit is not None else ""
+                            append_strategy_log(
+                                strategy_id, "trade",
+                                f"Trade executed: {signal_type} {symbol} filled={filled:.6f} @ {avg_price:.6f}{_pstr} (exchange=ibkr)",
+                            )
+                    except Exception as e:
+                        logger.warning(f"IBKR record_trade/update_position failed: pending_id={order_id}, err={e}")
             except Exception as e:
-                logger.warning(f"IBKR record_trade/update_position failed: pending_id={order_id}, err={e}")
+                logger.warning(f"IBKR order bookkeeping commit failed: pending_id={order_id}, err={e}")
 
             # Notify success
             _notify_live_best_effort(
@@ -2201,6 +2383,11 @@ class PendingOrderWorker:
         order_id: int,
         order_row: Dict[str, Any],
         payload: Dict[str, Any],
+        signal_type: str,
+        side: str,
+        symbol: str,
+        amount: float,
+        ref_price: float,
         client,  # AlpacaClient instance
         strategy_id: int,
         exchange_config: Dict[str, Any],
@@ -2212,43 +2399,21 @@ class PendingOrderWorker:
         Execute order via Alpaca for US stocks (USStock) or crypto.
 
         Mirrors `_execute_ibkr_order`: market order, brief poll for fill,
-        record trade, mark sent. Long-only; short signals are rejected.
+        record trade, mark sent. Long-only; short signals are rejected upstream.
         """
-        signal_type = payload.get("signal_type") or order_row.get("signal_type")
-        symbol = payload.get("symbol") or order_row.get("symbol")
-        amount = float(payload.get("amount") or order_row.get("amount") or 0.0)
-        ref_price = float(payload.get("ref_price") or payload.get("price") or order_row.get("price") or 0.0)
-
-        sig = str(signal_type or "").strip().lower()
-
-        if "short" in sig:
-            self._mark_failed(order_id=order_id, error="alpaca_short_not_supported")
-            _console_print(f"[worker] Alpaca order rejected: strategy_id={strategy_id} pending_id={order_id} short not supported")
-            _notify_live_best_effort(status="failed", error="alpaca_short_not_supported")
-            return
-
-        if sig in ("open_long", "add_long"):
-            action = "buy"
-        elif sig in ("close_long", "reduce_long", "close_long_stop", "close_long_profit", "close_long_trailing"):
-            action = "sell"
-        else:
-            self._mark_failed(order_id=order_id, error=f"alpaca_unsupported_signal:{signal_type}")
-            _console_print(f"[worker] Alpaca order rejected: strategy_id={strategy_id} pending_id={order_id} unsupported signal {signal_type}")
-            _notify_live_best_effort(status="failed", error=f"alpaca_unsupported_signal:{signal_type}")
-            return
-
         # Decide stock vs crypto leg of the Alpaca account based on the
         # strategy's market_category (USStock by default).
         mc = (market_category or "USStock").strip()
         market_type_for_client = "crypto" if mc.lower() in ("crypto", "cryptocurrency") else "USStock"
 
         try:
-            result = client.place_market_order(
-                symbol=symbol,
-                side=action,
-                quantity=amount,
-                market_type=market_type_for_client,
-            )
+            with self._instrument_lock("alpaca", symbol):
+                result = client.place_market_order(
+                    symbol=symbol,
+                    side=side,
+                    quantity=amount,
+                    market_type=market_type_for_client,
+                )
 
             if not result.success:
                 self._mark_failed(order_id=order_id, error=f"alpaca_order_failed:{result.message}")
@@ -2264,66 +2429,69 @@ class PendingOrderWorker:
             if avg_price <= 0 and ref_price > 0:
                 if filled > 0:
                     logger.warning(
-                        f"[worker] Alpaca order avg_price=0, using ref_price={ref_price} as fallback: "
-                        f"strategy_id={strategy_id} pending_id={order_id}"
+                        "[worker] Alpaca order avg_price=0, using ref_price=%s as fallback: strategy_id=%s pending_id=%s",
+                        ref_price, strategy_id, order_id,
                     )
                     avg_price = ref_price
                 else:
                     logger.info(
-                        f"[worker] Alpaca order submitted but not filled yet: "
-                        f"strategy_id={strategy_id} pending_id={order_id} status={result.status}"
+                        "[worker] Alpaca order submitted but not filled yet: strategy_id=%s pending_id=%s status=%s",
+                        strategy_id, order_id, result.status,
                     )
 
-            executed_at = int(time.time())
-
+            # Same ordering as the IBKR path: sent mark first, then one bookkeeping commit.
             self._mark_sent(
                 order_id=order_id,
                 note="alpaca_order_sent",
                 exchange_id="alpaca",
                 exchange_order_id=exchange_order_id,
-                exchange_response_json=json.dumps(result.raw or {}, ensure_ascii=False),
+                exchange_response_json=_dumps_json(result.raw or {}),
                 filled=filled,
                 avg_price=avg_price,
-                executed_at=executed_at,
+                executed=True,
             )
             _console_print(
-                f"[worker] Alpaca order sent: strategy_id={strategy_id} pending_id={order_id} "
-                f"order_id={exchange_order_id} filled={filled} avg={avg_price}"
+                "[worker] Alpaca order sent: strategy_id=%s pending_id=%s order_id=%s filled=%s avg=%s",
+                strategy_id, order_id, exchange_order_id, filled, avg_price,
             )
 
             try:
-                if filled > 0 and avg_price > 0:
-                    profit, matched_entry = persist_strategy_fill(
-                        strategy_id=int(strategy_id),
-                        symbol=str(symbol),
-                        signal_type=str(signal_type),
-                        filled=float(filled),
-                        avg_price=float(avg_price),
-                        exchange_config=exchange_config,
-                        market_type=str(market_type_for_client or "USStock"),
-                        order_id=int(order_id),
-                        fill_source="worker_alpaca",
-                        close_reason=trade_close_reason_from_payload(payload, str(signal_type)),
-                        strategy_run_id=int(payload.get("strategy_run_id") or order_row.get("strategy_run_id") or 0),
-                        order_intent_id=int(payload.get("order_intent_id") or order_row.get("order_intent_id") or 0),
-                        basket_id=str(payload.get("basket_id") or ""),
-                        exchange_id="alpaca",
-                        exchange_order_id=str(exchange_order_id or ""),
-                        raw_fill=result.raw or {},
-                    )
-                    logger.info(f"Alpaca record done: pending_id={order_id} strategy_id={strategy_id} symbol={symbol}")
-                    _pstr = f", profit={profit:.4f}" if profit is not None else ""
-                    append_strategy_log(
-                        strategy_id, "trade",
-                        f"Trade executed: {signal_type} {symbol} filled={filled:.6f} @ {avg_price:.6f}{_pstr} (exchange=alpaca)",
-                    )
-                else:
-                    append_strategy_log(
-                        strategy_id, "info",
-                        f"Alpaca order submitted: {signal_type} {symbol} status={result.status or 'submitted'}, awaiting fill",
-                    )
+                with db_transaction():
+                    try:
+                        if filled > 0 and avg_price > 0:
+                            profit, matched_entry = persist_strategy_fill(
+                                strategy_id=int(strategy_id),
+                                symbol=str(symbol),
+                                signal_type=str(signal_type),
+                                filled=float(filled),
+                                avg_price=float(avg_price),
+                                exchange_config=exchange_config,
+                                market_type=str(market_type_for_client or "USStock"),
+                                order_id=int(order_id),
+                                fill_source="worker_alpaca",
+                                close_reason=trade_close_reason_from_payload(payload, str(signal_type)),
+                                strategy_run_id=int(payload.get("strategy_run_id") or order_row.get("strategy_run_id") or 0),
+                                order_intent_id=int(payload.get("order_intent_id") or order_row.get("order_intent_id") or 0),
+                                basket_id=str(payload.get("basket_id") or ""),
+                                exchange_id="alpaca",
+                                exchange_order_id=str(exchange_order_id or ""),
+                                raw_fill=result.raw or {},
+                            )
+                            logger.info("Alpaca record done: pending_id=%s strategy_id=%s symbol=%s", order_id, strategy_id, symbol)
+                            _pstr = f", profit={profit:.4f}" if profit is not None else ""
+                            append_strategy_log(
+                                strategy_id, "trade",
+                                f"Trade executed: {signal_type} {symbol} filled={filled:.6f} @ {avg_price:.6f}{_pstr} (exchange=alpaca)",
+                            )
+                        else:
+                            append_strategy_log(
+                                strategy_id, "info",
+                                f"Alpaca order submitted: {signal_type} {symbol} status={result.status or 'submitted'}, awaiting fill",
+                            )
+                    except Exception as e:
+                        logger.warning(f"Alpaca record_trade/update_position failed: pending_id={order_id}, err={e}")
             except Exception as e:
-                logger.warning(f"Alpaca record_trade/update_position failed: pending_id={order_id}, err={e}")
+                logger.warning(f"Alpaca order bookkeeping commit failed: pending_id={order_id}, err={e}")
 
             _notify_live_best_effort(
                 status="sent",
@@ -2349,37 +2517,40 @@ class PendingOrderWorker:
         exchange_response_json: str = "",
         filled: float = 0.0,
         avg_price: float = 0.0,
-        executed_at: Optional[int] = None,
+        executed: bool = False,
     ) -> None:
         with get_db_connection() as db:
             cur = db.cursor()
-            # Use NOW() for timestamp fields; executed_at is set to NOW() if provided, else NULL
-            cur.execute(
+            # Timestamps come from the database clock; executed_at is NOW() when the order executed, else NULL
+            cur.execute_prepared(
+                "qd_pending_mark_sent",
                 """
                 UPDATE pending_orders
                 SET status = 'sent',
-                    last_error = %s,
-                    dispatch_note = %s,
+                    last_error = '',
+                    dispatch_note = $1::text,
                     sent_at = NOW(),
-                    executed_at = CASE WHEN %s THEN NOW() ELSE NULL END,
-                    exchange_id = %s,
-                    exchange_order_id = %s,
-                    exchange_response_json = %s,
-                    filled = %s,
-                    avg_price = %s,
+                    executed_at = CASE WHEN $2::boolean THEN NOW() ELSE NULL END,
+                    exchange_id = $3::text,
+                    exchange_order_id = $4::text,
+                    exchange_response_json = $5::text,
+                    filled = $6::double precision,
+                    avg_price = $7::double precision,
                     updated_at = NOW()
-                WHERE id = %s
+                WHERE id = $8::int
+                  AND status = 'processing'
+                  AND ($9::int IS NULL OR attempts = $9::int)
                 """,
                 (
-                    "",
                     str(note or ""),
-                    executed_at is not None,  # Boolean flag for CASE WHEN
+                    bool(executed),
                     str(exchange_id or ""),
                     str(exchange_order_id or ""),
                     str(exchange_response_json or ""),
                     float(filled or 0.0),
                     float(avg_price or 0.0),
                     int(order_id),
+                    self._claim_token(order_id),
                 ),
             )
             db.commit()
@@ -2388,26 +2559,32 @@ class PendingOrderWorker:
     def _mark_failed(self, order_id: int, error: str) -> None:
         with get_db_connection() as db:
             cur = db.cursor()
-            cur.execute(
+            cur.execute_prepared(
+                "qd_pending_mark_failed",
                 """
                 UPDATE pending_orders
                 SET status = 'failed',
-                    last_error = %s,
+                    last_error = $1::text,
                     updated_at = NOW()
-                WHERE id = %s
+                WHERE id = $2::int
+                  AND status = 'processing'
+                  AND ($3::int IS NULL OR attempts = $3::int)
                 """,
-                (str(error or "failed"), int(order_id)),
+                (str(error or "failed"), int(order_id), self._claim_token(order_id)),
             )
-            cur.execute(
+            cur.execute_prepared(
+                "qd_intent_mark_rejected",
                 """
                 UPDATE strategy_order_intents soi
                 SET status = 'rejected',
                     updated_at = NOW()
                 FROM pending_orders po
-                WHERE po.id = %s
+                WHERE po.id = $1::int
+                  AND po.status = 'failed'
+                  AND ($2::int IS NULL OR po.attempts = $2::int)
                   AND po.order_intent_id = soi.id
                 """,
-                (int(order_id),),
+                (int(order_id), self._claim_token(order_id)),
             )
             db.commit()
             cur.close()
@@ -2415,15 +2592,18 @@ class PendingOrderWorker:
     def _mark_deferred(self, order_id: int, reason: str) -> None:
         with get_db_connection() as db:
             cur = db.cursor()
-            cur.execute(
+            cur.execute_prepared(
+                "qd_pending_mark_deferred",
                 """
                 UPDATE pending_orders
                 SET status = 'deferred',
-                    last_error = %s,
+                    last_error = $1::text,
                     updated_at = NOW()
-                WHERE id = %s
+                WHERE id = $2::int
+                  AND status = 'processing'
+                  AND ($3::int IS NULL OR attempts = $3::int)
                 """,
-                (str(reason or "deferred"), int(order_id)),
+                (str(reason or "deferred"), int(order_id), self._claim_token(order_id)),
             )
             db.commit()
             cur.close()
@@ -41,8 +41,12 @@ def persist_strategy_fill(
     exchange_id: str = "",
     exchange_order_id: str = "",
     raw_fill: Optional[Dict[str, Any]] = None,
+    raw_fill_json: str = "",
 ) -> Tuple[Optional[float], Optional[float]]:
-    """Apply a fill to local positions and append a trade row."""
+    """Apply a fill to local positions and append a trade row.
+
+    ``raw_fill_json`` is an already-serialized ``raw_fill`` the caller can pass to skip re-encoding it.
+    """
     filled_qty = float(filled or 0.0)
     avg_px = float(avg_price or 0.0)
     if abs(filled_qty) <= 1e-12:
@@ -108,6 +112,7 @@ def persist_strategy_fill(
         exchange_id=str(exchange_id or (exchange_config or {}).get("exchange_id") or ""),
         exchange_order_id=str(exchange_order_id or ""),
         raw_fill=raw_fill or {},
+        raw_fill_json=raw_fill_json,
     )
     _apply_fill_to_basket_checkpoint(
         strategy_id=int(strategy_id),
@@ -146,6 +151,7 @@ def _record_runtime_fill(
     exchange_id: str,
     exchange_order_id: str,
     raw_fill: Dict[str, Any],
+    raw_fill_json: str = "",
 ) -> None:
     if strategy_run_id <= 0 and order_intent_id <= 0:
         return
@@ -154,10 +160,15 @@ def _record_runtime_fill(
     sig = str(signal_type or "").lower()
     pos_side = "short" if "short" in sig else "long" if "long" in sig else ""
     side = "buy" if sig in ("open_long", "add_long", "close_short", "reduce_short") else "sell"
-    try:
-        safe_raw = json.loads(json.dumps(raw_fill or {}, default=str))
-    except Exception:
-        safe_raw = {}
+    raw = raw_fill if isinstance(raw_fill, dict) else {}
+    # Serialize the (possibly large) phases blob exactly once (or reuse the caller's encoding);
+    # the fill id is a top-level key.
+    raw_json = raw_fill_json
+    if not raw_json:
+        try:
+            raw_json = json.dumps(raw, ensure_ascii=False, default=str)
+        except Exception:
+            raw, raw_json = {}, "{}"
     try:
         with get_db_connection() as db:
             cur = db.cursor()
@@ -178,7 +189,7 @@ def _record_runtime_fill(
                     str(basket_id or ""),
                     str(exchange_id or ""),
                     str(exchange_order_id or ""),
-                    str(safe_raw.get("fill_id") or safe_raw.get("trade_id") or ""),
+                    str(raw.get("fill_id") or raw.get("trade_id") or ""),
                     side,
                     pos_side,
                     float(price or 0.0),
@@ -186,7 +197,7 @@ def _record_runtime_fill(
                     float(price or 0.0) * float(quantity or 0.0),
                     float(fee or 0.0),
                     str(fee_ccy or ""),
-                    json.dumps(safe_raw, ensure_ascii=False),
+                    raw_json,
                 ),
             )
             if int(order_intent_id or 0) > 0:
@@ -6,7 +6,8 @@ differences for limit placement, fill polling, cancellation, and market tails.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from app.services.live_trading.base import LiveTradingError
 from app.services.live_trading.binance import BinanceFuturesClient
@@ -24,9 +25,48 @@ from app.services.live_trading.symbols import to_gate_currency_pair, to_okx_swap
 from app.services.pending_orders.live_order_support import FillAccumulator
 
 
-def apply_fill_snapshot(fills: FillAccumulator, snapshot: Dict[str, Any]) -> None:
-    fills.apply_fill(float(snapshot.get("filled") or 0.0), float(snapshot.get("avg_price") or 0.0))
-    fills.apply_fee(float(snapshot.get("fee") or 0.0), str(snapshot.get("fee_ccy") or ""))
+class FillQuote(NamedTuple):
+    filled: float
+    avg_price: float
+    fee: float
+    fee_ccy: str
+
+
+def parse_fill_quote(snapshot: Dict[str, Any]) -> FillQuote:
+    """Coerce a wait_for_fill snapshot's fill/fee fields in one pass."""
+    get = snapshot.get
+    return FillQuote(
+        float(get("filled") or 0.0),
+        float(get("avg_price") or 0.0),
+        float(get("fee") or 0.0),
+        str(get("fee_ccy") or ""),
+    )
+
+
+def apply_fill_snapshot(fills: FillAccumulator, snapshot: Dict[str, Any]) -> float:
+    """Fold one wait_for_fill snapshot into ``fills``; returns the snapshot's filled quantity."""
+    filled, avg_price, fee, fee_ccy = parse_fill_quote(snapshot)
+    fills.apply_fill(filled, avg_price)
+    fills.apply_fee(fee, fee_ccy)
+    return filled
+
+
+def apply_fill_delta(fills: FillAccumulator, before: Dict[str, Any], after: Dict[str, Any]) -> float:
+    """Fold what one order filled between two cumulative snapshots into ``fills``; returns that quantity."""
+    b_filled, b_avg, b_fee, _ = parse_fill_quote(before)
+    a_filled, a_avg, a_fee, a_fee_ccy = parse_fill_quote(after)
+    extra = a_filled - b_filled
+    if extra <= 0 or a_avg <= 0:
+        return 0.0
+    fills.apply_fill(extra, (a_filled * a_avg - b_filled * b_avg) / extra)
+    fills.apply_fee(a_fee - b_fee, a_fee_ccy)
+    return extra
+
+
+def record_phase_query(phases: Dict[str, Any], key: str, fills: FillAccumulator, snapshot: Dict[str, Any]) -> float:
+    """Store a phase's fill snapshot under ``phases[key]`` and accumulate it; returns the filled quantity."""
+    phases[key] = snapshot
+    return apply_fill_snapshot(fills, snapshot)
 
 
 def maker_limit_price(*, ref_price: float, side: str, maker_offset: float) -> float:
@@ -41,6 +81,318 @@ def maker_limit_price(*, ref_price: float, side: str, maker_offset: float) -> fl
     return limit_price * (1.0 + float(maker_offset or 0.0))
 
 
+# Client class -> exchange key. The isinstance ladder below runs once per client class;
+# every later order of that class is a single dict lookup.
+_CLIENT_KINDS: Dict[type, str] = {}
+
+
+def _classify_client(client: Any) -> str:
+    if isinstance(client, BinanceFuturesClient):
+        return "binance_futures"
+    if isinstance(client, BinanceSpotClient):
+        return "binance_spot"
+    if isinstance(client, OkxClient):
+        return "okx"
+    if isinstance(client, BitgetMixClient):
+        return "bitget_mix"
+    if isinstance(client, BitgetSpotClient):
+        return "bitget_spot"
+    if isinstance(client, BybitClient):
+        return "bybit"
+    if isinstance(client, CoinbaseExchangeClient):
+        return "coinbase"
+    if isinstance(client, KrakenClient):
+        return "kraken"
+    if isinstance(client, KrakenFuturesClient):
+        return "kraken_futures"
+    if isinstance(client, GateSpotClient):
+        return "gate_spot"
+    if isinstance(client, GateUsdtFuturesClient):
+        return "gate_futures"
+    if isinstance(client, HtxClient):
+        return "htx"
+    return ""
+
+
+def client_kind(client: Any) -> str:
+    """Exchange key for ``client`` ("" when unsupported), cached per client class."""
+    cls = client.__class__
+    kind = _CLIENT_KINDS.get(cls)
+    if kind is None:
+        kind = _CLIENT_KINDS[cls] = _classify_client(client)
+    return kind
+
+
+class BitgetMixParams(NamedTuple):
+    product_type: str
+    margin_coin: str
+    margin_mode: str
+
+
+def bitget_mix_params(payload: Dict[str, Any], exchange_config: Dict[str, Any]) -> BitgetMixParams:
+    """Resolve the Bitget mix config strings once per order; pass the result to each phase via ``bitget=``."""
+    return BitgetMixParams(
+        _bitget_product_type(exchange_config),
+        _bitget_margin_coin(exchange_config),
+        _bitget_margin_mode(payload, exchange_config),
+    )
+
+
+def _bitget_product_type(exchange_config: Dict[str, Any]) -> str:
+    return str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
+
+
+def _bitget_margin_coin(exchange_config: Dict[str, Any]) -> str:
+    return str(exchange_config.get("margin_coin") or exchange_config.get("marginCoin") or "USDT")
+
+
+def _bitget_margin_mode(payload: Dict[str, Any], exchange_config: Dict[str, Any]) -> str:
+    return str(
+        payload.get("margin_mode")
+        or payload.get("marginMode")
+        or exchange_config.get("margin_mode")
+        or exchange_config.get("marginMode")
+        or "cross"
+    )
+
+
+def _set_okx_leverage(client: Any, *, symbol: str, market_type: str, leverage: float, td_mode: str, pos_side: str) -> None:
+    if market_type == "swap":
+        try:
+            client.set_leverage(inst_id=to_okx_swap_inst_id(str(symbol)), lever=leverage, mgn_mode=td_mode, pos_side=pos_side)
+        except Exception:
+            pass
+
+
+def _set_bitget_leverage(
+    client: Any,
+    *,
+    symbol: str,
+    market_type: str,
+    leverage: float,
+    margin_coin: str,
+    product_type: str,
+    margin_mode: str,
+    pos_side: str,
+) -> None:
+    try:
+        if market_type == "swap":
+            client.set_leverage(
+                symbol=str(symbol),
+                leverage=leverage,
+                margin_coin=margin_coin,
+                product_type=product_type,
+                margin_mode=margin_mode,
+                hold_side=pos_side,
+            )
+    except Exception:
+        pass
+
+
+def _set_gate_leverage(client: Any, *, symbol: str, leverage: float) -> None:
+    try:
+        client.set_leverage(contract=to_gate_currency_pair(str(symbol)), leverage=leverage)
+    except Exception:
+        pass
+
+
+def _set_htx_leverage(client: Any, *, symbol: str, market_type: str, leverage: float) -> None:
+    if market_type == "swap":
+        try:
+            client.set_leverage(symbol=str(symbol), leverage=leverage)
+        except Exception:
+            pass
+
+
+# Order modes that start with a resting limit order (post-only where the venue supports it).
+MAKER_ORDER_MODES = frozenset({"maker", "maker_then_market", "limit_first", "limit"})
+
+
+def _spot_market_size(*, side: str, amount: float, ref_price: float, spot_quote_amt: float, spot_market_buy_uses_quote: bool) -> float:
+    mkt_size = spot_quote_amt if (side == "buy" and spot_market_buy_uses_quote and spot_quote_amt > 0) else amount
+    if side == "buy" and mkt_size <= 0 and ref_price > 0:
+        mkt_size = amount * ref_price
+    return mkt_size
+
+
+# --- order placement ---------------------------------------------------------
+
+
+@dataclass(slots=True)
+class OrderRequest:
+    """Normalized arguments for one limit or market placement, built once per phase."""
+
+    symbol: str
+    side: str
+    amount: float
+    reduce_only: bool
+    pos_side: str
+    client_order_id: str
+    market_type: str
+    payload: Dict[str, Any]
+    exchange_config: Dict[str, Any]
+    leverage: float
+    price: float = 0.0
+    post_only: bool = False
+    ref_price: float = 0.0
+    spot_quote_amt: float = 0.0
+    spot_market_buy_uses_quote: bool = False
+    bitget: Optional[BitgetMixParams] = None
+
+    @property
+    def binance_side(self) -> str:
+        return "BUY" if self.side == "buy" else "SELL"
+
+    @property
+    def okx_td_mode(self) -> str:
+        return str(self.payload.get("margin_mode") or self.payload.get("td_mode") or "cross")
+
+    @property
+    def bitget_hold_side(self) -> str:
+        return self.pos_side or ("long" if self.side == "buy" else "short")
+
+
+def _bitget_swap_params(client: Any, req: OrderRequest) -> BitgetMixParams:
+    """(product_type, margin_coin, margin_mode) for Bitget mix; also applies leverage on swaps."""
+    params = req.bitget or bitget_mix_params(req.payload, req.exchange_config)
+    product_type, margin_coin, margin_mode = params
+    _set_bitget_leverage(
+        client,
+        symbol=req.symbol,
+        market_type=req.market_type,
+        leverage=req.leverage,
+        margin_coin=margin_coin,
+        product_type=product_type,
+        margin_mode=margin_mode,
+        pos_side=req.pos_side,
+    )
+    return params
+
+
+def _limit_binance_futures(client: Any, req: OrderRequest) -> Any:
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.binance_side,
+        quantity=req.amount,
+        price=req.price,
+        reduce_only=req.reduce_only,
+        position_side=req.pos_side,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _limit_binance_spot(client: Any, req: OrderRequest) -> Any:
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.binance_side,
+        quantity=req.amount,
+        price=req.price,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _limit_okx(client: Any, req: OrderRequest) -> Any:
+    td_mode = req.okx_td_mode
+    _set_okx_leverage(client, symbol=req.symbol, market_type=req.market_type, leverage=req.leverage, td_mode=td_mode, pos_side=req.pos_side)
+    return client.place_limit_order(
+        market_type=req.market_type,
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        price=req.price,
+        pos_side=req.pos_side,
+        td_mode=td_mode,
+        reduce_only=req.reduce_only,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _limit_bitget_mix(client: Any, req: OrderRequest) -> Any:
+    product_type, margin_coin, margin_mode = _bitget_swap_params(client, req)
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        price=req.price,
+        margin_coin=margin_coin,
+        product_type=product_type,
+        margin_mode=margin_mode,
+        reduce_only=req.reduce_only,
+        post_only=req.post_only,
+        client_order_id=req.client_order_id,
+        hold_side=req.bitget_hold_side,
+    )
+
+
+def _limit_simple_spot(client: Any, req: OrderRequest) -> Any:
+    return client.place_limit_order(symbol=req.symbol, side=req.side, size=req.amount, price=req.price, client_order_id=req.client_order_id)
+
+
+def _limit_bybit(client: Any, req: OrderRequest) -> Any:
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.side,
+        qty=req.amount,
+        price=req.price,
+        reduce_only=req.reduce_only,
+        pos_side=req.pos_side,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _limit_kraken_futures(client: Any, req: OrderRequest) -> Any:
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        price=req.price,
+        reduce_only=req.reduce_only,
+        post_only=req.post_only,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _limit_gate_futures(client: Any, req: OrderRequest) -> Any:
+    _set_gate_leverage(client, symbol=req.symbol, leverage=req.leverage)
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        price=req.price,
+        reduce_only=req.reduce_only,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _limit_htx(client: Any, req: OrderRequest) -> Any:
+    _set_htx_leverage(client, symbol=req.symbol, market_type=req.market_type, leverage=req.leverage)
+    return client.place_limit_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        price=req.price,
+        reduce_only=req.reduce_only,
+        pos_side=req.pos_side,
+        client_order_id=req.client_order_id,
+    )
+
+
+_PLACE_LIMIT: Dict[str, Callable[[Any, OrderRequest], Any]] = {
+    "binance_futures": _limit_binance_futures,
+    "binance_spot": _limit_binance_spot,
+    "okx": _limit_okx,
+    "bitget_mix": _limit_bitget_mix,
+    "bitget_spot": _limit_simple_spot,
+    "bybit": _limit_bybit,
+    "coinbase": _limit_simple_spot,
+    "kraken": _limit_simple_spot,
+    "kraken_futures": _limit_kraken_futures,
+    "gate_spot": _limit_simple_spot,
+    "gate_futures": _limit_gate_futures,
+    "htx": _limit_htx,
+}
+
+
 def place_live_limit_order(
     *,
     client: Any,
@@ -56,135 +408,121 @@ def place_live_limit_order(
     exchange_config: Dict[str, Any],
     leverage: float,
     order_mode: str,
+    bitget: Optional[BitgetMixParams] = None,
 ) -> Any:
-    if isinstance(client, BinanceFuturesClient):
-        return client.place_limit_order(
-            symbol=str(symbol),
-            side="BUY" if side == "buy" else "SELL",
-            quantity=amount,
-            price=price,
-            reduce_only=reduce_only,
-            position_side=pos_side,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, BinanceSpotClient):
-        return client.place_limit_order(
-            symbol=str(symbol),
-            side="BUY" if side == "buy" else "SELL",
-            quantity=amount,
-            price=price,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, OkxClient):
-        td_mode = str(payload.get("margin_mode") or payload.get("td_mode") or "cross")
-        if market_type == "swap":
-            try:
-                client.set_leverage(inst_id=to_okx_swap_inst_id(str(symbol)), lever=leverage, mgn_mode=td_mode, pos_side=pos_side)
-            except Exception:
-                pass
-        return client.place_limit_order(
-            market_type=market_type,
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            price=price,
-            pos_side=pos_side,
-            td_mode=td_mode,
-            reduce_only=reduce_only,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, BitgetMixClient):
-        product_type = str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
-        margin_coin = str(exchange_config.get("margin_coin") or exchange_config.get("marginCoin") or "USDT")
-        margin_mode = str(
-            payload.get("margin_mode")
-            or payload.get("marginMode")
-            or exchange_config.get("margin_mode")
-            or exchange_config.get("marginMode")
-            or "cross"
-        )
-        try:
-            if market_type == "swap":
-                client.set_leverage(
-                    symbol=str(symbol),
-                    leverage=leverage,
-                    margin_coin=margin_coin,
-                    product_type=product_type,
-                    margin_mode=margin_mode,
-                    hold_side=pos_side,
-                )
-        except Exception:
-            pass
-        return client.place_limit_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            price=price,
-            margin_coin=margin_coin,
-            product_type=product_type,
-            margin_mode=margin_mode,
-            reduce_only=reduce_only,
-            post_only=(order_mode in ("maker", "maker_then_market", "limit_first", "limit")),
-            client_order_id=client_order_id,
-            hold_side=pos_side or ("long" if side == "buy" else "short"),
-        )
-    if isinstance(client, BitgetSpotClient):
-        return client.place_limit_order(symbol=str(symbol), side=side, size=amount, price=price, client_order_id=client_order_id)
-    if isinstance(client, BybitClient):
-        return client.place_limit_order(
+    handler = phase_handlers(client).place_limit
+    if handler is None:
+        raise LiveTradingError(f"Unsupported client type: {type(client)}")
+    return handler(
+        client,
+        OrderRequest(
             symbol=str(symbol),
             side=side,
-            qty=amount,
-            price=price,
+            amount=amount,
             reduce_only=reduce_only,
             pos_side=pos_side,
             client_order_id=client_order_id,
-        )
-    if isinstance(client, CoinbaseExchangeClient):
-        return client.place_limit_order(symbol=str(symbol), side=side, size=amount, price=price, client_order_id=client_order_id)
-    if isinstance(client, KrakenClient):
-        return client.place_limit_order(symbol=str(symbol), side=side, size=amount, price=price, client_order_id=client_order_id)
-    if isinstance(client, KrakenFuturesClient):
-        return client.place_limit_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            price=price,
-            reduce_only=reduce_only,
-            post_only=(order_mode in ("maker", "maker_then_market", "limit_first", "limit")),
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, GateSpotClient):
-        return client.place_limit_order(symbol=str(symbol), side=side, size=amount, price=price, client_order_id=client_order_id)
-    if isinstance(client, GateUsdtFuturesClient):
-        try:
-            client.set_leverage(contract=to_gate_currency_pair(str(symbol)), leverage=leverage)
-        except Exception:
-            pass
-        return client.place_limit_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            price=price,
-            reduce_only=reduce_only,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, HtxClient):
-        if market_type == "swap":
-            try:
-                client.set_leverage(symbol=str(symbol), leverage=leverage)
-            except Exception:
-                pass
-        return client.place_limit_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
+            market_type=market_type,
+            payload=payload,
+            exchange_config=exchange_config,
+            leverage=leverage,
             price=price,
-            reduce_only=reduce_only,
-            pos_side=pos_side,
-            client_order_id=client_order_id,
-        )
-    raise LiveTradingError(f"Unsupported client type: {type(client)}")
+            post_only=order_mode in MAKER_ORDER_MODES,
+            bitget=bitget,
+        ),
+    )
+
+
+# --- fill polling ------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class OrderRef:
+    """An order already on the exchange, as the poll / cancel handlers need it."""
+
+    symbol: str
+    order_id: str
+    client_order_id: str
+    market_type: str
+    exchange_config: Dict[str, Any]
+    wait_sec: float = 0.0
+    defer_fee: bool = False
+    bitget: Optional[BitgetMixParams] = None
+
+    @property
+    def bitget_product_type(self) -> str:
+        return self.bitget.product_type if self.bitget else _bitget_product_type(self.exchange_config)
+
+    @property
+    def bitget_margin_coin(self) -> str:
+        return self.bitget.margin_coin if self.bitget else _bitget_margin_coin(self.exchange_config)
+
+
+def _wait_symbol_ids(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(symbol=ref.symbol, order_id=ref.order_id, client_order_id=ref.client_order_id, max_wait_sec=ref.wait_sec)
+
+
+def _wait_binance(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(
+        symbol=ref.symbol,
+        order_id=ref.order_id,
+        client_order_id=ref.client_order_id,
+        max_wait_sec=ref.wait_sec,
+        fetch_fee=not ref.defer_fee,
+    )
+
+
+def _wait_okx(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(
+        symbol=ref.symbol,
+        ord_id=ref.order_id,
+        cl_ord_id=ref.client_order_id,
+        market_type=ref.market_type,
+        max_wait_sec=ref.wait_sec,
+    )
+
+
+def _wait_bitget_mix(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(
+        symbol=ref.symbol,
+        product_type=ref.bitget_product_type,
+        order_id=ref.order_id,
+        client_oid=ref.client_order_id,
+        max_wait_sec=ref.wait_sec,
+    )
+
+
+def _wait_ids(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(order_id=ref.order_id, client_order_id=ref.client_order_id, max_wait_sec=ref.wait_sec)
+
+
+def _wait_order_id(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(order_id=ref.order_id, max_wait_sec=ref.wait_sec)
+
+
+def _wait_gate_futures(client: Any, ref: OrderRef) -> Dict[str, Any]:
+    return client.wait_for_fill(order_id=ref.order_id, contract=to_gate_currency_pair(ref.symbol), max_wait_sec=ref.wait_sec)
+
+
+_WAIT_FILL: Dict[str, Callable[[Any, OrderRef], Dict[str, Any]]] = {
+    "binance_futures": _wait_binance,
+    "binance_spot": _wait_binance,
+    "okx": _wait_okx,
+    "bitget_mix": _wait_bitget_mix,
+    "bitget_spot": _wait_symbol_ids,
+    "bybit": _wait_symbol_ids,
+    "coinbase": _wait_ids,
+    "kraken": _wait_order_id,
+    "kraken_futures": _wait_ids,
+    "gate_spot": _wait_order_id,
+    "gate_futures": _wait_gate_futures,
+    "htx": _wait_symbol_ids,
+}
+
+_FAST_MARKET_FILL_KINDS = frozenset({"binance_futures", "binance_spot"})
+# Clients whose fill polling can skip the per-order fee query so fees are fetched once per pending order.
+_BATCHED_FEE_KINDS = frozenset({"binance_futures", "binance_spot"})
+_SLOW_LIMIT_FILL_KINDS = frozenset({"bitget_mix", "bitget_spot", "gate_spot", "gate_futures"})
 
 
 def wait_live_order_fill(
@@ -197,43 +535,78 @@ def wait_live_order_fill(
     exchange_config: Dict[str, Any],
     max_wait_sec: float,
     phase: str,
+    defer_fee: bool = False,
+    bitget: Optional[BitgetMixParams] = None,
 ) -> Dict[str, Any]:
-    wait_sec = float(max_wait_sec or 0.0)
+    handlers = phase_handlers(client)
+    handler = handlers.wait_fill
+    if handler is None:
+        raise LiveTradingError(f"Unsupported client type: {type(client)}")
     if phase == "market":
-        wait_sec = 5.0 if isinstance(client, (BinanceFuturesClient, BinanceSpotClient)) else 12.0
-    elif isinstance(client, (BitgetMixClient, BitgetSpotClient, GateSpotClient, GateUsdtFuturesClient)):
-        wait_sec = max(wait_sec, 8.0)
+        wait_sec = handlers.market_wait_sec
+    else:
+        wait_sec = max(float(max_wait_sec or 0.0), handlers.limit_wait_floor_sec)
+    return handler(client, OrderRef(str(symbol), order_id, client_order_id, market_type, exchange_config, wait_sec, defer_fee, bitget))
 
-    if isinstance(client, (BinanceFuturesClient, BinanceSpotClient)):
-        return client.wait_for_fill(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id, max_wait_sec=wait_sec)
-    if isinstance(client, OkxClient):
-        return client.wait_for_fill(
-            symbol=str(symbol),
-            ord_id=order_id,
-            cl_ord_id=client_order_id,
-            market_type=market_type,
-            max_wait_sec=wait_sec,
-        )
-    if isinstance(client, BitgetMixClient):
-        product_type = str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
-        return client.wait_for_fill(symbol=str(symbol), product_type=product_type, order_id=order_id, client_oid=client_order_id, max_wait_sec=wait_sec)
-    if isinstance(client, BitgetSpotClient):
-        return client.wait_for_fill(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id, max_wait_sec=wait_sec)
-    if isinstance(client, BybitClient):
-        return client.wait_for_fill(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id, max_wait_sec=wait_sec)
-    if isinstance(client, CoinbaseExchangeClient):
-        return client.wait_for_fill(order_id=order_id, client_order_id=client_order_id, max_wait_sec=wait_sec)
-    if isinstance(client, KrakenClient):
-        return client.wait_for_fill(order_id=order_id, max_wait_sec=wait_sec)
-    if isinstance(client, KrakenFuturesClient):
-        return client.wait_for_fill(order_id=order_id, client_order_id=client_order_id, max_wait_sec=wait_sec)
-    if isinstance(client, GateSpotClient):
-        return client.wait_for_fill(order_id=order_id, max_wait_sec=wait_sec)
-    if isinstance(client, GateUsdtFuturesClient):
-        return client.wait_for_fill(order_id=order_id, contract=to_gate_currency_pair(str(symbol)), max_wait_sec=wait_sec)
-    if isinstance(client, HtxClient):
-        return client.wait_for_fill(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id, max_wait_sec=wait_sec)
-    raise LiveTradingError(f"Unsupported client type: {type(client)}")
+
+def supports_batched_fees(client: Any) -> bool:
+    return client_kind(client) in _BATCHED_FEE_KINDS
+
+
+def fetch_live_order_fees(*, client: Any, symbol: str, order_ids: List[str], filled: float, avg_price: float) -> Tuple[float, str]:
+    """One commission lookup covering every phase order (limit + market tail) of a pending order."""
+    if not order_ids or not supports_batched_fees(client):
+        return 0.0, ""
+    return client.get_fees_for_orders(symbol=str(symbol), order_ids=order_ids, filled=filled, avg_price=avg_price)
+
+
+# --- cancellation ------------------------------------------------------------
+
+
+def _cancel_symbol_ids(client: Any, ref: OrderRef) -> Any:
+    return client.cancel_order(symbol=ref.symbol, order_id=ref.order_id, client_order_id=ref.client_order_id)
+
+
+def _cancel_okx(client: Any, ref: OrderRef) -> Any:
+    return client.cancel_order(market_type=ref.market_type, symbol=ref.symbol, ord_id=ref.order_id, cl_ord_id=ref.client_order_id)
+
+
+def _cancel_bitget_mix(client: Any, ref: OrderRef) -> Any:
+    return client.cancel_order(
+        symbol=ref.symbol,
+        product_type=ref.bitget_product_type,
+        margin_coin=ref.bitget_margin_coin,
+        order_id=ref.order_id,
+        client_oid=ref.client_order_id,
+    )
+
+
+def _cancel_bitget_spot(client: Any, ref: OrderRef) -> Any:
+    return client.cancel_order(symbol=ref.symbol, client_order_id=ref.client_order_id)
+
+
+def _cancel_ids(client: Any, ref: OrderRef) -> Any:
+    return client.cancel_order(order_id=ref.order_id, client_order_id=ref.client_order_id)
+
+
+def _cancel_order_id(client: Any, ref: OrderRef) -> Any:
+    return client.cancel_order(order_id=ref.order_id)
+
+
+_CANCEL: Dict[str, Callable[[Any, OrderRef], Any]] = {
+    "binance_futures": _cancel_symbol_ids,
+    "binance_spot": _cancel_symbol_ids,
+    "okx": _cancel_okx,
+    "bitget_mix": _cancel_bitget_mix,
+    "bitget_spot": _cancel_bitget_spot,
+    "bybit": _cancel_symbol_ids,
+    "coinbase": _cancel_ids,
+    "kraken": _cancel_order_id,
+    "kraken_futures": _cancel_ids,
+    "gate_spot": _cancel_order_id,
+    "gate_futures": _cancel_order_id,
+    "htx": _cancel_symbol_ids,
+}
 
 
 def cancel_live_limit_order(
@@ -244,34 +617,12 @@ def cancel_live_limit_order(
     client_order_id: str,
     market_type: str,
     exchange_config: Dict[str, Any],
+    bitget: Optional[BitgetMixParams] = None,
 ) -> Any:
-    if isinstance(client, BinanceFuturesClient):
-        return client.cancel_order(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id)
-    if isinstance(client, BinanceSpotClient):
-        return client.cancel_order(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id)
-    if isinstance(client, OkxClient):
-        return client.cancel_order(market_type=market_type, symbol=str(symbol), ord_id=order_id, cl_ord_id=client_order_id)
-    if isinstance(client, BitgetMixClient):
-        product_type = str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
-        margin_coin = str(exchange_config.get("margin_coin") or exchange_config.get("marginCoin") or "USDT")
-        return client.cancel_order(symbol=str(symbol), product_type=product_type, margin_coin=margin_coin, order_id=order_id, client_oid=client_order_id)
-    if isinstance(client, BitgetSpotClient):
-        return client.cancel_order(symbol=str(symbol), client_order_id=client_order_id)
-    if isinstance(client, BybitClient):
-        return client.cancel_order(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id)
-    if isinstance(client, CoinbaseExchangeClient):
-        return client.cancel_order(order_id=order_id, client_order_id=client_order_id)
-    if isinstance(client, KrakenClient):
-        return client.cancel_order(order_id=order_id)
-    if isinstance(client, KrakenFuturesClient):
-        return client.cancel_order(order_id=order_id, client_order_id=client_order_id)
-    if isinstance(client, GateSpotClient):
-        return client.cancel_order(order_id=order_id)
-    if isinstance(client, GateUsdtFuturesClient):
-        return client.cancel_order(order_id=order_id)
-    if isinstance(client, HtxClient):
-        return client.cancel_order(symbol=str(symbol), order_id=order_id, client_order_id=client_order_id)
-    return None
+    handler = phase_handlers(client).cancel
+    if handler is None:
+        return None
+    return handler(client, OrderRef(str(symbol), order_id, client_order_id, market_type, exchange_config, bitget=bitget))
 
 
 def apply_okx_tail_guard(
@@ -282,16 +633,11 @@ def apply_okx_tail_guard(
     market_type: str,
     phases: Dict[str, Any],
 ) -> float:
-    if remaining <= 0 or not isinstance(client, OkxClient) or market_type != "swap":
+    if remaining <= 0 or client_kind(client) != "okx" or market_type != "swap":
         return remaining
     try:
         inst_id = to_okx_swap_inst_id(str(symbol))
-        inst = client.get_instrument(inst_type="SWAP", inst_id=inst_id) or {}
-        lot_sz = float(inst.get("lotSz") or 0.0)
-        min_sz = float(inst.get("minSz") or 0.0)
-        ct_val = float(inst.get("ctVal") or 0.0)
-        min_contract = min_sz if min_sz > 0 else (lot_sz if lot_sz > 0 else 0.0)
-        min_base = (min_contract * ct_val) if (min_contract > 0 and ct_val > 0) else 0.0
+        min_base = client.swap_min_base(inst_id)
         if min_base > 0 and remaining < (min_base * 0.999999):
             phases["tail_guard"] = {
                 "exchange": "okx",
@@ -305,6 +651,134 @@ def apply_okx_tail_guard(
     return remaining
 
 
+# --- market orders -----------------------------------------------------------
+
+
+def _market_binance_futures(client: Any, req: OrderRequest) -> Any:
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.binance_side,
+        quantity=req.amount,
+        reduce_only=req.reduce_only,
+        position_side=req.pos_side,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _market_binance_spot(client: Any, req: OrderRequest) -> Any:
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.binance_side,
+        quantity=req.amount,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _market_okx(client: Any, req: OrderRequest) -> Any:
+    td_mode = req.okx_td_mode
+    _set_okx_leverage(client, symbol=req.symbol, market_type=req.market_type, leverage=req.leverage, td_mode=td_mode, pos_side=req.pos_side)
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        market_type=req.market_type,
+        pos_side=req.pos_side,
+        td_mode=td_mode,
+        reduce_only=req.reduce_only,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _market_bitget_mix(client: Any, req: OrderRequest) -> Any:
+    product_type, margin_coin, margin_mode = _bitget_swap_params(client, req)
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        margin_coin=margin_coin,
+        product_type=product_type,
+        margin_mode=margin_mode,
+        reduce_only=req.reduce_only,
+        client_order_id=req.client_order_id,
+        hold_side=req.bitget_hold_side,
+    )
+
+
+def _market_quote_spot(client: Any, req: OrderRequest) -> Any:
+    mkt_size = _spot_market_size(
+        side=req.side,
+        amount=req.amount,
+        ref_price=req.ref_price,
+        spot_quote_amt=req.spot_quote_amt,
+        spot_market_buy_uses_quote=req.spot_market_buy_uses_quote,
+    )
+    return client.place_market_order(symbol=req.symbol, side=req.side, size=mkt_size, client_order_id=req.client_order_id)
+
+
+def _market_bybit(client: Any, req: OrderRequest) -> Any:
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.side,
+        qty=req.amount,
+        reduce_only=req.reduce_only,
+        pos_side=req.pos_side,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _market_simple_spot(client: Any, req: OrderRequest) -> Any:
+    return client.place_market_order(symbol=req.symbol, side=req.side, size=req.amount, client_order_id=req.client_order_id)
+
+
+def _market_kraken_futures(client: Any, req: OrderRequest) -> Any:
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        reduce_only=req.reduce_only,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _market_gate_futures(client: Any, req: OrderRequest) -> Any:
+    _set_gate_leverage(client, symbol=req.symbol, leverage=req.leverage)
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.side,
+        size=req.amount,
+        reduce_only=req.reduce_only,
+        client_order_id=req.client_order_id,
+    )
+
+
+def _market_htx(client: Any, req: OrderRequest) -> Any:
+    _set_htx_leverage(client, symbol=req.symbol, market_type=req.market_type, leverage=req.leverage)
+    return client.place_market_order(
+        symbol=req.symbol,
+        side=req.side,
+        qty=req.amount,
+        reduce_only=req.reduce_only,
+        pos_side=req.pos_side,
+        client_order_id=req.client_order_id,
+    )
+
+
+_PLACE_MARKET: Dict[str, Callable[[Any, OrderRequest], Any]] = {
+    "binance_futures": _market_binance_futures,
+    "binance_spot": _market_binance_spot,
+    "okx": _market_okx,
+    "bitget_mix": _market_bitget_mix,
+    "bitget_spot": _market_quote_spot,
+    "bybit": _market_bybit,
+    "coinbase": _market_simple_spot,
+    "kraken": _market_simple_spot,
+    "kraken_futures": _market_kraken_futures,
+    "gate_spot": _market_quote_spot,
+    "gate_futures": _market_gate_futures,
+    "htx": _market_htx,
+}
+
+
 def place_live_market_order(
     *,
     client: Any,
@@ -321,122 +795,60 @@ def place_live_market_order(
     ref_price: float,
     spot_quote_amt: float,
     spot_market_buy_uses_quote: bool,
+    bitget: Optional[BitgetMixParams] = None,
 ) -> Any:
-    if isinstance(client, BinanceFuturesClient):
-        return client.place_market_order(
-            symbol=str(symbol),
-            side="BUY" if side == "buy" else "SELL",
-            quantity=amount,
-            reduce_only=reduce_only,
-            position_side=pos_side,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, BinanceSpotClient):
-        return client.place_market_order(
-            symbol=str(symbol),
-            side="BUY" if side == "buy" else "SELL",
-            quantity=amount,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, OkxClient):
-        td_mode = str(payload.get("margin_mode") or payload.get("td_mode") or "cross")
-        if market_type == "swap":
-            try:
-                client.set_leverage(inst_id=to_okx_swap_inst_id(str(symbol)), lever=leverage, mgn_mode=td_mode, pos_side=pos_side)
-            except Exception:
-                pass
-        return client.place_market_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            market_type=market_type,
-            pos_side=pos_side,
-            td_mode=td_mode,
-            reduce_only=reduce_only,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, BitgetMixClient):
-        product_type = str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
-        margin_coin = str(exchange_config.get("margin_coin") or exchange_config.get("marginCoin") or "USDT")
-        margin_mode = str(
-            payload.get("margin_mode")
-            or payload.get("marginMode")
-            or exchange_config.get("margin_mode")
-            or exchange_config.get("marginMode")
-            or "cross"
-        )
-        try:
-            if market_type == "swap":
-                client.set_leverage(
-                    symbol=str(symbol),
-                    leverage=leverage,
-                    margin_coin=margin_coin,
-                    product_type=product_type,
-                    margin_mode=margin_mode,
-                    hold_side=pos_side,
-                )
-        except Exception:
-            pass
-        return client.place_market_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            margin_coin=margin_coin,
-            product_type=product_type,
-            margin_mode=margin_mode,
-            reduce_only=reduce_only,
-            client_order_id=client_order_id,
-            hold_side=pos_side or ("long" if side == "buy" else "short"),
-        )
-    if isinstance(client, BitgetSpotClient):
-        mkt_size = spot_quote_amt if (side == "buy" and spot_market_buy_uses_quote and spot_quote_amt > 0) else amount
-        if side == "buy" and mkt_size <= 0 and ref_price > 0:
-            mkt_size = amount * ref_price
-        return client.place_market_order(symbol=str(symbol), side=side, size=mkt_size, client_order_id=client_order_id)
-    if isinstance(client, BybitClient):
-        return client.place_market_order(
+    handler = phase_handlers(client).place_market
+    if handler is None:
+        raise LiveTradingError(f"Unsupported client type: {type(client)}")
+    return handler(
+        client,
+        OrderRequest(
             symbol=str(symbol),
             side=side,
-            qty=amount,
-            reduce_only=reduce_only,
-            pos_side=pos_side,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, CoinbaseExchangeClient):
-        return client.place_market_order(symbol=str(symbol), side=side, size=amount, client_order_id=client_order_id)
-    if isinstance(client, KrakenClient):
-        return client.place_market_order(symbol=str(symbol), side=side, size=amount, client_order_id=client_order_id)
-    if isinstance(client, KrakenFuturesClient):
-        return client.place_market_order(symbol=str(symbol), side=side, size=amount, reduce_only=reduce_only, client_order_id=client_order_id)
-    if isinstance(client, GateSpotClient):
-        mkt_size = spot_quote_amt if (side == "buy" and spot_market_buy_uses_quote and spot_quote_amt > 0) else amount
-        if side == "buy" and mkt_size <= 0 and ref_price > 0:
-            mkt_size = amount * ref_price
-        return client.place_market_order(symbol=str(symbol), side=side, size=mkt_size, client_order_id=client_order_id)
-    if isinstance(client, GateUsdtFuturesClient):
-        try:
-            client.set_leverage(contract=to_gate_currency_pair(str(symbol)), leverage=leverage)
-        except Exception:
-            pass
-        return client.place_market_order(
-            symbol=str(symbol),
-            side=side,
-            size=amount,
-            reduce_only=reduce_only,
-            client_order_id=client_order_id,
-        )
-    if isinstance(client, HtxClient):
-        if market_type == "swap":
-            try:
-                client.set_leverage(symbol=str(symbol), leverage=leverage)
-            except Exception:
-                pass
-        return client.place_market_order(
-            symbol=str(symbol),
-            side=side,
-            qty=amount,
+            amount=amount,
             reduce_only=reduce_only,
             pos_side=pos_side,
             client_order_id=client_order_id,
+            market_type=market_type,
+            payload=payload,
+            exchange_config=exchange_config,
+            leverage=leverage,
+            ref_price=ref_price,
+            spot_quote_amt=spot_quote_amt,
+            spot_market_buy_uses_quote=spot_market_buy_uses_quote,
+            bitget=bitget,
+        ),
+    )
+
+
+class PhaseHandlers(NamedTuple):
+    """One client class's phase handlers, resolved from the per-kind tables on first use."""
+
+    kind: str
+    place_limit: Optional[Callable[[Any, OrderRequest], Any]]
+    wait_fill: Optional[Callable[[Any, OrderRef], Dict[str, Any]]]
+    cancel: Optional[Callable[[Any, OrderRef], Any]]
+    place_market: Optional[Callable[[Any, OrderRequest], Any]]
+    market_wait_sec: float
+    limit_wait_floor_sec: float
+
+
+# Client class -> bound handler set; the public phase functions do one lookup per call.
+_PHASE_HANDLERS: Dict[type, PhaseHandlers] = {}
+
+
+def phase_handlers(client: Any) -> PhaseHandlers:
+    cls = client.__class__
+    handlers = _PHASE_HANDLERS.get(cls)
+    if handlers is None:
+        kind = client_kind(client)
+        handlers = _PHASE_HANDLERS[cls] = PhaseHandlers(
+            kind,
+            _PLACE_LIMIT.get(kind),
+            _WAIT_FILL.get(kind),
+            _CANCEL.get(kind),
+            _PLACE_MARKET.get(kind),
+            5.0 if kind in _FAST_MARKET_FILL_KINDS else 12.0,
+            8.0 if kind in _SLOW_LIMIT_FILL_KINDS else 0.0,
         )
-    raise LiveTradingError(f"Unsupported client type: {type(client)}")
+    return handlers
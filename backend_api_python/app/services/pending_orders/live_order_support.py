@@ -8,9 +8,16 @@ top of this API.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Tuple
-
+import functools
+import os
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.services.broker_market_policy import validate_strategy_config
 from app.services.live_trading.base import LiveTradingError
 from app.utils.pnl import calc_notional_value
 from app.utils.logger import get_logger
@@ -30,10 +37,20 @@ class LiveOrderExecutionContext:
     cfg: Dict[str, Any]
     strategy_user_id: int
     exchange_config: Dict[str, Any]
-    safe_exchange_config: Dict[str, Any]
     exchange_id: str
     market_category: str
     market_type: str
+    ref_price: float = 0.0
+    leverage: float = 1.0
+    redact_exchange_config: Callable[[Dict[str, Any]], Dict[str, Any]] = field(default=dict, repr=False)
+    _safe_exchange_config: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    @property
+    def safe_exchange_config(self) -> Dict[str, Any]:
+        """Redacted config for log lines; only built when a failure path actually logs it."""
+        if self._safe_exchange_config is None:
+            self._safe_exchange_config = self.redact_exchange_config(self.exchange_config)
+        return self._safe_exchange_config
 
 
 class LiveOrderRejected(Exception):
@@ -54,25 +71,27 @@ class LiveOrderRejected(Exception):
         self.fatal_exchange_error = bool(fatal_exchange_error)
 
 
-@dataclass
+@dataclass(slots=True)
 class FillAccumulator:
+    """Running fill / fee totals across order phases. Fill inputs are numbers (see apply_fill_snapshot)."""
+
     total_base: float = 0.0
     total_quote: float = 0.0
     total_fee: float = 0.0
     fee_ccy: str = ""
 
     def apply_fill(self, filled_qty: float, avg_px: float) -> None:
-        fq = float(filled_qty or 0.0)
-        px = float(avg_px or 0.0)
-        if fq > 0 and px > 0:
-            self.total_base += fq
-            self.total_quote += fq * px
+        if filled_qty and avg_px and filled_qty > 0 and avg_px > 0:
+            self.total_base += filled_qty
+            self.total_quote += filled_qty * avg_px
 
     def apply_fee(self, fee: float, ccy: str = "") -> None:
-        try:
-            fv = abs(float(fee or 0.0))
-        except Exception:
-            fv = 0.0
+        if fee.__class__ is not float:
+            try:
+                fee = float(fee or 0.0)
+            except Exception:
+                return
+        fv = abs(fee)
         if fv > 0:
             self.total_fee += fv
             if (not self.fee_ccy) and ccy:
@@ -82,9 +101,100 @@ class FillAccumulator:
         return float(self.total_quote / self.total_base) if self.total_base > 0 else 0.0
 
 
+def _summarize_phase(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value if not isinstance(value, list) else f"<{len(value)} items>"
+    return {k: v for k, v in value.items() if not isinstance(v, (dict, list))}
+
+
+def summarize_phases(phases: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact copy of a live order's phases for persistence.
+
+    Each phase keeps its scalar fields (filled / avg_price / fee / status / code /
+    ids ...) and drops the nested raw exchange envelopes, which are most of the
+    bytes. Orders that hit an ``*_error`` phase are returned unchanged so the full
+    responses stay available for diagnosis.
+    """
+    if not phases or any(k.endswith("_error") for k in phases):
+        return phases
+    return {k: _summarize_phase(v) for k, v in phases.items()}
+
+
+# Telegram / email round trips can take hundreds of ms; background notifiers hand the whole
+# notification (config lookups, message build and send) to a small pool of daemon threads so
+# the order path only pays for a queue put. Each thread drains its own queue and orders are
+# sharded by id, so one order's notifications still go out in order while a slow channel only
+# holds up its own shard. Bounded: when a shard is full the caller delivers inline (logged
+# and counted) rather than dropping the notification.
+def _notify_workers() -> int:
+    try:
+        value = int(os.getenv("LIVE_NOTIFY_WORKERS", "4"))
+        return value if value > 0 else 4
+    except Exception:
+        return 4
+
+
+_NOTIFY_WORKERS = _notify_workers()
+_NOTIFY_QUEUE_MAX = 250
+_notify_queues: "List[queue.Queue[Tuple[LiveOrderNotifier, Dict[str, Any]]]]" = [
+    queue.Queue(maxsize=_NOTIFY_QUEUE_MAX) for _ in range(_NOTIFY_WORKERS)
+]
+_notify_threads: List[Optional[threading.Thread]] = [None] * _NOTIFY_WORKERS
+_notify_thread_lock = threading.Lock()
+_notify_overflow = 0
+
+
+def _notify_consumer(q: "queue.Queue[Tuple[LiveOrderNotifier, Dict[str, Any]]]") -> None:
+    while True:
+        live_notifier, call = q.get()
+        try:
+            live_notifier._deliver(call)
+        finally:
+            q.task_done()
+
+
+def _ensure_notify_thread(shard: int) -> None:
+    t = _notify_threads[shard]
+    if t is not None and t.is_alive():
+        return
+    with _notify_thread_lock:
+        t = _notify_threads[shard]
+        if t is None or not t.is_alive():
+            t = threading.Thread(
+                target=_notify_consumer, args=(_notify_queues[shard],), daemon=True, name=f"LiveOrderNotify-{shard}"
+            )
+            t.start()
+            _notify_threads[shard] = t
+
+
+def _record_notify_overflow(order_id: int) -> None:
+    global _notify_overflow
+    with _notify_thread_lock:
+        _notify_overflow += 1
+        count = _notify_overflow
+    logger.warning("live notify queue full: pending_id=%s delivered inline (overflow total=%s)", order_id, count)
+
+
+def notify_overflow_count() -> int:
+    """Notifications delivered inline because their shard's queue was full."""
+    return _notify_overflow
+
+
+def wait_for_live_notifications(timeout: float = 5.0) -> bool:
+    """Block until queued live notifications are sent (tests / graceful shutdown)."""
+    deadline = time.monotonic() + float(timeout)
+    while any(q.unfinished_tasks for q in _notify_queues) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not any(q.unfinished_tasks for q in _notify_queues)
+
+
 @dataclass
 class LiveOrderNotifier:
-    """Best-effort notification facade for live order execution."""
+    """Best-effort notification facade for live order execution.
+
+    With ``background=True`` the channel sends run on the shared notify threads. Each
+    (order, status) pair is notified at most once per notifier.
+    """
 
     order_id: int
     strategy_id: int
@@ -93,6 +203,9 @@ class LiveOrderNotifier:
     notifier: Any
     load_notification_config: Callable[[int], Dict[str, Any]]
     load_strategy_name: Callable[[int], str]
+    background: bool = False
+    _notified: Set[str] = field(default_factory=set, init=False, repr=False)
+    _resolved: Optional[Tuple[Dict[str, Any], str]] = field(default=None, init=False, repr=False)
 
     def notify(
         self,
@@ -104,46 +217,94 @@ class LiveOrderNotifier:
         price_hint: Optional[float] = None,
         amount_hint: Optional[float] = None,
     ) -> None:
+        status_key = str(status or "")
+        if status_key in self._notified:
+            return
+        self._notified.add(status_key)
+        call = dict(
+            status=status_key,
+            error=error,
+            exchange_id=exchange_id,
+            exchange_order_id=exchange_order_id,
+            price_hint=price_hint,
+            amount_hint=amount_hint,
+        )
+        if self.background:
+            shard = int(self.order_id or 0) % _NOTIFY_WORKERS
+            _ensure_notify_thread(shard)
+            try:
+                _notify_queues[shard].put_nowait((self, call))
+                return
+            except queue.Full:
+                _record_notify_overflow(self.order_id)
+        self._deliver(call)
+
+    def _deliver(self, call: Dict[str, Any]) -> None:
+        status_key = call["status"]
+        error = call["error"]
+        exchange_id = call["exchange_id"]
+        exchange_order_id = call["exchange_order_id"]
+        price_hint = call["price_hint"]
+        amount_hint = call["amount_hint"]
         try:
-            notification_config = self.payload.get("notification_config") or {}
-            if (not notification_config) and self.strategy_id:
-                notification_config = self.load_notification_config(int(self.strategy_id))
+            notification_config, strategy_name = self._resolve_config()
             if not notification_config:
                 return
 
-            strategy_name = str(self.payload.get("strategy_name") or "").strip()
-            if not strategy_name:
-                strategy_name = self.load_strategy_name(int(self.strategy_id)) or f"Strategy_{self.strategy_id}"
+            sym0 = str(self.payload.get("symbol") or self.order_row.get("symbol") or "")
+            sig0 = str(self.payload.get("signal_type") or self.order_row.get("signal_type") or "")
+            px = float(price_hint) if price_hint else 0.0
+            if px <= 0:
+                px = float(self.payload.get("ref_price") or self.payload.get("price") or self.order_row.get("price") or 0.0)
+            amt = float(amount_hint) if amount_hint else 0.0
+            if amt <= 0:
+                amt = float(self.payload.get("amount") or self.order_row.get("amount") or 0.0)
 
-            sym0 = self.payload.get("symbol") or self.order_row.get("symbol") or ""
-            sig0 = self.payload.get("signal_type") or self.order_row.get("signal_type") or ""
-            ref0 = float(self.payload.get("ref_price") or self.payload.get("price") or self.order_row.get("price") or 0.0)
-            amt0 = float(self.payload.get("amount") or self.order_row.get("amount") or 0.0)
-
-            px = float(price_hint) if (price_hint is not None and float(price_hint or 0.0) > 0) else ref0
-            amt = float(amount_hint) if (amount_hint is not None and float(amount_hint or 0.0) > 0) else amt0
-
-            stake_quote = calc_notional_value(float(px or 0.0), float(amt or 0.0)) or float(amt or 0.0)
-            results = self.notifier.notify_signal(
+            kwargs = dict(
                 strategy_id=int(self.strategy_id),
-                strategy_name=str(strategy_name or ""),
-                symbol=str(sym0 or ""),
-                signal_type=str(sig0 or ""),
-                price=float(px or 0.0),
-                stake_amount=float(stake_quote),
-                direction=("short" if "short" in str(sig0 or "").lower() else "long"),
+                strategy_name=strategy_name,
+                symbol=sym0,
+                signal_type=sig0,
+                price=px,
+                stake_amount=calc_notional_value(px, amt) or amt,
+                direction=signal_direction(sig0),
                 notification_config=notification_config if isinstance(notification_config, dict) else {},
                 extra={
                     "pending_order_id": int(self.order_id),
                     "mode": "live",
-                    "status": str(status or ""),
+                    "status": status_key,
                     "error": str(error or ""),
                     "exchange_id": str(exchange_id or ""),
                     "exchange_order_id": str(exchange_order_id or ""),
                 },
             )
-            ok_channels = [c for c, r in (results or {}).items() if (r or {}).get("ok")]
-            fail_channels = [c for c, r in (results or {}).items() if not (r or {}).get("ok")]
+        except Exception as e:
+            logger.info("live notify skipped/failed: pending_id=%s, strategy_id=%s, err=%s", self.order_id, self.strategy_id, e)
+            return
+        self._send(kwargs)
+
+    def _resolve_config(self) -> Tuple[Dict[str, Any], str]:
+        # Looked up once per order: its sent / filled / failed notifications share the result,
+        # so a slow config lookup costs the notify thread at most one round trip per order.
+        if self._resolved is None:
+            notification_config = self.payload.get("notification_config") or {}
+            if (not notification_config) and self.strategy_id:
+                notification_config = self.load_notification_config(int(self.strategy_id))
+            strategy_name = ""
+            if notification_config:
+                strategy_name = str(self.payload.get("strategy_name") or "").strip()
+                if not strategy_name:
+                    strategy_name = self.load_strategy_name(int(self.strategy_id)) or f"Strategy_{self.strategy_id}"
+            self._resolved = (notification_config, strategy_name)
+        return self._resolved
+
+    def _send(self, kwargs: Dict[str, Any]) -> None:
+        try:
+            results = self.notifier.notify_signal(**kwargs)
+            ok_channels: List[str] = []
+            fail_channels: List[str] = []
+            for channel, result in (results or {}).items():
+                (ok_channels if (result or {}).get("ok") else fail_channels).append(channel)
             if ok_channels or fail_channels:
                 logger.info(
                     "live notify: pending_id=%s, strategy_id=%s, ok=%s fail=%s",
@@ -156,11 +317,16 @@ class LiveOrderNotifier:
             logger.info("live notify skipped/failed: pending_id=%s, strategy_id=%s, err=%s", self.order_id, self.strategy_id, e)
 
 
-def console_print(msg: str) -> None:
-    try:
-        print(str(msg or ""), flush=True)
-    except Exception:
-        pass
+def console_print(msg: str, *args: Any) -> None:
+    """Operator-facing worker line; goes through logging (console + app.log) instead of a flushed print.
+
+    Pass %-style ``args`` on hot paths so the line is only formatted when INFO is enabled.
+    """
+    if msg:
+        if args:
+            logger.info(msg, *args)
+        else:
+            logger.info("%s", msg)
 
 
 def make_client_order_id(*, exchange_id: str, strategy_id: int, order_id: int, phase: str = "") -> str:
@@ -168,24 +334,84 @@ def make_client_order_id(*, exchange_id: str, strategy_id: int, order_id: int, p
     ph = str(phase or "").strip().lower()
     if str(exchange_id or "").strip().lower() == "okx":
         base = f"qd{int(strategy_id)}{int(order_id)}{ph}"
-        base = "".join([c for c in base if c.isalnum()])
-        if not base:
-            base = f"qd{int(strategy_id)}{int(order_id)}"
+        # Ids and phase tokens are alphanumeric by construction; only filter the odd caller-supplied phase.
+        if not base.isalnum():
+            base = "".join(filter(str.isalnum, base))
         return base[:32]
     return f"qd_{int(strategy_id)}_{int(order_id)}{('_' + ph) if ph else ''}"
 
 
+def phase_client_order_ids(*, exchange_id: str, strategy_id: int, order_id: int) -> Tuple[str, str]:
+    """(limit, market) client order ids for one order, sharing a single base id.
+
+    Same values as make_client_order_id(phase="lmt"/"mkt"); ids stay deterministic per
+    pending order so a retried dispatch reuses them.
+    """
+    base = make_client_order_id(exchange_id=exchange_id, strategy_id=strategy_id, order_id=order_id)
+    if str(exchange_id or "").strip().lower() == "okx":
+        return (base + "lmt")[:32], (base + "mkt")[:32]
+    return base + "_lmt", base + "_mkt"
+
+
+# Market types stored by older strategies that all mean perpetual swaps.
+SWAP_MARKET_ALIASES = frozenset({"futures", "future", "perp", "perpetual"})
+
+
+@functools.lru_cache(maxsize=64)
+def canonical_market_type(raw: str) -> str:
+    """Lower-cased, interned market type with the swap aliases folded; memoized per raw value.
+
+    Strategies only ever store a handful of spellings, so the strip/lower/alias work
+    runs once per spelling instead of once per order or sync pass.
+    """
+    mt = raw.strip().lower()
+    if mt in SWAP_MARKET_ALIASES:
+        return "swap"
+    return sys.intern(mt)
+
+_OPEN_LONG = ("buy", "long", False)
+_OPEN_SHORT = ("sell", "short", False)
+_CLOSE_LONG = ("sell", "long", True)
+_CLOSE_SHORT = ("buy", "short", True)
+
+_SIGNAL_SIDES: Dict[str, Tuple[str, str, bool]] = {
+    "open_long": _OPEN_LONG,
+    "add_long": _OPEN_LONG,
+    "open_short": _OPEN_SHORT,
+    "add_short": _OPEN_SHORT,
+    "close_long": _CLOSE_LONG,
+    "reduce_long": _CLOSE_LONG,
+    "close_long_stop": _CLOSE_LONG,
+    "close_long_profit": _CLOSE_LONG,
+    "close_long_trailing": _CLOSE_LONG,
+    "close_short": _CLOSE_SHORT,
+    "reduce_short": _CLOSE_SHORT,
+    "close_short_stop": _CLOSE_SHORT,
+    "close_short_profit": _CLOSE_SHORT,
+    "close_short_trailing": _CLOSE_SHORT,
+}
+
+
+# Signals that act on the short leg (open / add / close / reduce); drives notification direction
+# and the spot-market short rejection without substring scans.
+SHORT_SIGNALS = frozenset(sig for sig, (_, pos, _) in _SIGNAL_SIDES.items() if pos == "short")
+
+
+def signal_direction(signal_type: str) -> str:
+    if signal_type in SHORT_SIGNALS:
+        return "short"
+    if signal_type in _SIGNAL_SIDES:
+        return "long"
+    return "short" if "short" in str(signal_type or "").lower() else "long"
+
+
 def signal_to_side_pos_reduce(signal_type: str) -> Tuple[str, str, bool]:
-    st = (signal_type or "").strip().lower()
-    if st in ("open_long", "add_long"):
-        return "buy", "long", False
-    if st in ("open_short", "add_short"):
-        return "sell", "short", False
-    if st in ("close_long", "reduce_long", "close_long_stop", "close_long_profit", "close_long_trailing"):
-        return "sell", "long", True
-    if st in ("close_short", "reduce_short", "close_short_stop", "close_short_profit", "close_short_trailing"):
-        return "buy", "short", True
-    raise LiveTradingError(f"Unsupported signal_type: {signal_type}")
+    hit = _SIGNAL_SIDES.get(signal_type)
+    if hit is None:
+        hit = _SIGNAL_SIDES.get((signal_type or "").strip().lower())
+        if hit is None:
+            raise LiveTradingError(f"Unsupported signal_type: {signal_type}")
+    return hit
 
 
 def build_live_order_context(
@@ -216,8 +442,7 @@ def build_live_order_context(
     cfg = load_strategy_configs(strategy_id)
     strategy_user_id = int(cfg.get("user_id") or 1)
     exchange_config = resolve_exchange_config(cfg.get("exchange_config") or {}, user_id=strategy_user_id)
-    safe_cfg = safe_exchange_config_for_log(exchange_config)
-    exchange_id = str(exchange_config.get("exchange_id") or "").strip().lower()
+    exchange_id = sys.intern(str(exchange_config.get("exchange_id") or "").strip().lower())
     market_category = str(cfg.get("market_category") or "Crypto").strip()
 
     pre_market_type = (
@@ -229,8 +454,6 @@ def build_live_order_context(
     )
     trading_cfg = cfg.get("trading_config") or {}
 
-    from app.services.broker_market_policy import validate_strategy_config
-
     try:
         validate_strategy_config(
             exchange_id=exchange_id,
@@ -249,23 +472,37 @@ def build_live_order_context(
             strategy_log=f"Order rejected: {e}",
         )
 
-    market_type = str(pre_market_type or "swap").strip().lower()
-    if market_type in ("futures", "future", "perp", "perpetual"):
-        market_type = "swap"
+    # Interned so the phases' market_type / exchange_id / signal_type == checks against
+    # literals short-circuit on identity instead of comparing characters.
+    market_type = canonical_market_type(str(pre_market_type or "swap"))
+
+    # Resolve the payload -> order row -> strategy fallbacks once; the phases only read the context.
+    ref_price = float(payload.get("ref_price") or payload.get("price") or order_row.get("price") or 0.0)
+    leverage = payload.get("leverage")
+    if leverage is None:
+        leverage = cfg.get("leverage")
+    try:
+        leverage = float(leverage or 1.0)
+    except Exception:
+        leverage = 1.0
+    if leverage <= 0:
+        leverage = 1.0
 
     return LiveOrderExecutionContext(
         order_id=int(order_id),
         order_row=order_row,
         payload=payload,
         strategy_id=strategy_id,
-        signal_type=str(signal_type),
+        signal_type=sys.intern(str(signal_type).strip().lower()),
         symbol=str(symbol),
         amount=float(amount or 0.0),
         cfg=cfg,
         strategy_user_id=strategy_user_id,
         exchange_config=exchange_config,
-        safe_exchange_config=safe_cfg,
         exchange_id=exchange_id,
         market_category=market_category,
         market_type=market_type,
+        ref_price=ref_price,
+        leverage=leverage,
+        redact_exchange_config=safe_exchange_config_for_log,
     )
@@ -0,0 +1,400 @@
+"""Exchange position fetchers for PendingOrderWorker position sync.
+
+Each fetcher pulls open positions from one client type and normalizes them to
+the sync snapshot maps ``{symbol: {"long": x, "short": y}}`` (size, entry
+price, instrument id). Fetchers raise on API errors; the worker decides how to
+back off or auto-stop. Lookup goes by client class instead of a long
+``isinstance`` chain.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.services.live_trading.binance import BinanceFuturesClient
+from app.services.live_trading.bitget import BitgetMixClient
+from app.services.live_trading.bybit import BybitClient
+from app.services.live_trading.gate import GateUsdtFuturesClient
+from app.services.live_trading.kraken_futures import KrakenFuturesClient
+from app.services.live_trading.okx import OkxClient
+from app.services.live_trading.records import normalize_strategy_symbol
+from app.services.pending_orders.position_sync_cache import PositionSnapshot
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PositionFetcher:
+    name: str
+    fetch: Callable[[Any, Dict[str, Any]], PositionSnapshot]
+    # Swap clients only report positions for market_type == "swap"; spot falls back to wallet balances.
+    swap_only: bool = True
+    auto_stop_on_fatal: bool = True
+
+
+_POSITION_FETCHERS: Dict[type, PositionFetcher] = {}
+_optional_fetchers_loaded = False
+_optional_fetchers_lock = threading.Lock()
+
+
+def register_position_fetcher(
+    client_cls: type,
+    name: str,
+    *,
+    swap_only: bool = True,
+    auto_stop_on_fatal: bool = True,
+) -> Callable[[Callable[[Any, Dict[str, Any]], PositionSnapshot]], Callable[[Any, Dict[str, Any]], PositionSnapshot]]:
+    def decorator(fn: Callable[[Any, Dict[str, Any]], PositionSnapshot]) -> Callable[[Any, Dict[str, Any]], PositionSnapshot]:
+        _POSITION_FETCHERS[client_cls] = PositionFetcher(name, fn, swap_only, auto_stop_on_fatal)
+        return fn
+
+    return decorator
+
+
+def position_fetcher_for(client: Any, market_type: str) -> Optional[PositionFetcher]:
+    """Return the fetcher for ``client`` (walking its MRO), or the spot wallet fetcher for spot markets."""
+    _load_optional_fetchers()
+    for cls in client.__class__.__mro__:
+        fetcher = _POSITION_FETCHERS.get(cls)
+        if fetcher is not None:
+            if not fetcher.swap_only or market_type == "swap":
+                return fetcher
+            break
+    if market_type == "spot":
+        return _SPOT_WALLET_FETCHER
+    return None
+
+
+def _set_leg(legs: Dict[str, Dict[str, Any]], sym: str, side: str, value: Any, empty: Any = 0.0) -> None:
+    """legs[sym][side] = value; the {"long", "short"} row is only allocated for a new symbol."""
+    row = legs.get(sym)
+    if row is None:
+        row = legs[sym] = {"long": empty, "short": empty}
+    row[side] = value
+
+
+def _empty_snapshot() -> PositionSnapshot:
+    return {}, {}, {}
+
+
+# Linear perps on Binance / Bitget / Bybit report compact symbols (BTCUSDT, ETHUSDC).
+_LINEAR_SYMBOL_RE = re.compile(r"^(?P<base>[A-Z0-9]+?)(?P<quote>USDT|USDC)$")
+_HB_SYMBOL_CACHE: Dict[str, str] = {}
+_HB_SYMBOL_CACHE_MAX = 16384
+
+
+def _hb_linear_symbol(sym: str) -> str:
+    """BTCUSDT -> BTC/USDT, ETHUSDC -> ETH/USDC; other symbols pass through."""
+    hit = _HB_SYMBOL_CACHE.get(sym)
+    if hit is not None:
+        return hit
+    m = _LINEAR_SYMBOL_RE.match(sym)
+    out = f"{m.group('base')}/{m.group('quote')}" if m else sym
+    if len(_HB_SYMBOL_CACHE) >= _HB_SYMBOL_CACHE_MAX:
+        _HB_SYMBOL_CACHE.clear()
+    _HB_SYMBOL_CACHE[sym] = out
+    return out
+
+
+@register_position_fetcher(BinanceFuturesClient, "binance")
+def _fetch_binance_futures(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    all_pos = client.get_positions() or []
+    if isinstance(all_pos, dict) and "raw" in all_pos:
+        all_pos = all_pos["raw"]
+    if isinstance(all_pos, list):
+        for p in all_pos:
+            sym = str(p.get("symbol") or "").strip().upper()
+            try:
+                amt = float(p.get("positionAmt") or 0.0)
+                ep = float(p.get("entryPrice") or 0.0)
+            except Exception:
+                amt = 0.0
+                ep = 0.0
+            if not sym or abs(amt) <= 0:
+                continue
+            hb_sym = _hb_linear_symbol(sym)
+            side = "long" if amt > 0 else "short"
+            _set_leg(exch_size, hb_sym, side, abs(float(amt)))
+            _set_leg(exch_entry_price, hb_sym, side, abs(float(ep)))
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+@register_position_fetcher(OkxClient, "okx")
+def _fetch_okx_swap(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    resp = client.get_positions()
+    data = (resp.get("data") or []) if isinstance(resp, dict) else []
+    if not isinstance(data, list):
+        return exch_size, exch_entry_price, exch_inst_id
+    for p in data:
+        inst_id = str(p.get("instId") or "")
+        pos_side = str(p.get("posSide") or "").lower()
+        try:
+            pos = float(p.get("pos") or 0.0)
+        except Exception:
+            pos = 0.0
+        if not inst_id or abs(pos) <= 0:
+            continue
+        # instId: BTC-USDT-SWAP -> BTC/USDT
+        hb_sym = inst_id.replace("-SWAP", "").replace("-", "/")
+        if pos_side in ("long", "short"):
+            side = pos_side
+        else:
+            side = "long" if pos > 0 else "short"
+        # IMPORTANT: OKX swap positions `pos` is in contracts, but our system uses base-asset quantity.
+        # Convert contracts -> base using ctVal when available.
+        qty_base = abs(float(pos))
+        try:
+            inst = client.get_instrument(inst_type="SWAP", inst_id=inst_id) or {}
+            ct_val = float(inst.get("ctVal") or 0.0)
+            if ct_val > 0:
+                qty_base = qty_base * ct_val
+        except Exception:
+            pass
+        _set_leg(exch_size, hb_sym, side, float(qty_base))
+        _set_leg(exch_inst_id, hb_sym, side, inst_id, empty="")
+
+        # Entry price: avgPx, then avgPxEp (average price in equity), then last price.
+        try:
+            avg_px = p.get("avgPx") or p.get("avgPxEp") or p.get("last")
+            entry_price = float(avg_px) if avg_px else 0.0
+            if entry_price > 0:
+                _set_leg(exch_entry_price, hb_sym, side, entry_price)
+            else:
+                logger.warning(f"[PositionSync] OKX {hb_sym} {side}: Could not extract entry price from position data: {p}")
+        except Exception as e:
+            logger.warning(f"[PositionSync] Failed to extract entry price for OKX {hb_sym} {side}: {e}")
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+@register_position_fetcher(BitgetMixClient, "bitget")
+def _fetch_bitget_mix(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    product_type = str(exchange_config.get("product_type") or exchange_config.get("productType") or "USDT-FUTURES")
+    resp = client.get_positions(product_type=product_type)
+    data = resp.get("data") if isinstance(resp, dict) else None
+    if isinstance(data, list):
+        for p in data:
+            sym = str(p.get("symbol") or "")
+            hold_side = str(p.get("holdSide") or "").lower()
+            try:
+                total = float(p.get("total") or 0.0)
+            except Exception:
+                total = 0.0
+            if not sym or abs(total) <= 0:
+                continue
+            hb_sym = _hb_linear_symbol(sym.upper())
+            side = "long" if hold_side == "long" else "short"
+            _set_leg(exch_size, hb_sym, side, abs(float(total)))
+            try:
+                ep = float(p.get("openPriceAvg") or p.get("averageOpenPrice") or 0.0)
+                if ep > 0:
+                    _set_leg(exch_entry_price, hb_sym, side, ep)
+            except Exception:
+                pass
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+@register_position_fetcher(BybitClient, "bybit")
+def _fetch_bybit_linear(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    # Bybit v5 requires symbol or settleCoin; use USDT for full linear book.
+    resp = client.get_positions(settle_coin="USDT")
+    lst = (((resp.get("result") or {}).get("list")) if isinstance(resp, dict) else None) or []
+    if isinstance(lst, list):
+        for p in lst:
+            if not isinstance(p, dict):
+                continue
+            sym = str(p.get("symbol") or "").strip().upper()
+            side0 = str(p.get("side") or "").strip().lower()  # Buy/Sell
+            try:
+                sz = float(p.get("size") or 0.0)
+            except Exception:
+                sz = 0.0
+            if not sym or abs(sz) <= 0:
+                continue
+            hb_sym = _hb_linear_symbol(sym)
+            side = "long" if side0 == "buy" else ("short" if side0 == "sell" else ("long" if sz > 0 else "short"))
+            _set_leg(exch_size, hb_sym, side, abs(float(sz)))
+            try:
+                ep = float(p.get("avgPrice") or p.get("entryPrice") or 0.0)
+                if ep > 0:
+                    _set_leg(exch_entry_price, hb_sym, side, ep)
+            except Exception:
+                pass
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+@register_position_fetcher(GateUsdtFuturesClient, "gate")
+def _fetch_gate_usdt_futures(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    resp = client.get_positions()
+    items = resp if isinstance(resp, list) else []
+    for p in items:
+        if not isinstance(p, dict):
+            continue
+        contract = str(p.get("contract") or "").strip()
+        try:
+            sz_ct = float(p.get("size") or 0.0)  # contracts, signed
+        except Exception:
+            sz_ct = 0.0
+        if not contract or abs(sz_ct) <= 0:
+            continue
+        hb_sym = contract.replace("_", "/")
+        side = "long" if sz_ct > 0 else "short"
+        # Convert contracts -> base using quanto_multiplier.
+        qty_base = abs(sz_ct)
+        try:
+            meta = client.get_contract(contract=contract) or {}
+            qm = float(meta.get("quanto_multiplier") or meta.get("contract_size") or 0.0)
+            if qm > 0:
+                qty_base = qty_base * qm
+        except Exception:
+            pass
+        _set_leg(exch_size, hb_sym, side, float(qty_base))
+        try:
+            ep = float(p.get("entry_price") or p.get("open_price") or 0.0)
+            if ep > 0:
+                _set_leg(exch_entry_price, hb_sym, side, ep)
+        except Exception:
+            pass
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+@register_position_fetcher(KrakenFuturesClient, "kraken")
+def _fetch_kraken_futures(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    resp = client.get_open_positions()
+    positions = (resp.get("openPositions") if isinstance(resp, dict) else None) or (resp.get("open_positions") if isinstance(resp, dict) else None) or []
+    if isinstance(positions, list):
+        for p in positions:
+            if not isinstance(p, dict):
+                continue
+            sym = str(p.get("symbol") or p.get("instrument") or "").strip()
+            try:
+                sz = float(p.get("size") or p.get("positionSize") or 0.0)
+            except Exception:
+                sz = 0.0
+            if not sym or abs(sz) <= 0:
+                continue
+            side = "long" if sz > 0 else "short"
+            _set_leg(exch_size, sym, side, abs(float(sz)))
+            try:
+                ep = float(p.get("price") or p.get("avgPrice") or 0.0)
+                if ep > 0:
+                    _set_leg(exch_entry_price, sym, side, ep)
+            except Exception:
+                pass
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+def _fetch_ibkr(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    # `quantity` is signed: >0 = long, <0 = short. Short rows are mirrored so
+    # reconciliation does not orphan pre-existing TWS inventory.
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    positions = client.get_positions() or []
+    if isinstance(positions, list):
+        for p in positions:
+            if not isinstance(p, dict):
+                continue
+            sym = str(p.get("symbol") or p.get("ib_symbol") or "").strip()
+            try:
+                qty = float(p.get("quantity") or 0.0)
+            except Exception:
+                qty = 0.0
+            try:
+                avg = float(p.get("avgCost") or 0.0)
+            except Exception:
+                avg = 0.0
+            if not sym or abs(qty) <= 0:
+                continue
+            side = "long" if qty > 0 else "short"
+            _set_leg(exch_size, sym, side, abs(qty))
+            if avg > 0:
+                _set_leg(exch_entry_price, sym, side, avg)
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+def _fetch_alpaca(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    # The client already returns a normalized `side` plus `quantity` / `avgCost`;
+    # crypto symbols come through as "BTC/USD", the format strategies store.
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    positions = client.get_positions() or []
+    if isinstance(positions, list):
+        for p in positions:
+            if not isinstance(p, dict):
+                continue
+            sym = str(p.get("symbol") or "").strip()
+            try:
+                qty = float(p.get("quantity") or 0.0)
+            except Exception:
+                qty = 0.0
+            try:
+                avg = float(p.get("avgCost") or 0.0)
+            except Exception:
+                avg = 0.0
+            if not sym or abs(qty) <= 0:
+                continue
+            side = str(p.get("side") or "").strip().lower()
+            if side not in ("long", "short"):
+                side = "long" if qty > 0 else "short"
+            _set_leg(exch_size, sym, side, abs(qty))
+            if avg > 0:
+                _set_leg(exch_entry_price, sym, side, avg)
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+def _fetch_spot_wallet(client: Any, exchange_config: Dict[str, Any]) -> PositionSnapshot:
+    from app.services.live_trading.spot_wallet_snapshot import list_spot_wallet_positions
+
+    exch_size, exch_entry_price, exch_inst_id = _empty_snapshot()
+    for row in list_spot_wallet_positions(client) or []:
+        if not isinstance(row, dict):
+            continue
+        sym = normalize_strategy_symbol(str(row.get("symbol") or "")) or str(row.get("symbol") or "").strip()
+        side = str(row.get("side") or "long").strip().lower()
+        try:
+            sz = float(row.get("size") or 0.0)
+        except Exception:
+            sz = 0.0
+        if not sym or side not in ("long", "short") or sz <= 1e-12:
+            continue
+        _set_leg(exch_size, sym, side, sz)
+        ep = float(row.get("entry_price") or 0.0)
+        if ep > 0:
+            _set_leg(exch_entry_price, sym, side, ep)
+        iid = str(row.get("inst_id") or "")
+        if iid:
+            _set_leg(exch_inst_id, sym, side, iid, empty="")
+    return exch_size, exch_entry_price, exch_inst_id
+
+
+_SPOT_WALLET_FETCHER = PositionFetcher("spot", _fetch_spot_wallet, swap_only=False, auto_stop_on_fatal=False)
+
+
+def _load_optional_fetchers() -> None:
+    """Register IBKR / Alpaca on first use; their broker libraries are optional installs."""
+    global _optional_fetchers_loaded
+    if _optional_fetchers_loaded:
+        return
+    with _optional_fetchers_lock:
+        if _optional_fetchers_loaded:
+            return
+        try:
+            from app.services.ibkr_trading import IBKRClient
+
+            register_position_fetcher(IBKRClient, "ibkr", swap_only=False)(_fetch_ibkr)
+        except ImportError:
+            pass
+        try:
+            from app.services.alpaca_trading import AlpacaClient
+
+            register_position_fetcher(AlpacaClient, "alpaca", swap_only=False, auto_stop_on_fatal=False)(_fetch_alpaca)
+        except ImportError:
+            pass
+        _optional_fetchers_loaded = True
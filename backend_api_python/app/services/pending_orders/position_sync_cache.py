@@ -15,6 +15,7 @@ PositionSnapshot = Tuple[
 
 _snapshot_cache: Dict[str, Tuple[float, PositionSnapshot]] = {}
 _backoff_until: Dict[str, float] = {}
+_fetch_locks: Dict[str, threading.Lock] = {}
 _lock = threading.Lock()
 
 
@@ -59,6 +60,15 @@ def get_position_sync_snapshot(cache_key: str) -> Optional[PositionSnapshot]:
         return snapshot
 
 
+def position_sync_fetch_lock(cache_key: str) -> threading.Lock:
+    """Per-account lock so concurrent strategy syncs sharing credentials fetch the snapshot once."""
+    with _lock:
+        lock = _fetch_locks.get(cache_key)
+        if lock is None:
+            lock = _fetch_locks[cache_key] = threading.Lock()
+        return lock
+
+
 def set_position_sync_snapshot(
     cache_key: str,
     exch_size: Dict[str, Dict[str, float]],
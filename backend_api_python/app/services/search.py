@@ -4,6 +4,7 @@ import requests
 import json
 import time
 import re
+import threading
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from app.services.search_models import BaseSearchProvider, SearchResponse, SearchResult
@@ -18,6 +19,18 @@ logger = get_logger(__name__)
 _google_quota_exhausted = False
 _google_quota_reset_time = 0
 
+# 成功的搜索结果在进程内缓存 10 分钟，同一 watchlist 反复分析时不再重复请求搜索引擎
+SEARCH_RESULT_CACHE_TTL_SEC = 600
+SEARCH_RESULT_CACHE_MAX_ENTRIES = 256
+
+# 按市场预置的股票新闻查询模板；未列出的市场使用 _DEFAULT_STOCK_NEWS_QUERY
+_STOCK_NEWS_QUERY_TEMPLATES = {
+    "USStock": "{name} {code} stock news latest",
+    "Crypto": "{name} crypto news price analysis",
+    "Forex": "{name} {code} forex news analysis",
+}
+_DEFAULT_STOCK_NEWS_QUERY = "{name} {code} latest news"
+
 class TavilySearchProvider(BaseSearchProvider):
     """
     Tavily 搜索引擎
@@ -725,6 +738,8 @@ class SearchService:
     def __init__(self):
         self._providers: List[BaseSearchProvider] = []
         self._config = {}
+        self._result_cache: Dict[tuple, tuple] = {}
+        self._result_cache_lock = threading.Lock()
         self._load_config()
         self._init_providers()
     
@@ -869,6 +884,11 @@ class SearchService:
         Returns:
             SearchResponse 对象
         """
+        cache_key = (query, max_results, days)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         for provider in self._providers:
             if not provider.is_available:
                 continue
@@ -876,6 +896,7 @@ class SearchService:
             response = provider.search(query, max_results, days)
             
             if response.success and response.results:
+                self._store_result(cache_key, response)
                 return response
             else:
                 logger.warning(f"{provider.name} 搜索失败: {response.error_message}，尝试下一个引擎")
@@ -888,6 +909,27 @@ class SearchService:
             error_message="所有搜索引擎都不可用或搜索失败"
         )
     
+    def _cached_result(self, key: tuple) -> Optional[SearchResponse]:
+        with self._result_cache_lock:
+            hit = self._result_cache.get(key)
+            if hit is None:
+                return None
+            expires_at, response = hit
+            if expires_at <= time.time():
+                self._result_cache.pop(key, None)
+                return None
+            return response
+
+    def _store_result(self, key: tuple, response: SearchResponse) -> None:
+        now = time.time()
+        with self._result_cache_lock:
+            if len(self._result_cache) >= SEARCH_RESULT_CACHE_MAX_ENTRIES:
+                for k in [k for k, (exp, _) in self._result_cache.items() if exp <= now]:
+                    self._result_cache.pop(k, None)
+                while len(self._result_cache) >= SEARCH_RESULT_CACHE_MAX_ENTRIES:
+                    self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[key] = (now + SEARCH_RESULT_CACHE_TTL_SEC, response)
+
     def search_stock_news(
         self,
         stock_code: str,
@@ -915,14 +957,8 @@ class SearchService:
         else:
             search_days = 1
         
-        if market == "USStock":
-            query = f"{stock_name} {stock_code} stock news latest"
-        elif market == "Crypto":
-            query = f"{stock_name} crypto news price analysis"
-        elif market == "Forex":
-            query = f"{stock_name} {stock_code} forex news analysis"
-        else:
-            query = f"{stock_name} {stock_code} latest news"
+        template = _STOCK_NEWS_QUERY_TEMPLATES.get(market, _DEFAULT_STOCK_NEWS_QUERY)
+        query = template.format(name=stock_name, code=stock_code)
         
         logger.info(f"搜索股票新闻: {stock_name}({stock_code}), market={market}, days={search_days}")
         
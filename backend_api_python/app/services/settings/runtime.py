@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib
 import os
+import sys
 
 from dotenv import load_dotenv
 
@@ -26,6 +27,10 @@ def reload_runtime_env() -> None:
             registry.clear_runtime_env_cache()
     except Exception as exc:
         logger.warning("clear_runtime_env_cache skipped: %s", exc)
+    # Only clear the worker's cache if it is already loaded; importing it here would be wasted work.
+    worker_mod = sys.modules.get("app.services.pending_order_worker")
+    if worker_mod is not None and hasattr(worker_mod, "clear_runtime_env_cache"):
+        worker_mod.clear_runtime_env_cache()
 
 
 def refresh_runtime_services() -> None:
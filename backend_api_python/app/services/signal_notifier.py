@@ -210,6 +210,35 @@ def _utc_ts_to_user_display(now: int, user_timezone: str) -> Tuple[str, str, str
 
 
 
+# _notify_telegram truncates at this length; joined batches are split below it.
+_TELEGRAM_TEXT_LIMIT = 3900
+
+
+def _join_telegram_messages(texts: List[str]) -> List[Tuple[str, List[int]]]:
+    """
+    Join messages with blank lines into as few chunks as fit the Telegram text limit.
+
+    Returns (chunk text, positions in ``texts`` it carries); empty texts are skipped.
+    """
+    chunks: List[Tuple[str, List[int]]] = []
+    current = ""
+    members: List[int] = []
+    for pos, text in enumerate(texts):
+        text = str(text or "")
+        if not text:
+            continue
+        candidate = f"{current}\n\n{text}" if current else text
+        if current and len(candidate) > _TELEGRAM_TEXT_LIMIT:
+            chunks.append((current, members))
+            current, members = text, [pos]
+        else:
+            current = candidate
+            members.append(pos)
+    if current:
+        chunks.append((current, members))
+    return chunks
+
+
 class SignalNotifier:
     """
     Notify signal events across channels.
@@ -263,6 +292,73 @@ class SignalNotifier:
         notification_config: Optional[Dict[str, Any]] = None,
         extra: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Dict[str, Any]]:
+        prepared = self._prepare_signal(
+            strategy_id=strategy_id,
+            strategy_name=strategy_name,
+            symbol=symbol,
+            signal_type=signal_type,
+            price=price,
+            stake_amount=stake_amount,
+            direction=direction,
+            notification_config=notification_config,
+            extra=extra,
+        )
+        return self._send_prepared(prepared, prepared["channels"])
+
+    def notify_signal_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        ``notify_signal`` for several signals (each item holds its keyword arguments).
+
+        Telegram messages bound for the same chat and bot token are joined into as few
+        ``sendMessage`` calls as the length limit allows, which keeps bursts inside the bot
+        rate limit. Other channels stay one request per signal (webhook consumers expect one
+        event per POST). Returns one per-channel result dict per item, in order.
+        """
+        prepared_items = [self._prepare_signal(**item) for item in items]
+        results: List[Dict[str, Dict[str, Any]]] = []
+        telegram_groups: Dict[Tuple[str, str], List[int]] = {}
+        for idx, prepared in enumerate(prepared_items):
+            channels = prepared["channels"]
+            uses_telegram = any((ch or "").strip().lower() == "telegram" for ch in channels)
+            if uses_telegram:
+                chat_id, token = self._telegram_target(prepared["cfg"], prepared["targets"])
+                telegram_groups.setdefault((chat_id, token), []).append(idx)
+                channels = [ch for ch in channels if (ch or "").strip().lower() != "telegram"]
+            results.append(self._send_prepared(prepared, channels))
+
+        for (chat_id, token), indexes in telegram_groups.items():
+            texts = [
+                prepared_items[i]["rendered"].get("telegram_html") or prepared_items[i]["rendered"].get("plain") or ""
+                for i in indexes
+            ]
+            # Each signal takes the result of the chunk that carried it, so one failed
+            # chunk does not mark signals delivered by the other chunks as failed.
+            for i in indexes:
+                results[i]["telegram"] = {"ok": True, "error": ""}
+            for chunk, members in _join_telegram_messages(texts):
+                chunk_ok, chunk_err = self._notify_telegram(
+                    chat_id=chat_id,
+                    text=chunk,
+                    token_override=token,
+                    parse_mode="HTML",
+                )
+                for pos in members:
+                    results[indexes[pos]]["telegram"] = {"ok": bool(chunk_ok), "error": (chunk_err or "")}
+        return results
+
+    def _prepare_signal(
+        self,
+        *,
+        strategy_id: int,
+        strategy_name: str,
+        symbol: str,
+        signal_type: str,
+        price: float = 0.0,
+        stake_amount: float = 0.0,
+        direction: str = "long",
+        notification_config: Optional[Dict[str, Any]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         cfg = _safe_json(notification_config or {})
         channels = _as_list(cfg.get("channels"))
         if not channels:
@@ -284,8 +380,6 @@ class SignalNotifier:
             user_timezone=user_tz,
         )
         rendered = self._render_messages(payload)
-        title = rendered.get("title") or ""
-        message_plain = rendered.get("plain") or ""
 
         strategy = (payload or {}).get("strategy") or {}
         instrument = (payload or {}).get("instrument") or {}
@@ -310,6 +404,43 @@ class SignalNotifier:
                 "timeLabel": str(payload.get("time_label") or "Time"),
             },
         )
+        return {
+            "strategy_id": strategy_id,
+            "symbol": symbol,
+            "signal_type": signal_type,
+            "cfg": cfg,
+            "channels": channels,
+            "targets": targets,
+            "payload": payload,
+            "rendered": rendered,
+        }
+
+    @staticmethod
+    def _telegram_target(cfg: Dict[str, Any], targets: Dict[str, Any]) -> Tuple[str, str]:
+        """(chat_id, bot token); the user's token takes priority, then env TELEGRAM_BOT_TOKEN."""
+        chat_id = (targets.get("telegram") or "").strip()
+        token_override = ""
+        try:
+            token_override = str(
+                targets.get("telegram_bot_token")
+                or targets.get("telegram_token")
+                or cfg.get("telegram_bot_token")
+                or cfg.get("telegram_token")
+                or ""
+            ).strip()
+        except Exception:
+            token_override = ""
+        return chat_id, token_override
+
+    def _send_prepared(self, prepared: Dict[str, Any], channels: List[str]) -> Dict[str, Dict[str, Any]]:
+        strategy_id = prepared["strategy_id"]
+        symbol = prepared["symbol"]
+        signal_type = prepared["signal_type"]
+        targets = prepared["targets"]
+        payload = prepared["payload"]
+        rendered = prepared["rendered"]
+        title = rendered.get("title") or ""
+        message_plain = rendered.get("plain") or ""
 
         results: Dict[str, Dict[str, Any]] = {}
         for ch in channels:
@@ -322,7 +453,7 @@ class SignalNotifier:
                         strategy_id=strategy_id,
                         symbol=symbol,
                         signal_type=signal_type,
-                        channels=channels,
+                        channels=prepared["channels"],
                         title=title,
                         message=message_plain,
                         payload=payload,
@@ -344,19 +475,7 @@ class SignalNotifier:
                     url = (targets.get("discord") or "").strip()
                     ok, err = self._notify_discord(url=url, payload=payload, fallback_text=message_plain)
                 elif c == "telegram":
-                    chat_id = (targets.get("telegram") or "").strip()
-                    # User's token takes priority, then falls back to env TELEGRAM_BOT_TOKEN.
-                    token_override = ""
-                    try:
-                        token_override = str(
-                            targets.get("telegram_bot_token")
-                            or targets.get("telegram_token")
-                            or cfg.get("telegram_bot_token")
-                            or cfg.get("telegram_token")
-                            or ""
-                        ).strip()
-                    except Exception:
-                        token_override = ""
+                    chat_id, token_override = self._telegram_target(prepared["cfg"], targets)
                     ok, err = self._notify_telegram(
                         chat_id=chat_id,
                         text=rendered.get("telegram_html") or message_plain,
@@ -886,7 +1005,7 @@ class SignalNotifier:
         try:
             data: Dict[str, Any] = {
                 "chat_id": chat_id,
-                "text": str(text or "")[:3900],
+                "text": str(text or "")[:_TELEGRAM_TEXT_LIMIT],
                 "disable_web_page_preview": True,
             }
             if (parse_mode or "").strip():
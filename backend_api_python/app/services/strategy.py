@@ -1302,6 +1302,8 @@ class StrategyService:
                 )
             db.commit()
             cur.close()
+        from app.startup import invalidate_strategy_config_cache
+        invalidate_strategy_config_cache(strategy_id)
         return True
 
     def batch_delete_strategies(self, strategy_ids: List[int], user_id: int = None) -> Dict[str, Any]:
@@ -1546,6 +1548,8 @@ class StrategyService:
             )
             db.commit()
             cur.close()
+        from app.startup import invalidate_strategy_config_cache
+        invalidate_strategy_config_cache(strategy_id)
         return True
 
     def delete_strategy(self, strategy_id: int, user_id: int = None) -> bool:
@@ -1081,6 +1081,8 @@ class TradingExecutor:
                 )
                 db.commit()
                 cur.close()
+            from app.startup import invalidate_strategy_config_cache
+            invalidate_strategy_config_cache(strategy_id)
         except Exception as e:
             logger.warning(f"Persist script runtime state failed: {e}")
 
@@ -5483,6 +5485,8 @@ class TradingExecutor:
                 pending_id = cur.lastrowid
                 db.commit()
                 cur.close()
+            from app.services.pending_order_worker import notify_new_order
+            notify_new_order()
             return int(pending_id) if pending_id is not None else None
         except Exception as e:
             logger.error(f"enqueue_pending_order failed: {e}")
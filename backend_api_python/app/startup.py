@@ -35,6 +35,13 @@ def get_pending_order_worker():
     return _pending_order_worker
 
 
+def invalidate_strategy_config_cache(strategy_id: int) -> None:
+    """Drop the pending order worker's cached config for a strategy that was just edited."""
+    worker = _pending_order_worker
+    if worker is not None:
+        worker.invalidate_strategy_cfg(strategy_id)
+
+
 def _is_debug_reloader_parent() -> bool:
     debug = os.getenv("PYTHON_API_DEBUG", "false").lower() == "true"
     return debug and os.environ.get("WERKZEUG_RUN_MAIN") != "true"
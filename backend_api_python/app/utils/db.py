@@ -23,6 +23,7 @@ from pathlib import Path
 from app.utils.db_postgres import (
     get_pg_connection as get_db_connection,
     get_pg_connection_sync as get_db_connection_sync,
+    pg_transaction as db_transaction,
     is_postgres_available,
     close_pool as close_db,
 )
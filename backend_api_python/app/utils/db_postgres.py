@@ -9,10 +9,14 @@ Pool tuning (all via env, safe defaults):
     DB_POOL_MAX               maxconn or "auto"             default auto
     DB_POOL_ACQUIRE_TIMEOUT   seconds to wait on exhaustion default 10
     DB_POOL_HEALTH_CHECK      "true" / "false"              default "true"
+    DB_PREPARED_STATEMENTS    "true" / "false"              default "true"
+                              (set false behind pgbouncer transaction pooling)
 """
 import os
+import re
 import time
 import threading
+import weakref
 from typing import Optional, Any, List, Dict
 from contextlib import contextmanager
 from app.utils.logger import get_logger
@@ -24,7 +28,7 @@ try:
     import psycopg2
     from psycopg2 import pool
     from psycopg2 import OperationalError, InterfaceError
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_batch
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
@@ -34,6 +38,15 @@ except ImportError:
 _connection_pool: Optional[Any] = None
 _pool_lock = threading.Lock()
 
+# Per-thread shared transaction opened by pg_transaction() (active / conn / depth);
+# nested get_pg_connection() blocks join it through savepoints.
+_tx_local = threading.local()
+
+# Statement names PREPAREd on each raw connection -> (prepared, stale). psycopg2's connection is a
+# C type without __dict__, so the bookkeeping lives here and goes away with the connection.
+_prepared_names: "weakref.WeakKeyDictionary[Any, tuple]" = weakref.WeakKeyDictionary()
+_prepared_lock = threading.Lock()
+
 
 def _env_int(key: str, default: int) -> int:
     try:
@@ -72,6 +85,7 @@ DB_POOL_MAX = DB_POOL_MAX_CONFIGURED or DB_POOL_AUTO_DEFAULT_MAX
 DB_POOL_ACQUIRE_TIMEOUT = _env_int("DB_POOL_ACQUIRE_TIMEOUT", 10)
 DB_POOL_HEALTH_CHECK = _env_bool("DB_POOL_HEALTH_CHECK", True)
 DB_POOL_AUTO_CAP = _env_bool("DB_POOL_AUTO_CAP", True)
+DB_PREPARED_STATEMENTS = _env_bool("DB_PREPARED_STATEMENTS", True)
 DB_POOL_RESERVE_FOR_OTHER_CLIENTS = _env_int("DB_POOL_RESERVE_FOR_OTHER_CLIENTS", 20)
 DB_APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "quantdinger_api").strip() or "quantdinger_api"
 
@@ -542,6 +556,63 @@ class PostgresCursor:
 
         return result
     
+    def execute_prepared(self, name: str, query: str, args: Any = ()):
+        """Execute ``query`` as a server-side prepared statement.
+
+        ``query`` uses PostgreSQL ``$1..$n`` placeholders. The statement is
+        PREPAREd once per pooled connection (prepared statements live for the
+        session), so hot polling queries skip parse/plan on every call.
+        Falls back to a plain execute when DB_PREPARED_STATEMENTS is off.
+        """
+        args = tuple(args or ())
+        if not DB_PREPARED_STATEMENTS:
+            # %s binds positionally: feed args in placeholder order ($2 before $1, repeats).
+            order = [int(n) - 1 for n in re.findall(r"\$(\d+)", query)]
+            plain = re.sub(r"\$\d+", "%s", query)
+            return self.execute(plain, tuple(args[i] for i in order))
+        self._buffered_row = None
+        raw_conn = self._cursor.connection
+        names = _prepared_names.get(raw_conn)
+        if names is None:
+            with _prepared_lock:
+                names = _prepared_names.setdefault(raw_conn, (set(), set()))
+        prepared, stale = names
+        if name not in prepared:
+            if name in stale:
+                self._cursor.execute(f"DEALLOCATE {name}")
+                stale.discard(name)
+            self._cursor.execute(f"PREPARE {name} AS {query}")
+            prepared.add(name)
+        placeholders = ", ".join(["%s"] * len(args))
+        try:
+            if args:
+                return self._cursor.execute(f"EXECUTE {name} ({placeholders})", args)
+            return self._cursor.execute(f"EXECUTE {name}")
+        except Exception as e:
+            pgcode = getattr(e, "pgcode", None)
+            if pgcode == "26000":
+                # Session was reset (DISCARD ALL, pooler): re-PREPARE on the next call.
+                prepared.discard(name)
+            elif pgcode == "0A000":
+                # "cached plan must not change result type" after ALTER TABLE: rebuild it.
+                prepared.discard(name)
+                stale.add(name)
+            raise
+
+    def executemany(self, query: str, args_seq: Any, page_size: int = 100):
+        """Run one statement for every parameter tuple, batching round-trips.
+
+        Uses ``psycopg2.extras.execute_batch`` so K rows cost ~K/page_size
+        network round-trips instead of K. No ``RETURNING id`` handling:
+        ``lastrowid`` is not meaningful for a batch.
+        """
+        query = self._convert_placeholders(query)
+        self._buffered_row = None
+        rows = list(args_seq or [])
+        if not rows:
+            return None
+        return execute_batch(self._cursor, query, rows, page_size=page_size)
+
     def fetchone(self) -> Optional[Dict[str, Any]]:
         """Fetch single row"""
         if self._buffered_row is not None:
@@ -608,6 +679,102 @@ class PostgresConnection:
                 logger.warning(f"Failed to return connection to pool: {e}")
 
 
+class _SavepointConnection(PostgresConnection):
+    """Connection handle for a block nested in pg_transaction().
+
+    commit() is deferred to the enclosing transaction; rollback() only undoes
+    this block's savepoint, so a failed best-effort write does not discard
+    the writes around it.
+    """
+
+    def __init__(self, conn, savepoint: str):
+        super().__init__(conn)
+        self._savepoint = savepoint
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        _exec_raw(self._conn, f"ROLLBACK TO SAVEPOINT {self._savepoint}")
+
+    def close(self):
+        pass
+
+
+def _exec_raw(conn, sql: str) -> None:
+    cur = conn.cursor()
+    try:
+        cur.execute(sql)
+    finally:
+        cur.close()
+
+
+@contextmanager
+def _join_transaction(conn):
+    depth = getattr(_tx_local, "depth", 0) + 1
+    _tx_local.depth = depth
+    name = f"qd_sp_{depth}"
+    try:
+        _exec_raw(conn, f"SAVEPOINT {name}")
+        try:
+            yield _SavepointConnection(conn, name)
+        except Exception:
+            try:
+                _exec_raw(conn, f"ROLLBACK TO SAVEPOINT {name}")
+            except Exception:
+                pass
+            raise
+        try:
+            _exec_raw(conn, f"RELEASE SAVEPOINT {name}")
+        except Exception:
+            # The block swallowed a statement error; drop its work, keep the transaction usable.
+            _exec_raw(conn, f"ROLLBACK TO SAVEPOINT {name}")
+    finally:
+        _tx_local.depth = depth - 1
+
+
+@contextmanager
+def pg_transaction():
+    """
+    Run every get_pg_connection() block on this thread in one transaction.
+
+    The connection is taken from the pool by the first nested block, so a
+    failed acquire surfaces there like it would without the transaction.
+    Nested blocks share it, each inside its own savepoint, and the work is
+    committed once when the outermost pg_transaction() exits. Use it to fuse
+    several small bookkeeping writes into a single commit.
+    """
+    if getattr(_tx_local, "active", False):
+        yield
+        return
+    _tx_local.active = True
+    _tx_local.conn = None
+    _tx_local.depth = 0
+    broken = False
+    try:
+        yield
+        if _tx_local.conn is not None:
+            _tx_local.conn.commit()
+    except Exception as e:
+        conn = _tx_local.conn
+        if conn is not None:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            broken = isinstance(e, (OperationalError, InterfaceError)) or bool(getattr(conn, "closed", 0))
+        raise
+    finally:
+        conn = _tx_local.conn
+        _tx_local.active = False
+        _tx_local.conn = None
+        if conn is not None:
+            try:
+                _get_connection_pool().putconn(conn, close=broken)
+            except Exception:
+                pass
+
+
 @contextmanager
 def get_pg_connection():
     """
@@ -616,7 +783,16 @@ def get_pg_connection():
     Uses _acquire_conn_with_wait so a momentary pool exhaustion does not
     immediately fail the request; we wait up to DB_POOL_ACQUIRE_TIMEOUT
     seconds for a connection to be released.
+
+    Inside pg_transaction() the thread's shared connection is reused instead.
     """
+    if getattr(_tx_local, "active", False):
+        shared = _tx_local.conn
+        if shared is None:
+            shared = _tx_local.conn = _acquire_conn_with_wait(_get_connection_pool())
+        with _join_transaction(shared) as pg_conn:
+            yield pg_conn
+        return
     pg_pool = _get_connection_pool()
     conn = None
     broken = False
@@ -567,6 +567,13 @@ CREATE TABLE IF NOT EXISTS pending_orders (
 CREATE INDEX IF NOT EXISTS idx_pending_orders_user_id ON pending_orders(user_id);
 CREATE INDEX IF NOT EXISTS idx_pending_orders_status ON pending_orders(status);
 CREATE INDEX IF NOT EXISTS idx_pending_orders_strategy_id ON pending_orders(strategy_id);
+-- Worker hot paths (every poll tick): partial indexes stay small as sent/failed history grows.
+CREATE INDEX IF NOT EXISTS idx_pending_orders_dispatch ON pending_orders (priority DESC, id ASC)
+    INCLUDE (attempts, max_attempts) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_pending_orders_stale_processing ON pending_orders (updated_at)
+    WHERE status = 'processing';
+CREATE INDEX IF NOT EXISTS idx_pending_orders_alpaca_sent ON pending_orders (sent_at ASC NULLS FIRST, id ASC)
+    WHERE status = 'sent' AND LOWER(COALESCE(exchange_id, '')) = 'alpaca';
 
 -- =============================================================================
 -- 6. Strategy Notifications
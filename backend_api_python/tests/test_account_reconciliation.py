@@ -1,6 +1,13 @@
 """Tests for L1/L3 reconciliation helpers."""
 
-from app.services.live_trading.account_positions import reconcile_strategy_vs_account
+from contextlib import contextmanager
+
+from app.services.live_trading import account_positions
+from app.services.live_trading.account_positions import (
+    AccountLegSnapshot,
+    reconcile_strategy_vs_account,
+    sync_account_positions,
+)
 
 
 def test_reconcile_ok_when_both_flat():
@@ -35,3 +42,40 @@ def test_reconcile_size_mismatch():
     out = reconcile_strategy_vs_account(local, account)
     assert out["status"] == "mismatch"
     assert any("size_mismatch" in n for n in out["notes"])
+
+
+def test_sync_account_positions_upserts_all_legs_in_one_batch(monkeypatch):
+    calls = []
+
+    class _Cursor:
+        def execute(self, sql, params=None):
+            calls.append(("execute", sql, params))
+
+        def executemany(self, sql, rows):
+            calls.append(("executemany", sql, list(rows)))
+
+        def close(self):
+            pass
+
+    class _Conn:
+        def cursor(self):
+            return _Cursor()
+
+        def commit(self):
+            pass
+
+    @contextmanager
+    def fake_conn():
+        yield _Conn()
+
+    monkeypatch.setattr(account_positions, "get_db_connection", fake_conn)
+    legs = [
+        AccountLegSnapshot(symbol="ETHUSDT", side="long", size=1.0, inst_id="ETH-USDT-SWAP"),
+        AccountLegSnapshot(symbol="BTC/USDT", side="short", size=0.5, inst_id="BTC-USDT-SWAP"),
+        AccountLegSnapshot(symbol="SOL/USDT", side="long", size=0.0, inst_id="SOL-USDT-SWAP"),
+    ]
+    sync_account_positions(user_id=1, credential_id=9, exchange_id="okx", market_type="swap", legs=legs)
+
+    assert [c[0] for c in calls] == ["executemany", "execute"]
+    rows = calls[0][2]
+    assert [(r[5], r[6]) for r in rows] == [("ETH/USDT", "long"), ("BTC/USDT", "short")]
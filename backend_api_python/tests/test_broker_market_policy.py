@@ -390,3 +390,21 @@ class TestPolicyEndpoint:
         assert data["broker_markets"]["binance"]["Crypto"] == ["spot", "swap"]
         assert data["broker_markets"]["alpaca"]["Crypto"] == ["spot"]
         assert "alpaca" in data["long_only_brokers"]
+
+
+def test_validated_combinations_are_memoized_but_failures_are_not(monkeypatch):
+    from app.services import broker_market_policy as policy
+
+    policy._VALIDATED_COMBOS.clear()
+    checks = []
+    real_check = policy._check_strategy_config
+    monkeypatch.setattr(policy, "_check_strategy_config", lambda *a: checks.append(a) or real_check(*a))
+
+    for _ in range(3):
+        policy.validate_strategy_config(exchange_id="Binance", market_category="Crypto", market_type="swap")
+    assert len(checks) == 1
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            policy.validate_strategy_config(exchange_id="ibkr", market_category="Crypto", market_type="spot")
+    assert len(checks) == 3
@@ -1,3 +1,5 @@
+import pytest
+
 from app.utils import db_postgres
 
 
@@ -144,3 +146,137 @@ def test_pool_stats_reports_private_psycopg_pool_counts():
         "used": 3,
         "opened": 5,
     }
+
+
+class _RawConn:
+    pass
+
+
+class _RawCursor:
+    def __init__(self, conn):
+        self.connection = conn
+        self.calls = []
+
+    def execute(self, sql, args=None):
+        self.calls.append((sql, args))
+
+
+def test_execute_prepared_prepares_once_per_connection(monkeypatch):
+    monkeypatch.setattr(db_postgres, "DB_PREPARED_STATEMENTS", True)
+    raw = _RawCursor(_RawConn())
+    cur = db_postgres.PostgresCursor(raw)
+
+    cur.execute_prepared("qd_t", "SELECT * FROM t WHERE id = $1::int", (7,))
+    cur.execute_prepared("qd_t", "SELECT * FROM t WHERE id = $1::int", (8,))
+
+    sqls = [c[0] for c in raw.calls]
+    assert sqls == ["PREPARE qd_t AS SELECT * FROM t WHERE id = $1::int", "EXECUTE qd_t (%s)", "EXECUTE qd_t (%s)"]
+    assert raw.calls[-1][1] == (8,)
+
+    other = _RawCursor(_RawConn())
+    db_postgres.PostgresCursor(other).execute_prepared("qd_t", "SELECT * FROM t WHERE id = $1::int", (9,))
+    assert other.calls[0][0].startswith("PREPARE qd_t")
+
+
+def test_execute_prepared_tracks_names_on_real_psycopg2_connections(monkeypatch):
+    extensions = pytest.importorskip("psycopg2.extensions")
+    monkeypatch.setattr(db_postgres, "DB_PREPARED_STATEMENTS", True)
+    # An unconnected instance is enough: like a pooled one it is a C object without __dict__.
+    conn = extensions.connection.__new__(extensions.connection)
+    raw = _RawCursor(conn)
+    cur = db_postgres.PostgresCursor(raw)
+
+    cur.execute_prepared("qd_t", "SELECT * FROM t WHERE id = $1::int", (7,))
+    cur.execute_prepared("qd_t", "SELECT * FROM t WHERE id = $1::int", (8,))
+
+    assert [c[0] for c in raw.calls].count("PREPARE qd_t AS SELECT * FROM t WHERE id = $1::int") == 1
+    assert "qd_t" in db_postgres._prepared_names[conn][0]
+
+
+def test_execute_prepared_falls_back_to_plain_execute(monkeypatch):
+    monkeypatch.setattr(db_postgres, "DB_PREPARED_STATEMENTS", False)
+    raw = _RawCursor(_RawConn())
+    db_postgres.PostgresCursor(raw).execute_prepared("qd_t", "SELECT * FROM t WHERE id = $1::int LIMIT $2", (7, 5))
+    assert raw.calls == [("SELECT * FROM t WHERE id = %s::int LIMIT %s", (7, 5))]
+
+
+def test_execute_prepared_fallback_binds_out_of_order_placeholders(monkeypatch):
+    monkeypatch.setattr(db_postgres, "DB_PREPARED_STATEMENTS", False)
+    raw = _RawCursor(_RawConn())
+    db_postgres.PostgresCursor(raw).execute_prepared(
+        "qd_t", "SELECT * FROM t WHERE id = ANY($2::int[]) OR owner = $1 LIMIT $1", (5, [7, 8])
+    )
+    assert raw.calls == [("SELECT * FROM t WHERE id = ANY(%s::int[]) OR owner = %s LIMIT %s", ([7, 8], 5, 5))]
+
+
+class _TxConn:
+    closed = 0
+
+    def __init__(self):
+        self.sql = []
+        self.commits = 0
+
+    def cursor(self, cursor_factory=None):
+        conn = self
+
+        class _Cur:
+            def execute(self, sql, args=None):
+                conn.sql.append(sql)
+                if sql.startswith("DELETE bad"):
+                    raise RuntimeError("boom")
+
+            def close(self):
+                pass
+
+        return _Cur()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.sql.append("ROLLBACK")
+
+
+class _TxPool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.gets = 0
+
+    def getconn(self):
+        self.gets += 1
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        pass
+
+
+def test_pg_transaction_shares_one_connection_and_commit(monkeypatch):
+    conn = _TxConn()
+    pg_pool = _TxPool(conn)
+    monkeypatch.setattr(db_postgres, "_get_connection_pool", lambda: pg_pool)
+    monkeypatch.setattr(db_postgres, "_acquire_conn_with_wait", lambda p: p.getconn())
+
+    with db_postgres.pg_transaction():
+        pass
+    assert pg_pool.gets == 0
+
+    with db_postgres.pg_transaction():
+        with db_postgres.get_pg_connection() as db:
+            db.cursor().execute("UPDATE a")
+            db.commit()
+        try:
+            with db_postgres.get_pg_connection() as db:
+                db.cursor().execute("DELETE bad")
+        except RuntimeError:
+            pass
+        with db_postgres.get_pg_connection() as db:
+            db.cursor().execute("UPDATE b")
+            db.commit()
+
+    assert pg_pool.gets == 1
+    assert conn.commits == 1
+    assert conn.sql == [
+        "SAVEPOINT qd_sp_1", "UPDATE a", "RELEASE SAVEPOINT qd_sp_1",
+        "SAVEPOINT qd_sp_1", "DELETE bad", "ROLLBACK TO SAVEPOINT qd_sp_1",
+        "SAVEPOINT qd_sp_1", "UPDATE b", "RELEASE SAVEPOINT qd_sp_1",
+    ]
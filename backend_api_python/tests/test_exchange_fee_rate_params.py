@@ -123,3 +123,21 @@ def test_okx_fee_rate_uses_inst_type_and_inst_id():
     assert result == {"maker": 0.0002, "taker": 0.0005}
     assert client.seen[-1]["path"] == "/api/v5/account/trade-fee"
     assert client.seen[-1]["params"] == {"instType": "SWAP", "instId": "SOL-USDT-SWAP"}
+
+
+def test_binance_fees_for_several_orders_use_one_trades_query():
+    client = _fake_client(
+        BinanceFuturesClient,
+        [
+            {"orderId": 11, "commission": "0.02", "commissionAsset": "USDT"},
+            {"orderId": 12, "commission": "-0.05", "commissionAsset": "USDT"},
+            {"orderId": 99, "commission": "7", "commissionAsset": "USDT"},
+        ],
+    )
+
+    fee, ccy = client.get_fees_for_orders(symbol="BTC/USDT", order_ids=["11", "12"])
+
+    assert (round(fee, 8), ccy) == (0.07, "USDT")
+    assert len(client.seen) == 1
+    assert client.seen[0]["path"] == "/fapi/v1/userTrades"
+    assert "orderId" not in client.seen[0]["params"]
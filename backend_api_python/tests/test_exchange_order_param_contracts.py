@@ -275,3 +275,15 @@ def test_place_grid_limit_order_sets_leverage_for_contract_clients():
     client.set_leverage.assert_called_once()
     assert client.set_leverage.call_args.kwargs["hold_side"] == "long"
     assert client.set_leverage.call_args.kwargs["product_type"] == "USDT-FUTURES"
+
+
+def test_gate_futures_set_leverage_skips_repeat_calls(monkeypatch):
+    client = GateUsdtFuturesClient(api_key="k", secret_key="s")
+    calls = []
+    monkeypatch.setattr(client, "_signed_request", lambda method, path, **kw: calls.append(kw["params"]) or {})
+
+    assert client.set_leverage(contract="BTC_USDT", leverage=5)
+    assert client.set_leverage(contract="BTC_USDT", leverage=5)
+    assert client.set_leverage(contract="BTC_USDT", leverage=10)
+
+    assert calls == [{"leverage": "5"}, {"leverage": "10"}]
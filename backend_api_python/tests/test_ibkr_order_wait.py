@@ -0,0 +1,53 @@
+"""IBKR order placement waits on status events instead of a fixed sleep."""
+
+from types import SimpleNamespace
+
+from app.services.ibkr_trading.client import IBKRClient
+
+
+class _FakeIB:
+    def __init__(self, trade, statuses):
+        self.trade = trade
+        self.statuses = list(statuses)
+        self.waits = 0
+
+    def waitOnUpdate(self, timeout=0):
+        self.waits += 1
+        if self.statuses:
+            self.trade.orderStatus.status = self.statuses.pop(0)
+        return True
+
+
+class _FakeTrade:
+    def __init__(self):
+        self.orderStatus = SimpleNamespace(status="PendingSubmit")
+
+    def isDone(self):
+        return self.orderStatus.status in ("Filled", "Cancelled", "ApiCancelled", "Inactive")
+
+
+def _client(statuses):
+    trade = _FakeTrade()
+    client = IBKRClient()
+    client._ib = _FakeIB(trade, statuses)
+    return client, trade
+
+
+def test_market_wait_returns_on_fill():
+    client, trade = _client(["Submitted", "Filled", "Filled"])
+    client._await_order_status(trade, 5.0)
+    assert trade.orderStatus.status == "Filled"
+    assert client._ib.waits == 2
+
+
+def test_limit_wait_returns_on_ack():
+    client, trade = _client(["Submitted", "Filled"])
+    client._await_order_status(trade, 5.0, until_done=False)
+    assert trade.orderStatus.status == "Submitted"
+    assert client._ib.waits == 1
+
+
+def test_wait_is_bounded_by_timeout():
+    client, trade = _client([])
+    client._await_order_status(trade, 0.0)
+    assert client._ib.waits == 0
@@ -33,3 +33,49 @@ def test_nested_nan(app):
         parsed = json.loads(raw)
         assert parsed["list"] == [1, None, 3]
         assert parsed["nested"]["v"] is None
+
+
+def test_datetimes_and_non_str_keys(app):
+    from datetime import date, datetime, timezone
+
+    with app.app_context():
+        raw = app.json.dumps({
+            "ts": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "day": date(2024, 1, 2),
+            "by_id": {7: "x"},
+        })
+        parsed = json.loads(raw)
+        assert parsed["ts"].startswith("2024-01-02T03:04:05")
+        assert parsed["ts"].endswith("Z")
+        assert parsed["day"] == "2024-01-02"
+        assert parsed["by_id"] == {"7": "x"}
+
+
+def test_unsupported_values_fall_back_to_stdlib(app):
+    with app.app_context():
+        raw = app.json.dumps({"big": 2 ** 70, "v": float("nan")})
+        parsed = json.loads(raw)
+        assert parsed["big"] == 2 ** 70
+        assert parsed["v"] is None
+
+
+def test_jsonify_uses_orjson(app, monkeypatch):
+    import pytest
+    from flask import jsonify
+
+    import app as app_module
+
+    orjson = pytest.importorskip("orjson")
+    real_dumps = orjson.dumps
+    calls = []
+
+    def tracking_dumps(obj, **kw):
+        calls.append(kw["option"])
+        return real_dumps(obj, **kw)
+
+    monkeypatch.setattr(app_module.orjson, "dumps", tracking_dumps)
+    with app.app_context():
+        resp = jsonify({"a": float("nan"), "b": 1})
+
+    assert calls
+    assert json.loads(resp.get_data(as_text=True)) == {"a": None, "b": 1}
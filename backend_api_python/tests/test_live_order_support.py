@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import sys
+import threading
+import time
+
+import pytest
+
 from app.services.live_trading.base import LiveTradingError
 from app.services.pending_orders import live_order_phases
 from app.services.pending_orders.live_order_support import (
     FillAccumulator,
     LiveOrderRejected,
     build_live_order_context,
+    canonical_market_type,
     make_client_order_id,
     signal_to_side_pos_reduce,
 )
@@ -23,10 +30,21 @@ def test_make_client_order_id_default_keeps_phase():
     assert make_client_order_id(exchange_id="bitget", strategy_id=12, order_id=34, phase="mkt") == "qd_12_34_mkt"
 
 
+def test_phase_client_order_ids_match_per_phase_ids():
+    from app.services.pending_orders.live_order_support import phase_client_order_ids
+
+    for exchange_id, sid, oid in (("okx", 123456789, 987654321), ("okx", 12, 34), ("binance", 12, 34)):
+        assert phase_client_order_ids(exchange_id=exchange_id, strategy_id=sid, order_id=oid) == (
+            make_client_order_id(exchange_id=exchange_id, strategy_id=sid, order_id=oid, phase="lmt"),
+            make_client_order_id(exchange_id=exchange_id, strategy_id=sid, order_id=oid, phase="mkt"),
+        )
+
+
 def test_signal_to_side_pos_reduce_exit_aliases():
     assert signal_to_side_pos_reduce("close_long_trailing") == ("sell", "long", True)
     assert signal_to_side_pos_reduce("close_short_profit") == ("buy", "short", True)
     assert signal_to_side_pos_reduce("open_short") == ("sell", "short", False)
+    assert signal_to_side_pos_reduce(" Add_Long ") == ("buy", "long", False)
 
 
 def test_signal_to_side_pos_reduce_rejects_unknown():
@@ -53,6 +71,34 @@ def test_fill_accumulator_tracks_weighted_average_and_fee():
     assert fills.fee_ccy == "USDT"
 
 
+def test_record_phase_query_parses_snapshot_once():
+    fills = FillAccumulator()
+    phases = {}
+    snapshot = {"filled": "2", "avg_price": "100", "fee": "-0.1", "fee_ccy": "USDT"}
+
+    assert live_order_phases.parse_fill_quote(snapshot) == (2.0, 100.0, -0.1, "USDT")
+    assert live_order_phases.record_phase_query(phases, "limit_query", fills, snapshot) == 2.0
+    assert phases["limit_query"] is snapshot
+    assert (fills.total_base, fills.total_fee, fills.fee_ccy) == (2.0, 0.1, "USDT")
+
+
+def test_summarize_phases_drops_raw_envelopes_unless_a_phase_failed():
+    from app.services.pending_orders.live_order_support import summarize_phases
+
+    phases = {
+        "limit_place": {"code": "0", "data": [{"ordId": "1"}]},
+        "limit_query": {"filled": 1.0, "avg_price": 100.0, "status": "filled", "order": {"raw": "x"}},
+        "tail_guard": {"remaining": 0.1},
+    }
+    assert summarize_phases(phases) == {
+        "limit_place": {"code": "0"},
+        "limit_query": {"filled": 1.0, "avg_price": 100.0, "status": "filled"},
+        "tail_guard": {"remaining": 0.1},
+    }
+    failed = dict(phases, market_error="rejected")
+    assert summarize_phases(failed) is failed
+
+
 def test_maker_limit_price_offsets_buy_and_sell():
     assert live_order_phases.maker_limit_price(ref_price=100, side="buy", maker_offset=0.01) == 99
     assert live_order_phases.maker_limit_price(ref_price=100, side="sell", maker_offset=0.01) == 101
@@ -147,10 +193,11 @@ def test_wait_live_order_fill_rejects_unknown_client():
 def test_build_live_order_context_normalizes_and_validates():
     ctx = build_live_order_context(
         order_id=99,
-        order_row={"strategy_id": 12, "symbol": "BTC/USDT", "signal_type": "open_long", "market_type": "futures"},
+        order_row={"strategy_id": 12, "symbol": "BTC/USDT", "signal_type": "open_long", "market_type": "futures", "price": "100"},
         payload={"amount": 0.01},
         load_strategy_configs=lambda strategy_id: {
             "user_id": 7,
+            "leverage": "3",
             "market_category": "Crypto",
             "market_type": "futures",
             "trading_config": {"trade_direction": "long", "bot_type": "trend"},
@@ -165,6 +212,18 @@ def test_build_live_order_context_normalizes_and_validates():
     assert ctx.exchange_id == "binance"
     assert ctx.market_type == "swap"
     assert ctx.safe_exchange_config == {"exchange_id": "binance"}
+    assert (ctx.ref_price, ctx.leverage) == (100.0, 3.0)
+    # Normalized keys are interned so hot-path comparisons hit the identity shortcut.
+    assert ctx.exchange_id is sys.intern("binance")
+    assert ctx.signal_type is sys.intern("open_long")
+
+
+def test_canonical_market_type_folds_aliases_and_memoizes():
+    assert canonical_market_type(" Perp ") == "swap"
+    assert canonical_market_type("SPOT") is sys.intern("spot")
+    hits = canonical_market_type.cache_info().hits
+    canonical_market_type("SPOT")
+    assert canonical_market_type.cache_info().hits == hits + 1
 
 
 def test_build_live_order_context_rejects_missing_symbol():
@@ -207,3 +266,216 @@ def test_build_live_order_context_rejects_policy_violation():
     else:
         raise AssertionError("expected LiveOrderRejected")
 
+
+def test_client_kind_is_resolved_once_per_client_class():
+    from app.services.live_trading.okx import OkxClient
+
+    class PaperOkx(OkxClient):
+        def __init__(self):
+            self.calls = []
+
+        def cancel_order(self, **kwargs):
+            self.calls.append(kwargs)
+
+    client = PaperOkx()
+    assert live_order_phases.client_kind(client) == "okx"
+    assert live_order_phases._CLIENT_KINDS[PaperOkx] == "okx"
+    handlers = live_order_phases.phase_handlers(client)
+    assert handlers.cancel is live_order_phases._cancel_okx
+    assert live_order_phases.phase_handlers(client) is handlers
+
+    live_order_phases.cancel_live_limit_order(
+        client=client,
+        symbol="BTC/USDT",
+        order_id="ex-1",
+        client_order_id="client-1",
+        market_type="swap",
+        exchange_config={},
+    )
+    assert client.calls == [{"market_type": "swap", "symbol": "BTC/USDT", "ord_id": "ex-1", "cl_ord_id": "client-1"}]
+    assert live_order_phases.cancel_live_limit_order(
+        client=object(), symbol="BTC/USDT", order_id="", client_order_id="", market_type="spot", exchange_config={}
+    ) is None
+
+
+def test_bitget_mix_params_are_resolved_once_and_reused_by_phases():
+    from app.services.live_trading.bitget import BitgetMixClient
+
+    class PaperBitget(BitgetMixClient):
+        def __init__(self):
+            self.calls = []
+
+        def cancel_order(self, **kwargs):
+            self.calls.append(kwargs)
+
+    params = live_order_phases.bitget_mix_params(
+        {"marginMode": "isolated"}, {"productType": "COIN-FUTURES", "margin_coin": "BTC"}
+    )
+    assert params == ("COIN-FUTURES", "BTC", "isolated")
+
+    client = PaperBitget()
+    live_order_phases.cancel_live_limit_order(
+        client=client,
+        symbol="BTC/USD",
+        order_id="ex-1",
+        client_order_id="client-1",
+        market_type="swap",
+        exchange_config={},
+        bitget=params,
+    )
+    assert client.calls[0]["product_type"] == "COIN-FUTURES"
+    assert client.calls[0]["margin_coin"] == "BTC"
+
+
+def test_live_order_notifier_falls_back_to_payload_price_and_amount():
+    from app.services.pending_orders.live_order_support import LiveOrderNotifier
+
+    calls = []
+
+    class FakeNotifier:
+        def notify_signal(self, **kwargs):
+            calls.append(kwargs)
+            return {"browser": {"ok": True}, "telegram": {"ok": False}}
+
+    notifier = LiveOrderNotifier(
+        order_id=1,
+        strategy_id=5,
+        order_row={"symbol": "BTC/USDT", "signal_type": "open_short", "price": "100", "amount": "2"},
+        payload={"strategy_name": "S", "notification_config": {"channels": ["browser"]}},
+        notifier=FakeNotifier(),
+        load_notification_config=lambda sid: {},
+        load_strategy_name=lambda sid: "",
+    )
+    notifier.notify(status="sent", price_hint=0, amount_hint=None)
+    notifier.notify(status="filled", price_hint=110.0, amount_hint=1.5)
+
+    assert (calls[0]["price"], calls[0]["stake_amount"], calls[0]["direction"]) == (100.0, 200.0, "short")
+    assert (calls[1]["price"], calls[1]["stake_amount"]) == (110.0, 165.0)
+
+
+def test_live_order_notifier_background_sends_once_per_status():
+    from app.services.pending_orders.live_order_support import LiveOrderNotifier, wait_for_live_notifications
+
+    calls = []
+
+    class SlowNotifier:
+        def notify_signal(self, **kwargs):
+            time.sleep(0.2)
+            calls.append(kwargs["extra"]["status"])
+            return {"telegram": {"ok": True}}
+
+    notifier = LiveOrderNotifier(
+        order_id=1,
+        strategy_id=5,
+        order_row={"symbol": "BTC/USDT", "signal_type": "open_long", "price": "100", "amount": "1"},
+        payload={"strategy_name": "S", "notification_config": {"channels": ["telegram"]}},
+        notifier=SlowNotifier(),
+        load_notification_config=lambda sid: {},
+        load_strategy_name=lambda sid: "",
+        background=True,
+    )
+    started = time.monotonic()
+    notifier.notify(status="failed", error="x")
+    notifier.notify(status="failed", error="x")
+    assert time.monotonic() - started < 0.1
+
+    assert wait_for_live_notifications(timeout=2.0)
+    assert calls == ["failed"]
+
+
+def test_live_order_notifier_background_defers_config_lookup():
+    from app.services.pending_orders.live_order_support import LiveOrderNotifier, wait_for_live_notifications
+
+    calls, lookups = [], []
+
+    def slow_config(strategy_id):
+        lookups.append(strategy_id)
+        time.sleep(0.2)
+        return {"channels": ["telegram"]}
+
+    class Notifier:
+        def notify_signal(self, **kwargs):
+            calls.append(kwargs["notification_config"])
+
+    notifier = LiveOrderNotifier(
+        order_id=2,
+        strategy_id=5,
+        order_row={"symbol": "BTC/USDT", "signal_type": "open_long"},
+        payload={"strategy_name": "S"},
+        notifier=Notifier(),
+        load_notification_config=slow_config,
+        load_strategy_name=lambda sid: "",
+        background=True,
+    )
+    started = time.monotonic()
+    notifier.notify(status="sent")
+    notifier.notify(status="filled")
+    assert time.monotonic() - started < 0.1
+
+    assert wait_for_live_notifications(timeout=2.0)
+    assert calls == [{"channels": ["telegram"]}] * 2
+    assert lookups == [5]
+
+
+def test_live_order_notifier_slow_send_does_not_block_other_orders():
+    from app.services.pending_orders import live_order_support
+    from app.services.pending_orders.live_order_support import LiveOrderNotifier, wait_for_live_notifications
+
+    if live_order_support._NOTIFY_WORKERS < 2:
+        pytest.skip("needs at least two notify workers")
+    release = threading.Event()
+    sent = []
+
+    class Notifier:
+        def notify_signal(self, **kwargs):
+            if kwargs["extra"]["pending_order_id"] == 0:
+                release.wait(2.0)
+            sent.append(kwargs["extra"]["pending_order_id"])
+            return {}
+
+    def make(order_id):
+        return LiveOrderNotifier(
+            order_id=order_id,
+            strategy_id=5,
+            order_row={"symbol": "BTC/USDT", "signal_type": "open_long"},
+            payload={"strategy_name": "S", "notification_config": {"channels": ["telegram"]}},
+            notifier=Notifier(),
+            load_notification_config=lambda sid: {},
+            load_strategy_name=lambda sid: "",
+            background=True,
+        )
+
+    make(0).notify(status="sent")
+    make(1).notify(status="sent")
+    deadline = time.monotonic() + 2.0
+    while 1 not in sent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sent == [1]
+    release.set()
+    assert wait_for_live_notifications(timeout=2.0)
+    assert sent == [1, 0]
+
+
+def test_signal_direction_uses_the_signal_table():
+    from app.services.pending_orders.live_order_support import signal_direction
+
+    assert [signal_direction(s) for s in ("open_short", "close_short_trailing", "close_long", "add_long")] == [
+        "short",
+        "short",
+        "long",
+        "long",
+    ]
+    assert signal_direction("Custom_SHORT") == "short"
+
+
+def test_apply_fill_delta_adds_only_what_filled_after_the_first_snapshot():
+    fills = FillAccumulator()
+    before = {"filled": 2.0, "avg_price": 100.0, "fee": 0.1}
+    live_order_phases.apply_fill_snapshot(fills, before)
+    after = {"filled": 3.0, "avg_price": 101.0, "fee": 0.15, "status": "CANCELED"}
+
+    assert live_order_phases.apply_fill_delta(fills, before, after) == 1.0
+    assert fills.total_base == 3.0
+    assert round(fills.avg_price(), 8) == 101.0
+    assert round(fills.total_fee, 8) == 0.15
+    assert live_order_phases.apply_fill_delta(fills, after, after) == 0.0
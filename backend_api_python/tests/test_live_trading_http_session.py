@@ -0,0 +1,126 @@
+"""Exchange REST clients share one keep-alive HTTP pool."""
+
+import pytest
+
+from app.services.live_trading import base
+from app.services.live_trading.base import BaseRestClient
+
+
+class _FakeResponse:
+    status_code = 200
+    text = '{"ok": true}'
+
+    def json(self):
+        return {"ok": True}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return _FakeResponse()
+
+
+def test_clients_reuse_the_shared_session_without_connection_close(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(base, "_http_session", session)
+    monkeypatch.delenv("LIVE_TRADING_HTTP_KEEPALIVE", raising=False)
+
+    for host in ("https://a.example", "https://b.example"):
+        status, parsed, _ = BaseRestClient(host)._request("GET", "/ping")
+        assert (status, parsed) == (200, {"ok": True})
+
+    assert [c["url"] for c in session.calls] == ["https://a.example/ping", "https://b.example/ping"]
+    assert all("Connection" not in (c["headers"] or {}) for c in session.calls)
+
+
+def test_keepalive_can_be_disabled(monkeypatch):
+    calls = []
+    monkeypatch.setenv("LIVE_TRADING_HTTP_KEEPALIVE", "false")
+    monkeypatch.setattr(base.requests, "request", lambda **kw: calls.append(kw) or _FakeResponse())
+
+    BaseRestClient("https://a.example")._request("GET", "/ping")
+
+    assert calls[0]["headers"]["Connection"] == "close"
+
+
+def test_shared_session_rejects_cookies():
+    session = base._get_http_session()
+    assert session.cookies._policy.allowed_domains() == ()
+
+
+def test_create_client_reuses_instances_per_config(monkeypatch):
+    from app.services.live_trading import factory
+
+    monkeypatch.delenv("LIVE_TRADING_CLIENT_POOL", raising=False)
+    factory.clear_client_pool()
+    cfg = {"exchange_id": "binance", "api_key": "k", "secret_key": "s"}
+
+    first = factory.create_client(cfg, market_type="swap")
+    assert factory.create_client(dict(cfg), market_type="swap") is first
+    assert factory.create_client(cfg, market_type="spot") is not first
+    assert factory.create_client({**cfg, "api_key": "k2"}, market_type="swap") is not first
+
+    monkeypatch.setenv("LIVE_TRADING_CLIENT_POOL", "false")
+    assert factory.create_client(cfg, market_type="swap") is not first
+    factory.clear_client_pool()
+
+
+def test_in_flight_requests_per_host_are_capped_at_the_pool_size(monkeypatch):
+    import threading
+    import time as _time
+
+    monkeypatch.setattr(base, "_HTTP_POOL_MAXSIZE", 2)
+    monkeypatch.setattr(base, "_host_slots", {})
+    monkeypatch.delenv("LIVE_TRADING_HTTP_KEEPALIVE", raising=False)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    class SlowSession(_FakeSession):
+        def request(self, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            _time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return _FakeResponse()
+
+    monkeypatch.setattr(base, "_http_session", SlowSession())
+    threads = [threading.Thread(target=BaseRestClient("https://a.example")._request, args=("GET", "/ping")) for _ in range(6)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert peak[0] == 2
+
+
+def test_host_slot_wait_is_bounded_by_the_request_timeout(monkeypatch):
+    monkeypatch.setattr(base, "_HTTP_POOL_MAXSIZE", 1)
+    monkeypatch.setattr(base, "_host_slots", {})
+    monkeypatch.delenv("LIVE_TRADING_HTTP_KEEPALIVE", raising=False)
+    monkeypatch.setattr(base, "_http_session", _FakeSession())
+
+    with base._host_slot("https://a.example/ping", 1.0):
+        with pytest.raises(base.LiveTradingError, match="busy"):
+            BaseRestClient("https://a.example", timeout_sec=0.05)._request("GET", "/ping")
+    assert BaseRestClient("https://a.example", timeout_sec=0.05)._request("GET", "/ping")[0] == 200
+
+
+def test_fill_poll_delay_stretches_with_age_but_not_past_the_deadline(monkeypatch):
+    monkeypatch.setattr(base.time, "time", lambda: 100.0)
+
+    assert base.fill_poll_delay(0.5, end_ts=110.0, max_wait_sec=10.0) == 0.5
+    assert base.fill_poll_delay(0.5, end_ts=104.0, max_wait_sec=10.0) == 1.25
+    assert base.fill_poll_delay(0.5, end_ts=130.0, max_wait_sec=60.0) == 1.5
+    assert base.fill_poll_delay(0.5, end_ts=100.7, max_wait_sec=60.0) == pytest.approx(0.7)
+    assert base.fill_poll_delay(0.5, end_ts=99.0, max_wait_sec=10.0) == 0.5
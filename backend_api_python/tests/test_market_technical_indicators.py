@@ -0,0 +1,42 @@
+"""Market-analysis indicator bundle (services/market/technical_indicators)."""
+
+from app.services.market.technical_indicators import (
+    calc_atr_wilder,
+    calc_bollinger,
+    calculate_indicators,
+)
+
+
+def _klines(n):
+    out = []
+    price = 100.0
+    for i in range(n):
+        close = price + (1.5 if i % 3 else -2.0)
+        out.append({
+            "open": price,
+            "close": close,
+            "high": max(price, close) + 0.5,
+            "low": min(price, close) - 0.5,
+            "volume": 1000 + i,
+        })
+        price = close
+    return out
+
+
+def test_bollinger_middle_matches_ma20():
+    klines = _klines(40)
+    ind = calculate_indicators(klines)
+    closes = [k["close"] for k in klines]
+    assert ind["bollinger"] == calc_bollinger(closes, 20, 2)
+    assert ind["bollinger"]["BB_middle"] == round(ind["moving_averages"]["ma20"], 4)
+
+
+def test_atr_and_price_position_use_shared_windows():
+    klines = _klines(40)
+    ind = calculate_indicators(klines)
+    assert ind["volatility"]["atr"] == round(calc_atr_wilder(klines, 14), 6)
+    high_20 = max(k["high"] for k in klines[-20:])
+    low_20 = min(k["low"] for k in klines[-20:])
+    expected = round((klines[-1]["close"] - low_20) / (high_20 - low_20) * 100, 1)
+    assert ind["price_position"] == expected
+    assert ind["levels"]["swing_high"] == round(high_20, 6)
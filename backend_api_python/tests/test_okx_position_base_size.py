@@ -29,3 +29,90 @@ def test_parse_okx_positions_converts_contracts():
     assert len(rows) == 1
     assert rows[0]["symbol"] == "BNB/USDT"
     assert rows[0]["size"] == 0.51
+
+
+def test_okx_instrument_metadata_is_shared_across_client_instances(monkeypatch):
+    from app.services.live_trading import okx as okx_module
+    from app.services.live_trading.okx import OkxClient
+
+    monkeypatch.setattr(okx_module, "_INSTRUMENT_CACHE", {})
+    calls = []
+
+    def fake_public_request(self, method, path, params=None):
+        calls.append(params["instId"])
+        return {"data": [{"instId": params["instId"], "ctVal": "0.01"}]}
+
+    monkeypatch.setattr(OkxClient, "_public_request", fake_public_request)
+    for _ in range(2):
+        client = OkxClient(api_key="k", secret_key="s", passphrase="p")
+        assert client.get_instrument(inst_type="SWAP", inst_id="BNB-USDT-SWAP")["ctVal"] == "0.01"
+
+    assert calls == ["BNB-USDT-SWAP"]
+
+
+def test_okx_swap_min_base_is_cached_and_invalidated_on_size_reject(monkeypatch):
+    import pytest
+
+    from app.services.live_trading import okx as okx_module
+    from app.services.live_trading.base import LiveTradingError
+    from app.services.live_trading.okx import OkxClient
+
+    monkeypatch.setattr(okx_module, "_INSTRUMENT_CACHE", {})
+    monkeypatch.setattr(okx_module, "_MIN_BASE_CACHE", {})
+    calls = []
+
+    def fake_public_request(self, method, path, params=None):
+        calls.append(params["instId"])
+        return {"data": [{"instId": params["instId"], "lotSz": "1", "minSz": "1", "ctVal": "0.01"}]}
+
+    def fake_signed_request(self, method, path, **kwargs):
+        raise LiveTradingError("OKX error: {'code': '1', 'data': [{'sCode': '51121'}]}")
+
+    monkeypatch.setattr(OkxClient, "_public_request", fake_public_request)
+    monkeypatch.setattr(OkxClient, "_signed_request", fake_signed_request)
+    client = OkxClient(api_key="k", secret_key="s", passphrase="p")
+    assert client.swap_min_base("BNB-USDT-SWAP") == 0.01
+    assert client.swap_min_base("BNB-USDT-SWAP") == 0.01
+    assert calls == ["BNB-USDT-SWAP"]
+
+    with pytest.raises(LiveTradingError):
+        client._post_order({"instId": "BNB-USDT-SWAP"}, inst_type="SWAP")
+    assert client.swap_min_base("BNB-USDT-SWAP") == 0.01
+    assert calls == ["BNB-USDT-SWAP", "BNB-USDT-SWAP"]
+
+
+def test_position_sync_fetcher_dispatches_okx_swap_and_converts_contracts():
+    from app.services.live_trading.okx import OkxClient
+    from app.services.pending_orders.position_fetchers import position_fetcher_for
+
+    client = MagicMock(spec=OkxClient)
+    client.get_positions.return_value = {
+        "data": [{"instId": "BNB-USDT-SWAP", "posSide": "net", "pos": "-51", "avgPx": "685.4"}]
+    }
+    client.get_instrument.return_value = {"ctVal": "0.01"}
+
+    fetcher = position_fetcher_for(client, "swap")
+    size, entry, inst = fetcher.fetch(client, {})
+
+    assert fetcher.name == "okx"
+    assert size == {"BNB/USDT": {"long": 0.0, "short": 0.51}}
+    assert entry["BNB/USDT"]["short"] == 685.4
+    assert inst["BNB/USDT"]["short"] == "BNB-USDT-SWAP"
+
+
+def test_position_sync_fetcher_falls_back_to_spot_wallet_for_swap_clients_on_spot():
+    from app.services.live_trading.okx import OkxClient
+    from app.services.pending_orders.position_fetchers import position_fetcher_for
+
+    client = MagicMock(spec=OkxClient)
+    assert position_fetcher_for(client, "spot").name == "spot"
+    assert position_fetcher_for(object(), "swap") is None
+
+
+def test_linear_symbol_normalization_splits_usdt_and_usdc_quotes():
+    from app.services.pending_orders.position_fetchers import _hb_linear_symbol
+
+    assert _hb_linear_symbol("BTCUSDT") == "BTC/USDT"
+    assert _hb_linear_symbol("1000PEPEUSDC") == "1000PEPE/USDC"
+    assert _hb_linear_symbol("BTC/USDT") == "BTC/USDT"
+    assert _hb_linear_symbol("USDT") == "USDT"
@@ -0,0 +1,482 @@
+"""PendingOrderWorker per-tick DB access: batched claims and cached strategy configs."""
+
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import pending_order_worker as pow_module
+from app.services.pending_order_worker import PendingOrderWorker
+
+
+class _FakeCursor:
+    def __init__(self, log, rows):
+        self._log = log
+        self._rows = rows
+
+    def execute(self, sql, params=None):
+        self._log.append(" ".join(sql.split()))
+
+    def execute_prepared(self, name, sql, params=()):
+        self._log.append(params)
+        self.execute(sql, params)
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+
+class _FakeConn:
+    def __init__(self, log, rows):
+        self._log = log
+        self._rows = rows
+        self.commits = 0
+
+    def cursor(self):
+        return _FakeCursor(self._log, self._rows)
+
+    def commit(self):
+        self.commits += 1
+
+
+def _patch_db(monkeypatch, rows):
+    log, opened = [], []
+
+    @contextmanager
+    def fake_conn():
+        conn = _FakeConn(log, rows)
+        opened.append(conn)
+        yield conn
+
+    monkeypatch.setattr(pow_module, "get_db_connection", fake_conn)
+    return log, opened
+
+
+def test_claim_is_one_round_trip_and_dispatches_in_queue_order(monkeypatch):
+    rows = [
+        {"id": 7, "priority": 0},
+        {"id": 3, "priority": 5},
+        {"id": 4, "priority": 0},
+    ]
+    log, opened = _patch_db(monkeypatch, rows)
+    worker = PendingOrderWorker()
+
+    claimed = worker._claim_pending_orders(limit=10)
+
+    assert [r["id"] for r in claimed] == [3, 4, 7]
+    assert len(opened) == 1 and opened[0].commits == 1
+    assert sum("RETURNING *" in sql for sql in log) == 1
+    assert "FOR UPDATE SKIP LOCKED" in log[-1]
+
+
+def test_stale_requeue_runs_at_most_once_per_interval(monkeypatch):
+    log, _ = _patch_db(monkeypatch, [])
+    worker = PendingOrderWorker()
+    worker._stale_requeue_interval_sec = 60.0
+
+    worker._claim_pending_orders()
+    worker._claim_pending_orders()
+
+    requeues = [sql for sql in log if "requeued_stale_processing" in sql]
+    assert len(requeues) == 1
+
+
+def test_strategy_cfg_is_cached_until_invalidated(monkeypatch):
+    loads = []
+
+    def fake_load(sid):
+        loads.append(sid)
+        return {"user_id": 1, "exchange_config": {"exchange_id": "binance"}}
+
+    monkeypatch.setattr(pow_module, "load_strategy_configs", fake_load)
+    monkeypatch.setattr(pow_module, "resolve_exchange_config", lambda cfg, user_id=1: dict(cfg))
+    worker = PendingOrderWorker()
+
+    sc, ex = worker._strategy_cfg(5)
+    ex["exchange_id"] = "mutated"
+    assert worker._strategy_cfg(5)[1]["exchange_id"] == "binance"
+    assert loads == [5]
+
+    worker.invalidate_strategy_cfg(5)
+    worker._strategy_cfg(5)
+    assert loads == [5, 5]
+
+
+def test_trading_config_patch_drops_the_worker_caches(monkeypatch):
+    from app import startup
+    from app.services import strategy as strategy_module
+
+    worker = PendingOrderWorker()
+    worker._strategy_cfg_cache[5] = (time.time() + 60, {}, {})
+    worker._strategy_meta_cache[5] = (time.time() + 60, "Grid A", {})
+    monkeypatch.setattr(startup, "_pending_order_worker", worker)
+
+    @contextmanager
+    def fake_conn():
+        yield _FakeConn([], [])
+
+    monkeypatch.setattr(strategy_module, "get_db_connection", fake_conn)
+    service = strategy_module.StrategyService()
+    monkeypatch.setattr(service, "get_strategy", lambda sid, user_id=None: {"trading_config": {}})
+
+    assert service.patch_trading_config(5, {"leverage": 3})
+    assert 5 not in worker._strategy_cfg_cache
+    assert 5 not in worker._strategy_meta_cache
+
+
+def test_claim_loops_skip_strategies_in_flight_on_another_loop(monkeypatch):
+    rows = [{"id": 1, "strategy_id": 10}, {"id": 2, "strategy_id": None}]
+    log, _ = _patch_db(monkeypatch, rows)
+    worker = PendingOrderWorker()
+    worker._stale_requeue_interval_sec = 1e9
+    worker._last_stale_requeue_ts = time.time()
+
+    claimed = worker._claim_pending_orders(limit=10)
+    rows.clear()
+    worker._claim_pending_orders(limit=10)
+    assert log[-2] == ([0, 10], 10)
+    assert "ANY($1::int[])" in log[-1]
+
+    worker._release_strategies(claimed)
+    worker._claim_pending_orders(limit=10)
+    assert log[-2] == ([], 10)
+
+
+def test_claim_binds_in_order_without_prepared_statements(monkeypatch):
+    from app.utils import db_postgres
+
+    monkeypatch.setattr(db_postgres, "DB_PREPARED_STATEMENTS", False)
+    calls = []
+
+    class RawCursor:
+        def execute(self, sql, args=None):
+            calls.append((" ".join(sql.split()), args))
+
+        def fetchall(self):
+            return []
+
+        def close(self):
+            pass
+
+    class Conn:
+        def cursor(self):
+            return db_postgres.PostgresCursor(RawCursor())
+
+        def commit(self):
+            pass
+
+    @contextmanager
+    def fake_conn():
+        yield Conn()
+
+    monkeypatch.setattr(pow_module, "get_db_connection", fake_conn)
+    worker = PendingOrderWorker()
+    worker._stale_requeue_interval_sec = 1e9
+    worker._last_stale_requeue_ts = time.time()
+    worker._inflight_strategies[7] = 1
+
+    assert worker._claim_pending_orders(limit=10) == []
+    sql, args = calls[-1]
+    assert sql.index("ANY(%s::int[])") < sql.index("LIMIT %s::int")
+    assert args == ([7], 10)
+
+
+def test_strategy_name_and_notification_config_share_one_cached_lookup(monkeypatch):
+    log, _ = _patch_db(monkeypatch, [])
+    rows = [{"strategy_name": " Grid A ", "notification_config": '{"channels": ["telegram"]}'}]
+    monkeypatch.setattr(_FakeCursor, "fetchone", lambda self: rows[0], raising=False)
+    worker = PendingOrderWorker()
+
+    assert worker._load_strategy_name(5) == "Grid A"
+    cfg = worker._load_notification_config(5)
+    cfg["channels"].append("email")
+    assert worker._load_notification_config(5) == {"channels": ["telegram"]}
+    assert sum("strategy_name" in str(sql) for sql in log) == 1
+
+    worker.invalidate_strategy_cfg(5)
+    worker._load_strategy_name(5)
+    assert sum("strategy_name" in str(sql) for sql in log) == 2
+
+
+def test_notify_new_order_wakes_the_run_loop(monkeypatch):
+    worker = PendingOrderWorker(poll_interval_sec=30.0)
+    ticks = []
+
+    def fake_tick():
+        ticks.append(1)
+        if len(ticks) == 1:
+            pow_module.notify_new_order()
+        else:
+            worker.stop()
+
+    monkeypatch.setattr(worker, "_tick", fake_tick)
+    started = time.monotonic()
+    worker._run_loop()
+
+    assert len(ticks) == 2
+    assert time.monotonic() - started < 5.0
+
+
+def test_position_sync_reconciles_strategies_concurrently(monkeypatch):
+    rows = [{"id": sid, "strategy_id": sid} for sid in (1, 2, 3)]
+    _patch_db(monkeypatch, rows)
+    monkeypatch.setattr(pow_module, "should_skip_position_sync", lambda sid: False)
+    worker = PendingOrderWorker()
+    seen = []
+
+    def slow_reconcile(sid, target_strategy_id=None):
+        time.sleep(0.3)
+        seen.append(sid)
+        return True
+
+    monkeypatch.setattr(worker, "_reconcile_strategy_positions", slow_reconcile)
+    started = time.monotonic()
+    worker._sync_positions_best_effort()
+
+    assert sorted(seen) == [1, 2, 3]
+    assert time.monotonic() - started < 0.8
+
+
+def test_loads_json_dict_handles_nan_and_malformed_json():
+    assert pow_module._loads_json_dict('{"symbol": "BTC/USDT", "price": 1.5}') == {"symbol": "BTC/USDT", "price": 1.5}
+    nan_payload = pow_module._loads_json_dict('{"ref_price": NaN}')
+    assert nan_payload["ref_price"] != nan_payload["ref_price"]
+    assert pow_module._loads_json_dict("not json") == {}
+    assert pow_module._loads_json_dict("[1, 2]") == {}
+    assert pow_module._loads_json_dict(None) == {}
+
+
+def test_dumps_json_is_compact_utf8_and_tolerates_int_keys():
+    assert pow_module._dumps_json({"msg": "成交", 1: [1.5]}) in ('{"msg":"成交","1":[1.5]}', '{"msg": "成交", "1": [1.5]}')
+    assert pow_module._dumps_json({}) == "{}"
+
+
+def test_alpaca_stale_sync_requeue_is_throttled(monkeypatch):
+    log, _ = _patch_db(monkeypatch, [])
+    worker = PendingOrderWorker()
+    worker._stale_requeue_interval_sec = 60.0
+
+    worker._fetch_alpaca_sent_orders()
+    worker._fetch_alpaca_sent_orders()
+
+    requeues = [sql for sql in log if "requeued_stale_sync" in sql]
+    assert len(requeues) == 1
+
+
+def test_tick_dispatches_strategies_in_parallel_but_each_in_order(monkeypatch):
+    worker = PendingOrderWorker()
+    orders = [
+        {"id": 1, "strategy_id": 10},
+        {"id": 2, "strategy_id": 20},
+        {"id": 3, "strategy_id": 10},
+        {"id": 4, "strategy_id": 30},
+    ]
+    monkeypatch.setattr(worker, "_sync_alpaca_sent_orders", lambda: None)
+    monkeypatch.setattr(worker, "_maybe_sync_positions", lambda: None)
+    monkeypatch.setattr(worker, "_claim_pending_orders", lambda limit: list(orders))
+    monkeypatch.setattr(worker, "_prefetch_strategy_meta", lambda orders: {})
+    monkeypatch.setattr(worker, "_begin_dispatch", lambda order_id: True)
+    seen = []
+
+    def slow_dispatch(order, **kwargs):
+        time.sleep(0.3)
+        seen.append(order["id"])
+
+    monkeypatch.setattr(worker, "_dispatch_one", slow_dispatch)
+    started = time.monotonic()
+    worker._tick()
+
+    assert sorted(seen) == [1, 2, 3, 4]
+    assert seen.index(1) < seen.index(3)
+    assert time.monotonic() - started < 0.9
+
+
+def test_signal_dispatch_uses_prefetched_strategy_meta(monkeypatch):
+    rows = [{"id": 5, "strategy_name": "Grid A", "notification_config": '{"channels": ["browser"]}'}]
+    log, _ = _patch_db(monkeypatch, rows)
+    worker = PendingOrderWorker()
+    orders = [
+        {"id": 1, "strategy_id": 5, "payload_json": '{"signal_type": "open_long", "symbol": "BTC/USDT"}'},
+        {"id": 2, "strategy_id": 5, "payload_json": ""},
+    ]
+    meta = worker._prefetch_strategy_meta(orders)
+    assert sum("ANY(%s)" in sql for sql in log) == 1
+
+    monkeypatch.setattr(worker, "_strategy_cfg", lambda sid: ({"execution_mode": "signal"}, {}))
+    monkeypatch.setattr(worker, "_load_strategy_name", lambda sid: pytest.fail("per-order name query"))
+    monkeypatch.setattr(worker, "_load_notification_config", lambda sid: pytest.fail("per-order config query"))
+    monkeypatch.setattr(worker, "_mark_sent", lambda **kw: None)
+    monkeypatch.setattr(pow_module, "append_strategy_log", lambda *a, **kw: None)
+    calls = []
+
+    def fake_notify(**kw):
+        calls.append(kw)
+        return {"browser": {"ok": True}}
+
+    monkeypatch.setattr(worker._notifier, "notify_signal", fake_notify)
+    worker._dispatch_one(orders[0], strategy_meta=meta)
+
+    assert calls[0]["strategy_name"] == "Grid A"
+    assert calls[0]["notification_config"] == {"channels": ["browser"]}
+
+
+def test_signal_orders_of_one_strategy_share_one_telegram_message(monkeypatch):
+    worker = PendingOrderWorker()
+    cfg = '{"channels": ["telegram"], "targets": {"telegram": "42", "telegram_bot_token": "t"}}'
+    orders = [
+        {"id": i, "strategy_id": 5, "payload_json": f'{{"signal_type": "open_long", "symbol": "BTC/USDT", "strategy_name": "S", "notification_config": {cfg}}}'}
+        for i in (1, 2, 3)
+    ]
+    monkeypatch.setattr(worker, "_strategy_cfg", lambda sid: ({"execution_mode": "signal"}, {}))
+    monkeypatch.setattr(pow_module, "append_strategy_log", lambda *a, **kw: None)
+    monkeypatch.setattr("app.services.signal_notifier._load_user_timezone_for_strategy", lambda sid: "")
+    monkeypatch.setattr(worker, "_begin_dispatch", lambda order_id: True)
+    sent, marked = [], []
+    monkeypatch.setattr(worker, "_mark_sent", lambda **kw: marked.append(kw["order_id"]))
+    monkeypatch.setattr(
+        worker._notifier, "_notify_telegram", lambda **kw: sent.append(kw["text"]) or (True, "")
+    )
+
+    worker._dispatch_group(orders)
+
+    assert len(sent) == 1 and sent[0].count("BTC/USDT") >= 3
+    assert marked == [1, 2, 3]
+
+
+def test_join_telegram_messages_splits_below_the_limit():
+    from app.services.signal_notifier import _TELEGRAM_TEXT_LIMIT, _join_telegram_messages
+
+    msg = "x" * 1500
+    chunks = _join_telegram_messages([msg, msg, msg, "", msg])
+    assert [len(c) for c, _ in chunks] == [1500 * 2 + 2, 1500 * 2 + 2]
+    assert [members for _, members in chunks] == [[0, 1], [2, 4]]
+    assert all(len(c) <= _TELEGRAM_TEXT_LIMIT for c, _ in chunks)
+
+
+def test_telegram_batch_reports_each_signal_by_its_own_chunk(monkeypatch):
+    from app.services import signal_notifier
+
+    monkeypatch.setattr(signal_notifier, "_TELEGRAM_TEXT_LIMIT", 1)
+    monkeypatch.setattr(signal_notifier, "_load_user_timezone_for_strategy", lambda sid: "")
+    notifier = signal_notifier.SignalNotifier()
+    outcomes = iter([(True, ""), (False, "429")])
+    monkeypatch.setattr(notifier, "_notify_telegram", lambda **kw: next(outcomes))
+    cfg = {"channels": ["telegram"], "targets": {"telegram": "42", "telegram_bot_token": "t"}}
+    items = [
+        dict(strategy_id=5, strategy_name="S", symbol=sym, signal_type="open_long", notification_config=cfg)
+        for sym in ("BTC/USDT", "ETH/USDT")
+    ]
+
+    results = notifier.notify_signal_batch(items)
+
+    assert [r["telegram"] for r in results] == [{"ok": True, "error": ""}, {"ok": False, "error": "429"}]
+
+
+def test_order_mode_defaults_are_parsed_once_until_settings_reload(monkeypatch):
+    monkeypatch.setenv("ORDER_MODE", " Maker ")
+    monkeypatch.setenv("MAKER_WAIT_SEC", "7")
+    pow_module.clear_runtime_env_cache()
+    assert pow_module._order_mode_defaults() == ("maker", 7.0, 2.0)
+
+    monkeypatch.setenv("MAKER_WAIT_SEC", "3")
+    assert pow_module._order_mode_defaults()[1] == 7.0
+    pow_module.clear_runtime_env_cache()
+    assert pow_module._order_mode_defaults()[1] == 3.0
+    pow_module.clear_runtime_env_cache()
+
+
+def test_each_strategy_is_released_when_its_own_group_finishes(monkeypatch):
+    worker = PendingOrderWorker()
+    worker._inflight_strategies = {10: 1, 20: 1}
+    monkeypatch.setattr(worker, "_prefetch_strategy_meta", lambda orders: {})
+    released_while_slow = []
+
+    def dispatch(orders, strategy_meta=None):
+        if orders[0]["strategy_id"] == 20:
+            time.sleep(0.3)
+            released_while_slow.append(10 not in worker._inflight_strategies)
+
+    monkeypatch.setattr(worker, "_dispatch_group", dispatch)
+    worker._dispatch_claimed([{"id": 1, "strategy_id": 10}, {"id": 2, "strategy_id": 20}])
+
+    assert released_while_slow == [True]
+    assert worker._inflight_strategies == {}
+
+
+def test_long_only_broker_rejects_unplaceable_signal_before_connecting(monkeypatch):
+    worker = PendingOrderWorker()
+    ctx = SimpleNamespace(
+        strategy_id=5, signal_type="open_short", symbol="AAPL", amount=1.0, cfg={}, exchange_config={},
+        exchange_id="ibkr", market_category="USStock", market_type="spot", ref_price=0.0,
+    )
+    monkeypatch.setattr(pow_module, "build_live_order_context", lambda **kw: ctx)
+    monkeypatch.setattr(pow_module, "create_client", lambda *a, **kw: pytest.fail("opened a broker session"))
+    monkeypatch.setattr(pow_module.LiveOrderNotifier, "notify", lambda self, **kw: None)
+    failed = []
+    monkeypatch.setattr(worker, "_mark_failed", lambda **kw: failed.append(kw["error"]))
+
+    worker._execute_live_order(order_id=9, order_row={}, payload={})
+    ctx.exchange_id, ctx.signal_type = "alpaca", "open_grid"
+    worker._execute_live_order(order_id=10, order_row={}, payload={})
+
+    assert failed == ["ibkr_stock_short_not_supported", "alpaca_unsupported_signal:open_grid"]
+
+
+def test_instrument_lock_is_shared_per_exchange_and_symbol():
+    worker = PendingOrderWorker()
+    lock = worker._instrument_lock("okx", "BTC/USDT")
+
+    assert worker._instrument_lock("okx", "BTC/USDT") is lock
+    assert worker._instrument_lock("okx", "ETH/USDT") is not lock
+    assert worker._instrument_lock("binance", "BTC/USDT") is not lock
+
+
+def test_rows_requeued_before_their_dispatch_starts_are_skipped(monkeypatch):
+    log, _ = _patch_db(monkeypatch, [])
+    worker = PendingOrderWorker()
+    counts = iter([1, 0])
+    monkeypatch.setattr(_FakeCursor, "rowcount", property(lambda self: next(counts)), raising=False)
+    dispatched = []
+    monkeypatch.setattr(worker, "_dispatch_one", lambda o, **kw: dispatched.append(o["id"]))
+
+    worker._dispatch_group([{"id": 1, "strategy_id": 5}, {"id": 2, "strategy_id": 5}])
+
+    assert dispatched == [1]
+    assert sum("AND status = 'processing'" in str(sql) for sql in log) == 2
+
+
+def test_status_writes_carry_the_dispatching_claims_attempts(monkeypatch):
+    log, _ = _patch_db(monkeypatch, [])
+    worker = PendingOrderWorker()
+    monkeypatch.setattr(_FakeCursor, "rowcount", 1, raising=False)
+    monkeypatch.setattr(
+        worker, "_dispatch_one", lambda o, **kw: worker._mark_failed(order_id=o["id"], error="x")
+    )
+
+    worker._dispatch_group([{"id": 1, "strategy_id": 5, "attempts": 3}])
+
+    guarded = [sql for sql in log if isinstance(sql, str) and "attempts = $" in sql]
+    assert len(guarded) == 3
+    assert log[0] == (1, 3)
+    assert log[2] == ("x", 1, 3)
+    assert worker._claim_token(1) is None
+
+
+@pytest.mark.parametrize("leased", [True, False])
+def test_position_sync_runs_only_under_the_lease(monkeypatch, leased):
+    worker = PendingOrderWorker()
+    worker._position_sync_enabled = True
+    worker._position_sync_interval_sec = 60
+    calls = []
+    monkeypatch.setattr(worker, "_acquire_position_sync_lease", lambda: calls.append("acquire") or leased)
+    monkeypatch.setattr(worker, "_sync_positions_best_effort", lambda: calls.append("sync"))
+    monkeypatch.setattr(worker, "_release_position_sync_lease", lambda: calls.append("release"))
+
+    worker._maybe_sync_positions()
+    worker.stop(timeout_sec=0.1)
+
+    # The owner keeps (and renews) the lease across syncs and only releases it on stop.
+    assert calls == (["acquire", "sync", "acquire", "release"] if leased else ["acquire"])
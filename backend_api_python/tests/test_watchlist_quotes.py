@@ -0,0 +1,28 @@
+"""Watchlist quotes: batched CN/HK prefetch deadline and Tencent quote line parsing."""
+
+import time
+
+from app.services.market import quotes
+
+
+def test_slow_batch_prefetch_does_not_extend_the_deadline(monkeypatch):
+    def slow_prefetch(pairs):
+        time.sleep(0.5)
+        return {}
+
+    monkeypatch.setattr(quotes, "_prefetch_cn_hk_prices", slow_prefetch)
+    monkeypatch.setattr(quotes, "get_single_price", lambda market, symbol: time.sleep(0.5))
+    monkeypatch.setattr(quotes, "_cached_or_empty", lambda market, symbol, error: {"symbol": symbol, "error": error})
+
+    started = time.monotonic()
+    rows = quotes.get_price_map([{"market": "CNStock", "symbol": "600519"}], timeout_sec=0.2)
+
+    assert time.monotonic() - started < 0.4
+    assert rows == [{"symbol": "600519", "error": "timeout"}]
+
+
+def test_tencent_quote_lines_accept_punctuated_codes():
+    from app.data_sources.tencent import _QUOTE_LINE_RE
+
+    text = 'v_usBRK.B="200~A~B~1~2~3";\nv_sh600519="1~NAME~600519~1.0~2.0~3.0";\n'
+    assert [m.group(1) for m in _QUOTE_LINE_RE.finditer(text)] == ["usBRK.B", "sh600519"]
@@ -89,3 +89,45 @@ def test_add_watchlist_persists_only_after_exact_symbol_match(monkeypatch):
     assert conn.cursor_obj.executed
     _, params = conn.cursor_obj.executed[0]
     assert params == (1, "USStock", "AAPL", "Apple Inc.")
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl=300):
+        self.data[key] = value
+
+
+def test_hk_akshare_listing_is_fetched_once_and_indexed(monkeypatch):
+    import sys
+    import types
+
+    import pandas as pd
+
+    calls = {"count": 0}
+
+    def _spot():
+        calls["count"] += 1
+        return pd.DataFrame({"代码": ["00700", "00388", "09988"], "名称": ["腾讯控股", "香港交易所", "阿里巴巴-W"]})
+
+    monkeypatch.setitem(sys.modules, "akshare", types.SimpleNamespace(stock_hk_spot_em=_spot))
+    monkeypatch.setattr(symbol_search, "_akshare_listing_cache", {})
+    monkeypatch.setattr(symbol_search, "_market_cache", _DictCache())
+    monkeypatch.setattr(symbol_search, "persist_seed_name", lambda *args: None)
+
+    assert symbol_search._search_hk_akshare("700.HK", 5)[0] == {
+        "market": "HKStock",
+        "symbol": "00700",
+        "name": "腾讯控股",
+    }
+    assert [r["symbol"] for r in symbol_search._search_hk_akshare("阿里", 5)] == ["09988"]
+    assert calls["count"] == 1
+
+    # Another worker (empty in-process cache) reuses the shared listing.
+    monkeypatch.setattr(symbol_search, "_akshare_listing_cache", {})
+    assert symbol_search._search_hk_akshare("00388", 5)[0]["name"] == "香港交易所"
+    assert calls["count"] == 1